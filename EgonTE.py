@@ -6,19 +6,16 @@ import sys
 import time
 import urllib.error
 import urllib.request
-from collections import Counter
 from ctypes import byref, c_int, sizeof, windll  # Windows-only usage is guarded below
 from datetime import datetime, timedelta
-from heapq import nlargest
 from io import BytesIO
 from itertools import islice
 from json import dump, load, loads
 from pathlib import Path
 from platform import system as platform_system
 from random import choice, randint, shuffle
-from re import findall, sub, compile, IGNORECASE, escape
+from re import findall, compile, IGNORECASE, escape
 from re import search as reSearch
-from re import split as reSplit
 from shutil import which as shutil_which
 from socket import gethostname
 from string import (
@@ -53,7 +50,10 @@ from dependencies.large_variables import *
 from dependencies.universal_functions import *
 from dependencies.version_guard import ensure_supported_python
 
+from dependencies.lazy_imports import lazy_import, lazy_from, on_import, module_available
+from dependencies.startup_profiler import StartupProfiler
 from services.config_service import ConfigService
+from services.record_log_service import RecordLogService, default_spill_directory
 
 def library_installer(parent=None):
 	'''
@@ -97,138 +97,133 @@ def library_installer(parent=None):
 	return {'installed': 0, 'failed': 0, 'attempted': 0, 'cancelled': True, 'packages': []}
 
 # required libraries that aren't by default
-req_lib = False
-try:
-	# Minimal probe first: do not import all heavy third-party modules here.
-	import importlib
-	# If all required present, import the actual heavy modules now
-	import pytesseract.pytesseract
-	from win32print import GetDefaultPrinter  # install pywin32
-	from win32api import ShellExecute, GetShortPathName
-	from pyttsx3 import init as ttsx_init
-	import pyaudio  # imported to make speech_recognition work
-	from speech_recognition import Recognizer, Microphone, AudioFile, WaitTimeoutError # install SpeechRecognition
-	import webbrowser
-	import urllib.request, urllib.error
-	from urllib.parse import urlparse
-	import matplotlib
-	import requests
-	from smtplib import SMTP_SSL
-	matplotlib.use('TkAgg')
-	from matplotlib.figure import Figure
-	from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
-	import pandas
-	from pyperclip import copy
-	import emoji
-	from wikipedia import summary, exceptions, page
-	from wikipedia import search as wiki_search
-	from difflib import Differ, SequenceMatcher
-	from textblob import TextBlob
-	from PyPDF2 import PdfReader
-	from bs4 import BeautifulSoup
-	from spacy.matcher import Matcher
-	from PIL import ImageGrab, Image, ImageTk, UnidentifiedImageError
-	import spacy  # download also en_core_web_sm - https://spacy.io/usage
-	from pydub import AudioSegment
-	from keyboard import is_pressed
-
-	global translate_root, sort_root
-	from spacy.cli import download as nlp_download
-	from nltk.corpus import words
-	from PyDictionary import PyDictionary
-	import numexpr
-	from fast_autocomplete import AutoComplete
-
-	req_lib = True
-
-except (ModuleNotFoundError, ImportError) as e:
-    library_installer()
-
-# Local applications
-from pop_ups.ai_popups import open_chatgpt, open_dalle
-from pop_ups.calc_popup import open_calculator
-from pop_ups.email_popup import open_email
-from pop_ups.encryption_popup import open_encryption
-from pop_ups.file_template_generator_popup import open_document_template_generator
-from pop_ups.find_replace_popup import open_find_replace
-from pop_ups.git_tool_popup import open_git_tool
-from pop_ups.handwriting_popup import open_handwriting
-from pop_ups.nlp_popup import open_nlp
-from pop_ups.randomness_app import open_random
-from pop_ups.web_scrapping_popup import open_web_scrapping_popup
-from pop_ups.text_decorators_app import open_text_decorators
-from pop_ups.translate_app import open_translate
-from pop_ups.transcript_app import open_transcript
-
-from pop_ups.weather_app import open_weather
-from pop_ups.clipboard_app import open_clipboard_history
-from pop_ups.knowledge_popup import open_knowledge_popup
-
-from pop_ups.sort_popup import open_sort
-from pop_ups.virtual_keyboard_popup import open_virtual_keyboard
-from pop_ups.web_assistant_popup import open_web_tools
-
-from pop_ups.info_page_popup import open_info
-from pop_ups.search_functions_popup import open_search_functions
-from pop_ups.record_logs_popup import open_record_logs
-
-from pop_ups.symbols_popup import open_symbols_translator_popup
+# Heavy third-party modules are bound to lazy proxies (dependencies/lazy_imports.py) and imported on
+# first use; startup only probes that they are installed, without importing them.
+REQUIRED_MODULES = (
+	'pytesseract', 'win32print', 'win32api', 'pyttsx3', 'pyaudio', 'speech_recognition', 'matplotlib',
+	'requests', 'pandas', 'pyperclip', 'emoji', 'wikipedia', 'textblob', 'PyPDF2', 'bs4', 'spacy', 'PIL',
+	'pydub', 'keyboard', 'nltk', 'PyDictionary', 'numexpr', 'fast_autocomplete',
+)
+req_lib = all(module_available(module_name) for module_name in REQUIRED_MODULES)
+if not req_lib:
+	library_installer()
+
+import webbrowser
+import urllib.request, urllib.error
+from urllib.parse import urlparse
+from smtplib import SMTP_SSL
+from difflib import Differ
+
+pytesseract = lazy_import('pytesseract')
+GetDefaultPrinter = lazy_from('win32print', 'GetDefaultPrinter')  # install pywin32
+ShellExecute = lazy_from('win32api', 'ShellExecute')
+GetShortPathName = lazy_from('win32api', 'GetShortPathName')
+ttsx_init = lazy_from('pyttsx3', 'init')
+speech_recognition = lazy_import('speech_recognition')  # install SpeechRecognition (uses pyaudio)
+Recognizer = lazy_from('speech_recognition', 'Recognizer')
+Microphone = lazy_from('speech_recognition', 'Microphone')
+AudioFile = lazy_from('speech_recognition', 'AudioFile')
+matplotlib = lazy_import('matplotlib')
+on_import('matplotlib', lambda module: module.use('TkAgg'))
+Figure = lazy_from('matplotlib.figure', 'Figure')
+FigureCanvasTkAgg = lazy_from('matplotlib.backends.backend_tkagg', 'FigureCanvasTkAgg')
+NavigationToolbar2Tk = lazy_from('matplotlib.backends.backend_tkagg', 'NavigationToolbar2Tk')
+requests = lazy_import('requests')
+pandas = lazy_import('pandas')
+copy = lazy_from('pyperclip', 'copy')
+emoji = lazy_import('emoji')
+summary = lazy_from('wikipedia', 'summary')
+page = lazy_from('wikipedia', 'page')
+wiki_search = lazy_from('wikipedia', 'search')
+exceptions = lazy_import('wikipedia.exceptions')
+TextBlob = lazy_from('textblob', 'TextBlob')
+PdfReader = lazy_from('PyPDF2', 'PdfReader')
+BeautifulSoup = lazy_from('bs4', 'BeautifulSoup')
+Matcher = lazy_from('spacy.matcher', 'Matcher')
+ImageGrab = lazy_import('PIL.ImageGrab')
+Image = lazy_import('PIL.Image')
+ImageTk = lazy_import('PIL.ImageTk')
+spacy = lazy_import('spacy')  # download also en_core_web_sm - https://spacy.io/usage
+AudioSegment = lazy_from('pydub', 'AudioSegment')
+is_pressed = lazy_from('keyboard', 'is_pressed')
+nlp_download = lazy_from('spacy.cli', 'download')
+words = lazy_from('nltk.corpus', 'words')
+PyDictionary = lazy_from('PyDictionary', 'PyDictionary')
+numexpr = lazy_import('numexpr')
+AutoComplete = lazy_from('fast_autocomplete', 'AutoComplete')
+
+# Local applications (each pop-up module is imported when it is first opened)
+open_chatgpt = lazy_from('pop_ups.ai_popups', 'open_chatgpt')
+open_dalle = lazy_from('pop_ups.ai_popups', 'open_dalle')
+open_calculator = lazy_from('pop_ups.calc_popup', 'open_calculator')
+open_email = lazy_from('pop_ups.email_popup', 'open_email')
+open_encryption = lazy_from('pop_ups.encryption_popup', 'open_encryption')
+open_document_template_generator = lazy_from('pop_ups.file_template_generator_popup', 'open_document_template_generator')
+open_find_replace = lazy_from('pop_ups.find_replace_popup', 'open_find_replace')
+open_git_tool = lazy_from('pop_ups.git_tool_popup', 'open_git_tool')
+open_handwriting = lazy_from('pop_ups.handwriting_popup', 'open_handwriting')
+open_nlp = lazy_from('pop_ups.nlp_popup', 'open_nlp')
+open_random = lazy_from('pop_ups.randomness_app', 'open_random')
+open_web_scrapping_popup = lazy_from('pop_ups.web_scrapping_popup', 'open_web_scrapping_popup')
+open_text_decorators = lazy_from('pop_ups.text_decorators_app', 'open_text_decorators')
+open_translate = lazy_from('pop_ups.translate_app', 'open_translate')
+open_transcript = lazy_from('pop_ups.transcript_app', 'open_transcript')
+
+open_weather = lazy_from('pop_ups.weather_app', 'open_weather')
+open_clipboard_history = lazy_from('pop_ups.clipboard_app', 'open_clipboard_history')
+open_knowledge_popup = lazy_from('pop_ups.knowledge_popup', 'open_knowledge_popup')
+
+open_sort = lazy_from('pop_ups.sort_popup', 'open_sort')
+open_virtual_keyboard = lazy_from('pop_ups.virtual_keyboard_popup', 'open_virtual_keyboard')
+open_web_tools = lazy_from('pop_ups.web_assistant_popup', 'open_web_tools')
+
+open_info = lazy_from('pop_ups.info_page_popup', 'open_info')
+open_search_functions = lazy_from('pop_ups.search_functions_popup', 'open_search_functions')
+open_record_logs = lazy_from('pop_ups.record_logs_popup', 'open_record_logs')
+
+open_symbols_translator_popup = lazy_from('pop_ups.symbols_popup', 'open_symbols_translator_popup')
 
 '''the optional libraries that can add a lot of extra content to the editor'''
-tes = ACTIVE
-try:
-	from pytesseract import image_to_string  # download https://github.com/UB-Mannheim/tesseract/wiki
-except:
-	tes = DISABLED
-try:
-	from emoticon import emoticon, demoticon
+# probed without importing; the names are lazy proxies like the required ones, so a module that is
+# installed but fails to import only shows up where it is used (those call sites catch it)
+tes = ACTIVE if module_available('pytesseract') else DISABLED
+image_to_string = lazy_from('pytesseract', 'image_to_string')  # download https://github.com/UB-Mannheim/tesseract/wiki
 
-	emoticons_library = ACTIVE
-except (ImportError, AttributeError, ModuleNotFoundError) as e:
-	emoticons_library = DISABLED
+emoticons_library = ACTIVE if module_available('emoticon') else DISABLED
+emoticon = lazy_from('emoticon', 'emoticon')
+demoticon = lazy_from('emoticon', 'demoticon')
 
-try:
-	from polyglot.text import Text as poly_text
-
-	RA = True
-except (ImportError, ModuleNotFoundError) as e:
-	RA = False
+RA = module_available('polyglot')
+poly_text = lazy_from('polyglot.text', 'Text')
 
-try:
-	from googletrans import Translator  # req version 3.1.0a0
-
-	google_trans = True
+google_trans = True if module_available('googletrans') else ''  # req version 3.1.0a0
+if google_trans:
 	deep_trans = ''
-except (ImportError, AttributeError, ModuleNotFoundError) as e:
-	google_trans = ''
-
-try:
-	from pyshorteners import Shortener
+Translator = lazy_from('googletrans', 'Translator')
 
-	short_links = True
-except (ImportError, AttributeError, ModuleNotFoundError) as e:
-	short_links = False
+short_links = module_available('pyshorteners')
+Shortener = lazy_from('pyshorteners', 'Shortener')
 
 
 
-try:
-	from tkhtmlview import HTMLText, RenderHTML
-	html_infop = 'html'
-except:
-	html_infop = 'txt'
+html_infop = 'html' if module_available('tkhtmlview') else 'txt'
+HTMLText = lazy_from('tkhtmlview', 'HTMLText')
+RenderHTML = lazy_from('tkhtmlview', 'RenderHTML')
 
-try:
-	from docx.shared import Mm
-	from docxtpl import DocxTemplate, InlineImage
-except:
-	pass
+Mm = lazy_from('docx.shared', 'Mm')
+DocxTemplate = lazy_from('docxtpl', 'DocxTemplate')
+InlineImage = lazy_from('docxtpl', 'InlineImage')
 
 # window creation
 class Window(Tk):
 	def __init__(self):
 		global frame
 
+		# per-phase startup timings, written to the record log once it exists
+		startup_profiler = StartupProfiler()
 		super().__init__()
+		self.startup_profiler = startup_profiler
+		startup_profiler.lap('tk root')
 
 		'''
 		variables of the program that have connection to the a saving file of their values
@@ -381,6 +376,7 @@ class Window(Tk):
 		self.menu_pop = BooleanVar()
 		self.content_preference_v = StringVar()
 		self.content_preference_v.set('html')
+		self.startup_profiler.lap('variables')
 		# opening the saved settings early can make us create some widgets with the settings initially
 		self.config_service = ConfigService()
 		self.default_needed = self.config_service.load_settings()
@@ -433,6 +429,7 @@ class Window(Tk):
 		self.last_cursor = 'cursors', self.custom_cursor_v.get()
 		self.last_style = 'styles', self.cs.get()
 		self.last_r = 'relief', self.predefined_relief
+		self.startup_profiler.lap('settings load')
 
 		# default resolution & placement of the window
 		self.width = 1250
@@ -450,6 +447,7 @@ class Window(Tk):
 		self.title(f'Egon Text editor - {self.ver}')
 		# function thats loads all the toolbar images
 		self.load_images()
+		self.startup_profiler.lap('load_images')
 		# connecting the prees of the exit button the a custom exit function
 		self.protocol('WM_DELETE_WINDOW', self.exit_app)
 		# threads for a stopwatch function that works on advance option window and a function that loads images from the web
@@ -461,6 +459,7 @@ class Window(Tk):
 		self.style_combobox = ttk.Style(self)
 
 		self.init_ocr_async()
+		self.startup_profiler.lap('stopwatch, styles and ocr setup')
 
 		# create toll tip, for the toolbar buttons (with shortcuts)
 		# TOOL_TIP = Balloon(self)
@@ -475,7 +474,10 @@ class Window(Tk):
 		self.toolbar_frame = Frame(frame)
 		self.toolbar_frame.pack(fill=X, anchor=W, side=TOP)
 		self.ex_tool = 'arial 9 bold'
-		self.record_list = [f'> [{get_time()}] - Program opened']
+		# bounded: older records are spilled to a per-user temp directory (removed on exit) and then dropped
+		self.record_list = RecordLogService(spill_directory=default_spill_directory())
+		Thread(target=self.record_list.remove_stale_sessions, daemon=True).start()
+		self.record_list.append(f'> [{get_time()}] - Program opened')
 
 		# font UI (combo box) and it's values
 		font_tuple = font.families()
@@ -490,12 +492,14 @@ class Window(Tk):
 									  style='TCombobox', values=tuple(reversed(range(8, 80, 2))))
 		self.font_Size_c = 31
 		self.font_size.current(self.font_Size_c)  # 16 is at index 31
+		self.startup_profiler.lap('font widgets')
 
 		self._popup = ui_builders.UIBuilders(self)
 		self.make_pop_ups_window = self._popup.make_pop_ups_window
 
 		# build main text box and its vertical scrollbar (legacy or rich path)
 		self.build_main_textbox(parent_container=frame)
+		self.startup_profiler.lap('main textbox')
 		# create main menu's component
 		self.app_menu = Menu(frame)
 		self.config(menu=self.app_menu)
@@ -509,6 +513,7 @@ class Window(Tk):
 		self.load_function_links()
 		self.menu_assests()
 		self.create_menus(initial=True)
+		self.startup_profiler.lap('text style service and menus')
 
 		# add status bar
 		self.status_frame = Frame(frame, height=20)
@@ -527,6 +532,7 @@ class Window(Tk):
 				if os.path.exists(self.data['open_last_file']):
 					self.open_file(event='initial')
 					insert_lf = True
+		self.startup_profiler.lap('status bar and last file')
 
 		'''+
 		add to function
@@ -572,6 +578,7 @@ class Window(Tk):
 		self.ui_builders = ui_builders.UIBuilders(self)
 		# Enable tooltips (native or external)
 		self.ui_builders.place_toolt()
+		self.startup_profiler.lap('toolbar buttons and tooltips')
 
 		# ui tuples (and list) to make management of some UI events (like night mode) easier
 		self.menus_components = [self.file_menu, self.edit_menu, self.tool_menu, self.color_menu, self.options_menu, \
@@ -594,8 +601,11 @@ class Window(Tk):
 								  'menus': [self.menus_components, 'bg-fg'],
 								  'buttons': [self.toolbar_components, 'bg'], 'highlight': [self.EgonTE, 'selectbackground']}
 
+		self.startup_profiler.lap('theme')
 		self.opening_msg(insert_lf)
+		self.startup_profiler.lap('opening message')
 		self.call_init_steps()
+		self.startup_profiler.flush_to(self.record_list, get_time)
 
 	def _ensure_file_service(self):
 		'''
@@ -608,6 +618,73 @@ class Window(Tk):
 			except Exception:
 				self.file_service = None
 
+	def _ensure_special_import_service(self):
+		'''
+		Lazy-initialize the SpecialImportService (chunked, cancellable imports of pdf/csv/xlsx/json/xml).
+		'''
+		if not hasattr(self, 'special_import_service') or self.special_import_service is None:
+			try:
+				from services.special_import_service import SpecialImportService
+				self.special_import_service = SpecialImportService(self)
+			except Exception:
+				self.special_import_service = None
+
+	def _ensure_recent_files_service(self):
+		'''
+		Lazy-initialize the RecentFilesService (encoding, view position and line index of recently opened files).
+		'''
+		if not hasattr(self, 'recent_files_service') or self.recent_files_service is None:
+			try:
+				from services.recent_files_service import RecentFilesService
+				self.recent_files_service = RecentFilesService(self)
+			except Exception:
+				self.recent_files_service = None
+
+	def _ensure_edit_journal_service(self):
+		'''
+		Lazy-initialize the EditJournalService (write-ahead journal of edits for crash recovery).
+		'''
+		if not hasattr(self, 'edit_journal_service') or self.edit_journal_service is None:
+			try:
+				from services.edit_journal_service import EditJournalService
+				self.edit_journal_service = EditJournalService(self)
+				self.edit_journal_service.attach()
+			except Exception:
+				self.edit_journal_service = None
+
+	def _ensure_file_writer_service(self):
+		'''
+		Lazy-initialize the FileWriterService (atomic saves on a writer thread).
+		'''
+		if not hasattr(self, 'file_writer_service') or self.file_writer_service is None:
+			try:
+				from services.file_writer_service import FileWriterService
+				self.file_writer_service = FileWriterService(self)
+			except Exception:
+				self.file_writer_service = None
+
+	def _ensure_dirty_state_service(self):
+		'''
+		Lazy-initialize the DirtyStateService (unsaved-changes tracking for open/new/exit).
+		'''
+		if not hasattr(self, 'dirty_state_service') or self.dirty_state_service is None:
+			try:
+				from services.dirty_state_service import DirtyStateService
+				self.dirty_state_service = DirtyStateService(self)
+			except Exception:
+				self.dirty_state_service = None
+
+	def _ensure_mapped_file_service(self):
+		'''
+		Lazy-initialize the MappedFileService (read-only view of very large files).
+		'''
+		if not hasattr(self, 'mapped_file_service') or self.mapped_file_service is None:
+			try:
+				from services.mapped_file_service import MappedFileService
+				self.mapped_file_service = MappedFileService(self)
+			except Exception:
+				self.mapped_file_service = None
+
 	def _ensure_search_service(self):
 		'''
 		Lazy-initialize the SearchService to avoid import order issues.
@@ -619,6 +696,39 @@ class Window(Tk):
 			except Exception:
 				self.search_service = None
 
+	def _ensure_edit_tracking_service(self):
+		'''
+		Lazy-initialize the EditTrackingService (insert/delete change feed of the main text box).
+		'''
+		if not hasattr(self, 'edit_tracking_service') or self.edit_tracking_service is None:
+			try:
+				from services.edit_tracking_service import EditTrackingService
+				self.edit_tracking_service = EditTrackingService(self)
+			except Exception:
+				self.edit_tracking_service = None
+
+	def _ensure_stats_service(self):
+		'''
+		Lazy-initialize the StatsService (incremental status bar counters).
+		'''
+		if not hasattr(self, 'stats_service') or self.stats_service is None:
+			try:
+				from services.stats_service import StatsService
+				self.stats_service = StatsService(self)
+			except Exception:
+				self.stats_service = None
+
+	def _ensure_token_index_service(self):
+		'''
+		Lazy-initialize the TokenIndexService (shared document word-frequency index).
+		'''
+		if not hasattr(self, 'token_index_service') or self.token_index_service is None:
+			try:
+				from services.token_index_service import TokenIndexService
+				self.token_index_service = TokenIndexService(self)
+			except Exception:
+				self.token_index_service = None
+
 	def _ensure_theme_service(self):
 		'''
 		Lazy-initialize the ThemeService to avoid import order issues.
@@ -832,8 +942,21 @@ class Window(Tk):
 		Keep only methods that are safe to run at this point.
 		'''
 		self.place_toolt()
+		self.startup_profiler.lap('call_init_steps: tooltips')
 		self.binds(mode='initial')
+		self.startup_profiler.lap('call_init_steps: binds')
 		self.setup_auto_lists()
+		self.startup_profiler.lap('call_init_steps: auto lists')
+		# start tracking edits so the status bar counts stay incremental
+		self._ensure_stats_service()
+		if getattr(self, 'stats_service', None):
+			self.stats_service.attach()
+		self.startup_profiler.lap('call_init_steps: stats service')
+		# autosave is armed by its settings toggles only (apply_autosave_settings), as before
+		# crash recovery: journal edits, and offer the ones an untitled buffer lost last time
+		self._ensure_edit_journal_service()
+		if getattr(self, 'edit_journal_service', None) and not self.file_name:
+			self.edit_journal_service.offer_recovery(self.edit_journal_service.read(''), None)
 
 
 		if 'RA' in globals() and RA and hasattr(self, 'right_align_language_support'):
@@ -842,6 +965,7 @@ class Window(Tk):
 		if hasattr(self, 'check_ver_v') and self.check_ver_v.get():
 			# preserve idle scheduling
 			self.after_idle(self.check_version)
+		self.startup_profiler.lap('call_init_steps: language support and version check')
 
 
 	def load_images(self):
@@ -868,6 +992,10 @@ class Window(Tk):
 		'''
 		loads images from the web for some extra tools the program have to offer
 		'''
+		with self.startup_profiler.phase('load_links (background)'):
+			self.load_link_images()
+
+	def load_link_images(self):
 		gpt_url = 'https://external-content.duckduckgo.com/iu/?u=https%3A%2F%2Fwww.modify.in.th%2Fwp-content%2Fuploads%2FChatGPT-logo-326x245.gif&f=1&nofb=1&ipt=f0164b4a83aeec7a81f2081b87f90a9d99c04f3d822980e3290ce974fc33e4ae&ipo=images'
 		try:
 			with urllib.request.urlopen(gpt_url) as u:
@@ -899,7 +1027,7 @@ class Window(Tk):
 							   'screenshot content.': lambda: self.save_images(self.EgonTE, self, self.toolbar_frame,
 																			   'main')
 			, 'file\'s info': self.file_info, 'content stats!': self.content_stats, 'file\'s comparison': self.compare,
-							   'merge files.': self.merge_files,
+							   'merge files': self.merge_files, 'merge files to disk.': lambda: self.merge_files(to_disk=True),
 							   'print file|(ctrl+p).': self.print_file, 'copy file path|(ctrl+d).': self.copy_file_path,
 							   'import local file!': self.special_files_import,
 							   'import global file.': lambda: self.special_files_import('link'),
@@ -1666,17 +1794,28 @@ class Window(Tk):
 			return
 
 	def status(self, event=None):
-		''' get & display character and word count for the status bar '''
-		global lines, words
+		'''
+		get & display character and word count for the status bar
+		counts are maintained incrementally by the stats service; the full recount is only a fallback
+		'''
 		if self.EgonTE.edit_modified():
 			self.text_changed = True
-			words = len(self.EgonTE.get(1.0, 'end-1c').split())
-			characters = len(self.EgonTE.get(1.0, 'end-1c'))
-			lines = int((self.EgonTE.index(END)).split('.')[0]) - 1
-			self.status_var.set(f'Lines:{lines} Characters:{characters} Words:{words}')
-			self.status_bar.config(text=self.status_var.get())
+			self._ensure_stats_service()
+			if getattr(self, 'stats_service', None) and self.stats_service.attach():
+				self.stats_service.schedule_refresh()
+			else:
+				content = self.EgonTE.get(1.0, 'end-1c')
+				self.update_status_bar(int((self.EgonTE.index(END)).split('.')[0]) - 1, len(content),
+									   len(content.split()))
 		self.EgonTE.edit_modified(False)
 
+	def update_status_bar(self, lines_count: int, characters: int, words_count: int):
+		''' write the given counts to the status bar '''
+		global lines, words
+		lines, words = lines_count, words_count
+		self.status_var.set(f'Lines:{lines} Characters:{characters} Words:{words}')
+		self.status_bar.config(text=self.status_var.get())
+
 	def text_to_speech(self):
 		'''
 		AI narrator will read the selected text from the text box, and if you didnt mark some text it will read
@@ -1786,7 +1925,7 @@ class Window(Tk):
 				audio = r.listen(source, timeout=7, phrase_time_limit=20)
 			text = r.recognize_google(audio, language=getattr(self, 'stt_lang_value', 'en-US'))
 			self._stt_queue.put({'status': 'ok', 'text': text})
-		except WaitTimeoutError:
+		except speech_recognition.WaitTimeoutError:
 			self._stt_queue.put({'status': 'error', 'kind': 'timeout'})
 		except Exception as e:
 			self._stt_queue.put({'status': 'error', 'kind': 'recognition', 'error': str(e)})
@@ -1846,8 +1985,19 @@ class Window(Tk):
 			self.usage_report()
 
 		if self.file_name:
-			if check_file_changes(self.file_name, self.EgonTE.get('1.0', 'end')):
+			self._ensure_dirty_state_service()
+			if check_file_changes(self.file_name, self.EgonTE.get('1.0', 'end'), getattr(self, 'dirty_state_service', None)):
 				self.save()
+				if getattr(self, 'file_service', None):
+					self.file_service.flush_writes()
+		# a clean exit leaves nothing to recover
+		if getattr(self, 'edit_journal_service', None):
+			self.edit_journal_service.discard()
+		# the position in the file is restored when it is opened again
+		if getattr(self, 'recent_files_service', None):
+			self.recent_files_service.store_view(self.file_name)
+			self.recent_files_service.save()
+		self.record_list.close()
 
 		if event == 'r':
 			# Slightly delay restart to let Tk settle and avoid pending callbacks firing on a destroyed widget
@@ -2122,53 +2272,34 @@ class Window(Tk):
 		supports xml, html, csv, excel and pdf
 		support also the import of files via link
 		'''
-		# to make the functions write the whole file even if its huge
-		pandas.options.display.max_rows = 9999
-		content = ''
-
 		if via == 'file':
 			special_file = filedialog.askopenfilename(title='open file',
 													  filetypes=special_files)
 		else:
 			special_file = simpledialog.askstring('EgonTE', 'enter the link to the file')
 
-		try:
-
-			# identify file types
-			if special_file.endswith('.xml'):
-				content = pandas.read_xml(special_file).to_string()
-			elif special_file.endswith('.csv'):
-				content = pandas.read_csv(special_file).to_string()
-			elif special_file.endswith('.json'):
-				content = pandas.read_json(special_file).to_string()
-			elif special_file.endswith('.xlsx'):
-				content = pandas.read_excel(special_file).to_string()
-			elif special_file.endswith('.pdf'):
-				file = PdfReader(special_file)
-				pages_number = len(file.pages)
-				content = []
-				for i in range(pages_number):
-					page = (file.pages[i]).extract_text()
-					content.append(page)
-				content = ''.join(content)
-			else:
-				messagebox.showerror(self.title_struct + 'error', 'nothing found / unsupported file type')
-
-			self.EgonTE.insert(self.get_pos(), content)
-			starts = os.path.splitext(special_file)[0]
-			ends = os.path.splitext(special_file)[-1][1:]
-			self.record_list.append(f'> [{get_time()}] - Special file ({ends}) imported;\n  the files name is'
-									f' {starts}\n   and the file was imported via {via}')
-		except AttributeError:
+		if not special_file:
 			messagebox.showerror(self.title_struct + 'error', 'please enter a valid domain')
+			return
+
+		# the import streams into the editor from a worker (see SpecialImportService)
+		self._ensure_special_import_service()
+		if not getattr(self, 'special_import_service', None) or not self.special_import_service.start(special_file, via):
+			messagebox.showerror(self.title_struct + 'error', 'nothing found / unsupported file type')
 
 	# a window that have explanations confusing features
 	def info_page(self, path: str):
 		open_info(self, path)
 
 	def right_align_language_support(self):
+		global RA
 		if self.EgonTE.get('1.0', 'end'):
-			lan = poly_text(self.EgonTE.get('1.0', 'end')).language.name
+			try:
+				lan = poly_text(self.EgonTE.get('1.0', 'end')).language.name
+			except Exception:
+				# installed but broken (e.g. polyglot without its ICU bindings): found only on first use
+				RA = False
+				return
 			if lan in right_aligned_l:
 				self.align_text('right')
 
@@ -2182,6 +2313,7 @@ class Window(Tk):
 	def save_outvariables(self):
 		self.data['fun_numbers'] = self.fun_numbers.get()
 		self.data['auto_save'] = self.auto_save_v.get()
+		self.apply_autosave_settings()
 
 	def advance_options(self):
 		'''
@@ -2415,12 +2547,11 @@ class Window(Tk):
 				f'> [{get_time()}] - Speech to text language changed to: {self.stt_lang_value}')
 
 		def autosave_changes():
+			self.apply_autosave_settings()
 			if self.autosave_by_p.get():
-				self.EgonTE.bind('<KeyRelease>', self.auto_save_press)
 				self.record_list.append(
 					f'> [{get_time()}] - AutoSave method Added: save by pressing')
 			else:
-				self.EgonTE.unbind('<KeyRelease>', self.auto_save_press)
 				self.record_list.append(
 					f'> [{get_time()}] - AutoSave method Removed: save by pressing')
 
@@ -3290,19 +3421,32 @@ class Window(Tk):
 			return self.file_service.file_info(path=path)
 		return {}
 
+	def _ensure_autosave_service(self):
+		'''
+		Lazy-initialize the AutoSaveService (debounced / interval autosave on a writer thread).
+		'''
+		if not hasattr(self, 'autosave_service') or self.autosave_service is None:
+			try:
+				from services.autosave_service import AutoSaveService
+				self.autosave_service = AutoSaveService(self)
+			except Exception:
+				self.autosave_service = None
+
+	def apply_autosave_settings(self):
+		'''
+		(re)arm the autosave timers after the auto save options changed
+		'''
+		self._ensure_autosave_service()
+		if getattr(self, 'autosave_service', None):
+			self.autosave_service.attach()
+
 	def auto_save_time(self):
-		if self.file_name:
-			if self.autosave_by_t.get():
-				t = 300
-				while self.auto_save_v.get():
-					while t:
-						mins, secs = divmod(t, 60)
-						timer = '{:02d}:{:02d}'.format(mins, secs)
-						time.sleep(1)
-						t -= 1
-					self.save()
-			else:
-				self.save()
+		'''
+		save now through the autosave writer (the 'by time' interval is scheduled by the autosave service)
+		'''
+		self._ensure_autosave_service()
+		if self.file_name and getattr(self, 'autosave_service', None):
+			self.autosave_service.save_now()
 
 
 
@@ -3314,8 +3458,12 @@ class Window(Tk):
 
 
 	def auto_save_press(self, event=False):
-		if self.file_name and self.auto_save_v.get() and (self.autosave_by_p.get()):
-			self.save()
+		'''
+		note an edit for the 'by pressing' autosave; the save itself waits for a pause in typing
+		'''
+		self._ensure_autosave_service()
+		if getattr(self, 'autosave_service', None):
+			self.autosave_service.on_edit()
 
 	def setup_auto_lists(self, default_enabled: bool | None = None):
 		'Initialize Auto Lists with nested functions. Snake case names, no leading underscores, letter rollover, and unit tests.'
@@ -3902,13 +4050,13 @@ class Window(Tk):
 		# Store the after() id so we can cancel it on exit/restart
 		self._sw_after = self.after(500, self._update_stopwatch)
 
-	def merge_files(self, paths=None, separator='\n'):
+	def merge_files(self, paths=None, separator='\n', to_disk: bool = False):
 		'''
-		Merge multiple files into the editor (delegates to FileService).
+		Merge multiple files into the editor, or into a new file with to_disk (delegates to FileService).
 		'''
 		self._ensure_file_service()
 		if getattr(self, 'file_service', None):
-			return self.file_service.merge_files(paths=paths, separator=separator)
+			return self.file_service.merge_files(paths=paths, separator=separator, to_disk=to_disk)
 
 
 	def delete_file(self, path: str | None = None):
@@ -4030,204 +4178,113 @@ class Window(Tk):
 		This function will output you the stats of the content of the file,
 		many numeric values, presentation in a table about the usage of words and characters, and more
 		'''
-		res_font = 'arial 10'
-		special_characters = list(printable[62:])
-		print(special_characters)
+		from services.stats_service import ContentStats
 
+		res_font = 'arial 10'
 		stats_root = self.make_pop_ups_window(self.content_stats)
-		content = self.EgonTE.get('1.0', 'end')
-		lines_, characters, words_ = self.status_var.get().split(' ')
-
-		symbols = 0
-
-		m_special_characters = ''.join(special_characters)
-		m_special_characters = m_special_characters.replace(' ', '')
-		m_special_characters = m_special_characters.replace('\n', '')
-
-		print(m_special_characters)
-		for i in range(len(content)):
-			# checking if any special character is present in given string or not
-			if content[i] in m_special_characters:
-				symbols += 1
-
-		numbers = len(findall(r'\d+', content))
-		# set can contain duplicate values so by checking the length we can see the number of different characters
-		different_characters = len(set(content.lower()))
-		# if we split the content to a list by whitespace we can do the same thing for words
-		different_words = len(set((content.lower()).split(' ')))
-		# calculate the alphabets character count using loop and a condition
-		alphabets_count = 0
-		for i in content:
-			if i.isalpha():
-				alphabets_count += 1
-
-		temp_file = open('temp_EgonTE.txt', 'w')
-		temp_file.write(content)
-		temp_file.close()
-		paragraph = 0
-		content_lines = open('temp_EgonTE.txt', 'r').readlines()
-
-		for idx, c_line in enumerate(content_lines):
-			if not c_line == '\n':
-				m = reSearch(r'\w', c_line)
-				if m is not None:
-					string = m.group(0)
-				else:
-					raise messagebox.showerror('Error', 'an error has occurred')
-
+		loading_label = Label(stats_root, text='Calculating...', font=res_font)
+		loading_label.pack(padx=10, pady=10)
+
+		content = self.EgonTE.get('1.0', 'end-1c')
+		# word frequencies come from the shared document token index when it is current
+		self._ensure_token_index_service()
+		token_index = getattr(self, 'token_index_service', None)
+		revision = token_index.current_revision() if token_index else None
+		top_words = different_words = None
+		if token_index and token_index.is_current():
+			top_words = ContentStats.top_words_of(token_index.counts)
+			different_words = token_index.unique_count()
+
+		# the counting runs on a worker; only the drawing below touches Tk
+		result = {}
+
+		def compute():
 			try:
-				# if the line is a newline, and the previous line has a str in it, then
-				# count it as a paragraph.
-				if c_line == '\n' and string in content_lines[idx - 1]:
-					paragraph += 1
-			except:
-				pass
+				result['stats'] = ContentStats.from_text(content, top_words, different_words)
+			except Exception as error:
+				result['error'] = error
 
-		if content_lines[-1] != '\n':  # if the last line is not a new line, count a paragraph.
-			paragraph += 1
+		worker = Thread(target=compute, daemon=True)
+		worker.start()
 
-		temp_file.close()
-		del temp_file
-
-		# ratios
-		try:
-			words_per_lines = round(len(content.split(' ')) / lines, 2)
-		except ZeroDivisionError:
-			words_per_lines = 0
-		try:
-			characters_per_words = round(alphabets_count / words, 2)
-		except ZeroDivisionError:
-			characters_per_words = 0
-		try:
-			lines_per_paragraphs = round(lines / paragraph, 2)
-		except ZeroDivisionError:
-			lines_per_paragraphs = 0
-
-		# count the specific word / character in the text
-
-		words_per_line = reSplit(r'; |, |\*|\n', content)
-
-		print(f'splitted content: {words_per_line}')
-
-		m_words_per_line = []
-		for word in words_per_line:
-			if ' ' in word:
-				word = word.split(' ')
-			m_words_per_line.extend(word)
-
-		words_per_line = m_words_per_line
-		print(f'splitted content: {words_per_line}')
-
-		words_per_line = dict(Counter(words_per_line))
-		words_value, words_number = words_per_line.keys(), words_per_line.values()
-
-		# making a clear content (only alphabetic characters) to make the words' graph more accurate and clean
-		cleared_content_list = []
-		del_count = []
-		for count, word_value in enumerate(words_value, 0):
-			for special_character in special_characters:
-
-				if special_character in word_value:
-					word_value = word_value.replace(special_character, '')
-
-			cleared_content_list.append(word_value)
-			if word_value.isdigit():
-				del_count.append(word_value)
-		if '' in cleared_content_list:
-			cleared_content_list.remove('')
-		print(f'clear content list: {cleared_content_list}')
-		# cleared_content = cleared_content[-1]
-
-		# making the dictionary without symbols to advance the cleaning process
-		cleared_words_per_line = {}
-		for i, cc in enumerate(cleared_content_list):
-			cleared_words_per_line[cc] = list(words_number)[i]
-		print(cleared_words_per_line)
-
-		# deletion loop - deleting from the dictionary the numbers
-		for d in del_count:
-			del cleared_words_per_line[d]
-
-		print(f'clear dictionary: {cleared_words_per_line}')
-
-		cleared_content = ' '.join(cleared_content_list)
-		print(f'clear string: {cleared_content}')
-
-		top_word_list = (nlargest(8, cleared_words_per_line.items(), key=lambda x: x[1]))
-		top_dictionary = {}
-		for key, value in top_word_list:
-			top_dictionary[key] = value
-
-		print(f'top dictionary: {top_dictionary}')
-
-		top_words_value, top_words_number = top_dictionary.keys(), top_dictionary.values()
-
-		w_frame = Frame(stats_root)
-		word_figure = Figure(figsize=(5, 3), dpi=100)
-		word_figure_canvas = FigureCanvasTkAgg(word_figure, w_frame)
-		NavigationToolbar2Tk(word_figure_canvas, w_frame)
-		word_axes = word_figure.add_subplot()
-		word_axes.bar(top_words_value, top_words_number)
-		word_axes.set_ylabel('Frequency')
-		word_axes.set_xlabel('Words')
-
-		word_c = Counter(findall(r"[a-z']+", sub(r" '+ ", " ", content.lower())))
-
-		character_count = {}
-		for letter in printable[10:36]:
-			character_count[letter] = (content.lower()).count(letter)
-		characters_value, characters_number = character_count.keys(), character_count.values()
-
-		c_frame = Frame(stats_root)
-		character_figure = Figure(figsize=(5, 3), dpi=100)
-		character_figure_canvas = FigureCanvasTkAgg(character_figure, c_frame)
-		NavigationToolbar2Tk(character_figure_canvas, c_frame)
-		character_axes = character_figure.add_subplot()
-		character_axes.bar(characters_value, characters_number)
-		character_axes.set_ylabel('Frequency')
-		character_axes.set_xlabel('Characters')
-
-		label_frame = Frame(stats_root)
-		char_label = Label(label_frame, text=f'{characters}', font=res_font)
-		alpha_label = Label(label_frame, text=f'Alphabet characters {alphabets_count}')
-		words_label = Label(label_frame, text=f'{words_}', font=res_font)
-		lines_label = Label(label_frame, text=f'{lines_}', font=res_font)
-		nums_label = Label(label_frame, text=f'Numbers: {numbers}', font=res_font)
-		sym_label = Label(label_frame, text=f'Symbols: {symbols}', font=res_font)
-		diff_c_label = Label(label_frame, text=f'Different characters: {different_characters}', font=res_font)
-		diff_w_label = Label(label_frame, text=f'Different words: {different_words}', font=res_font)
-		wpl_label = Label(label_frame, text=f'Words per lines: {words_per_lines}', font=res_font)
-		cpw_label = Label(label_frame, text=f'Characters per words: {characters_per_words}', font=res_font)
-		para_label = Label(label_frame, text=f'Paragraphs: {paragraph}', font=res_font)
-		lpp_label = Label(label_frame, text=f'Lines per paragraphs: {lines_per_paragraphs}', font=res_font)
-
-		word_tt = Label(w_frame, text='Top words', font=self.titles_font)
-		word_tl = word_figure_canvas.get_tk_widget()
-
-		characters_tt = Label(c_frame, text='Top characters', font=self.titles_font)
-		characters_tl = character_figure_canvas.get_tk_widget()
-
-		label_frame.pack()
-		char_label.grid(row=1, column=0)
-		alpha_label.grid(row=1, column=2)
-		words_label.grid(row=2, column=0)
-		lines_label.grid(row=2, column=2)
-		para_label.grid(row=3, column=0)
-		nums_label.grid(row=3, column=2)
-		sym_label.grid(row=4, column=0)
-		diff_c_label.grid(row=4, column=2)
-		diff_w_label.grid(row=5, column=0)
-		wpl_label.grid(row=5, column=2)
-		cpw_label.grid(row=6, column=0)
-		lpp_label.grid(row=6, column=2)
-
-		w_frame.pack(expand=True, fill=BOTH)
-		word_tt.pack(fill=X)
-		word_tl.pack(expand=True, fill=BOTH)
-
-		c_frame.pack(expand=True, fill=BOTH)
-		characters_tt.pack(fill=X)
-		characters_tl.pack(expand=True, fill=BOTH)
+		def wait_for_stats():
+			if worker.is_alive():
+				stats_root.after(30, wait_for_stats)
+				return
+			if 'error' in result:
+				messagebox.showerror('EgonTE', f'an error has occurred: {result["error"]}')
+				return
+			stats = result['stats']
+			if token_index and stats.token_counters:
+				token_index.adopt(*stats.token_counters, revision)
+			loading_label.destroy()
+			draw_stats(stats)
+
+		def draw_stats(stats):
+			top_words_value = [word for word, _ in stats.top_words]
+			top_words_number = [amount for _, amount in stats.top_words]
+
+			w_frame = Frame(stats_root)
+			word_figure = Figure(figsize=(5, 3), dpi=100)
+			word_figure_canvas = FigureCanvasTkAgg(word_figure, w_frame)
+			NavigationToolbar2Tk(word_figure_canvas, w_frame)
+			word_axes = word_figure.add_subplot()
+			word_axes.bar(top_words_value, top_words_number)
+			word_axes.set_ylabel('Frequency')
+			word_axes.set_xlabel('Words')
+
+			c_frame = Frame(stats_root)
+			character_figure = Figure(figsize=(5, 3), dpi=100)
+			character_figure_canvas = FigureCanvasTkAgg(character_figure, c_frame)
+			NavigationToolbar2Tk(character_figure_canvas, c_frame)
+			character_axes = character_figure.add_subplot()
+			character_axes.bar(list(stats.letter_counts.keys()), list(stats.letter_counts.values()))
+			character_axes.set_ylabel('Frequency')
+			character_axes.set_xlabel('Characters')
+
+			label_frame = Frame(stats_root)
+			char_label = Label(label_frame, text=f'Characters:{stats.characters}', font=res_font)
+			alpha_label = Label(label_frame, text=f'Alphabet characters {stats.alphabet}')
+			words_label = Label(label_frame, text=f'Words:{stats.words}', font=res_font)
+			lines_label = Label(label_frame, text=f'Lines:{stats.lines}', font=res_font)
+			nums_label = Label(label_frame, text=f'Numbers: {stats.numbers}', font=res_font)
+			sym_label = Label(label_frame, text=f'Symbols: {stats.symbols}', font=res_font)
+			diff_c_label = Label(label_frame, text=f'Different characters: {stats.different_characters}', font=res_font)
+			diff_w_label = Label(label_frame, text=f'Different words: {stats.different_words}', font=res_font)
+			wpl_label = Label(label_frame, text=f'Words per lines: {stats.words_per_lines}', font=res_font)
+			cpw_label = Label(label_frame, text=f'Characters per words: {stats.characters_per_words}', font=res_font)
+			para_label = Label(label_frame, text=f'Paragraphs: {stats.paragraphs}', font=res_font)
+			lpp_label = Label(label_frame, text=f'Lines per paragraphs: {stats.lines_per_paragraphs}', font=res_font)
+
+			word_tt = Label(w_frame, text='Top words', font=self.titles_font)
+			word_tl = word_figure_canvas.get_tk_widget()
+
+			characters_tt = Label(c_frame, text='Top characters', font=self.titles_font)
+			characters_tl = character_figure_canvas.get_tk_widget()
+
+			label_frame.pack()
+			char_label.grid(row=1, column=0)
+			alpha_label.grid(row=1, column=2)
+			words_label.grid(row=2, column=0)
+			lines_label.grid(row=2, column=2)
+			para_label.grid(row=3, column=0)
+			nums_label.grid(row=3, column=2)
+			sym_label.grid(row=4, column=0)
+			diff_c_label.grid(row=4, column=2)
+			diff_w_label.grid(row=5, column=0)
+			wpl_label.grid(row=5, column=2)
+			cpw_label.grid(row=6, column=0)
+			lpp_label.grid(row=6, column=2)
+
+			w_frame.pack(expand=True, fill=BOTH)
+			word_tt.pack(fill=X)
+			word_tl.pack(expand=True, fill=BOTH)
+
+			c_frame.pack(expand=True, fill=BOTH)
+			characters_tt.pack(fill=X)
+			characters_tl.pack(expand=True, fill=BOTH)
+
+		stats_root.after(30, wait_for_stats)
 
 	def record_logs(self):
 		'''
@@ -4402,6 +4459,9 @@ class Window(Tk):
 
 			if self.sar.get():
 				self.save()
+				# the script is run from disk
+				if getattr(self, 'file_service', None):
+					self.file_service.flush_writes()
 
 			if self.auto_clear_c.get():
 				self.clear_console()
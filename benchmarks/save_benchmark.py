@@ -0,0 +1,58 @@
+'''
+Save benchmark: time the Tk thread is blocked by a save of a 1 MB / 10 MB / 100 MB buffer.
+
+'sync' is the former save path (open(path, 'w').write on the calling thread); 'background' is
+FileWriterService.submit, with the time until the atomic write (temp file + fsync + os.replace)
+is on disk reported separately. The Text.get snapshot both paths take first is not included.
+
+    python benchmarks/save_benchmark.py [sizes in MB...]
+'''
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.file_writer_service import FileWriterService
+
+
+class NoTkLoop:
+    '''
+    Stand-in for the app: completion callbacks are collected by FileWriterService.flush instead.
+    '''
+
+    def after(self, delay_ms, callback, *args):
+        return None
+
+
+def build_buffer(size_mb: int) -> str:
+    line_text = 'lorem ipsum dolor sit amet, consectetur adipiscing elit 0123456789\n'
+    return line_text * (size_mb * 1024 * 1024 // len(line_text))
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [1, 10, 100]
+    writer = FileWriterService(NoTkLoop())
+    with tempfile.TemporaryDirectory() as directory:
+        print(f'{"size":>6}  {"sync (blocks)":>14}  {"background (blocks)":>20}  {"background (on disk)":>21}')
+        for size_mb in sizes:
+            content = build_buffer(size_mb)
+            path = os.path.join(directory, f'save_{size_mb}mb.txt')
+
+            started = time.perf_counter()
+            with open(path, 'w', encoding='utf-8') as file_pointer:
+                file_pointer.write(content)
+            sync_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            writer.submit(path, content)
+            submit_seconds = time.perf_counter() - started
+            writer.flush()
+            written_seconds = time.perf_counter() - started
+
+            print(f'{size_mb:>4}MB  {sync_seconds * 1000:>11.1f} ms  {submit_seconds * 1000:>17.3f} ms  {written_seconds * 1000:>18.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
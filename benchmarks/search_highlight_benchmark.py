@@ -0,0 +1,55 @@
+'''
+Highlight-all benchmark: '1.0+Nc' offset indices vs LineOffsetTable 'line.col' indices.
+
+Builds a document with 100k matches, converts the match offsets both ways and, when a display
+is available, times tag_add for every match on a hidden Text widget.
+
+    python benchmarks/search_highlight_benchmark.py [match_count]
+'''
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.search_service import LineOffsetTable, SearchService
+
+
+def build_document(match_count: int) -> str:
+    line_text = 'lorem ipsum needle dolor sit amet needle consectetur\n'
+    return line_text * (match_count // 2)
+
+
+def timed(label: str, func):
+    started = time.perf_counter()
+    result = func()
+    print(f'{label:<42} {time.perf_counter() - started:8.3f}s')
+    return result
+
+
+def main() -> None:
+    match_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    document = build_document(match_count)
+    spans = timed('find_all_offsets', lambda: SearchService.find_all_offsets(document, 'needle', case_sensitive=False, whole_word=False))
+    print(f'{len(spans)} matches in {document.count(chr(10))} lines')
+
+    offset_spans = timed('offsets -> 1.0+Nc', lambda: SearchService.offsets_to_indices(spans))
+    line_spans = timed('offsets -> line.col (LineOffsetTable)', lambda: LineOffsetTable.from_text(document).spans_to_indices(spans))
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as error:
+        print(f'tag_add timings skipped (no display: {error})')
+        return
+    root.withdraw()
+    text_widget = tk.Text(root)
+    text_widget.insert('1.0', document)
+    for label, index_spans in (('tag_add with 1.0+Nc', offset_spans), ('tag_add with line.col', line_spans)):
+        text_widget.tag_remove('highlight_all_result', '1.0', 'end')
+        timed(label, lambda: [text_widget.tag_add('highlight_all_result', start, end) for start, end in index_spans])
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
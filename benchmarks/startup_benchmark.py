@@ -0,0 +1,91 @@
+'''
+Startup benchmark: cold and warm construction of the main window, phase by phase.
+
+Cold runs start a fresh interpreter per run (module imports included); warm runs build and destroy
+the window repeatedly in one interpreter, so imports and disk caches are already paid for.
+The window is withdrawn right after creation; without a display the runs go through xvfb-run
+when it is installed, otherwise the benchmark is skipped.
+
+    python benchmarks/startup_benchmark.py [cold_runs] [warm_runs]
+'''
+import json
+import os
+import shutil
+import subprocess
+import sys
+from statistics import median
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs inside the child interpreter: argv[1] is the amount of windows to build in a row
+CHILD_SCRIPT = '''
+import json, sys, time
+started = time.perf_counter()
+import EgonTE
+import_ms = (time.perf_counter() - started) * 1000
+for run in range(int(sys.argv[1])):
+    app = EgonTE.Window()
+    app.withdraw()
+    app.update_idletasks()
+    timings = app.startup_profiler.as_dict()
+    timings['import EgonTE'] = import_ms if run == 0 else 0.0
+    app.destroy()
+    print('TIMINGS ' + json.dumps(timings), flush=True)
+'''
+
+
+def child_command(runs: int):
+    command = [sys.executable, '-c', CHILD_SCRIPT, str(runs)]
+    if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+        if not shutil.which('xvfb-run'):
+            return None
+        command = ['xvfb-run', '-a'] + command
+    return command
+
+
+def run_child(runs: int):
+    command = child_command(runs)
+    if command is None:
+        return None, 'no display and xvfb-run is not installed'
+    completed = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True)
+    results = [json.loads(line[len('TIMINGS '):]) for line in completed.stdout.splitlines() if line.startswith('TIMINGS ')]
+    if not results:
+        return None, (completed.stderr.strip().splitlines() or [f'exit code {completed.returncode}'])[-1]
+    return results, ''
+
+
+def report(label: str, results) -> None:
+    totals = [result['total'] + result.get('import EgonTE', 0.0) for result in results]
+    print(f'{label}: median {median(totals):.1f} ms over {len(totals)} runs (min {min(totals):.1f}, max {max(totals):.1f})')
+    phases = {}
+    for result in results:
+        for name, milliseconds in result.items():
+            phases.setdefault(name, []).append(milliseconds)
+    for name, values in sorted(phases.items(), key=lambda item: median(item[1]), reverse=True):
+        print(f'{median(values):9.1f} ms  {name}')
+
+
+def main() -> None:
+    cold_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    warm_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    cold_results = []
+    for _ in range(cold_runs):
+        results, error = run_child(1)
+        if results is None:
+            print(f'startup benchmark skipped ({error})')
+            return
+        cold_results.extend(results)
+    report('cold start', cold_results)
+
+    warm_results, error = run_child(warm_runs + 1)
+    if warm_results is None:
+        print(f'warm runs skipped ({error})')
+        return
+    # the first window of the warm process is a cold one
+    print()
+    report('warm start', warm_results[1:])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+'''
+Startup import report: runs 'python -X importtime -c "import EgonTE"' in a fresh interpreter and
+lists the slowest top-level imports, so modules that slipped back into eager startup imports stand out.
+
+    python benchmarks/startup_imports.py [top_n] [module]
+
+Heavy third-party modules should not appear here: EgonTE.py binds them through
+dependencies/lazy_imports.py and they show up in lazy_imports.import_report() once used instead.
+'''
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def collect_importtime(module_name: str):
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return completed.returncode, rows
+
+
+def main() -> None:
+    top_n = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    module_name = sys.argv[2] if len(sys.argv) > 2 else 'EgonTE'
+    return_code, rows = collect_importtime(module_name)
+    if not rows:
+        print(f'no importtime data (exit code {return_code})')
+        return
+    # top-level entries are the least indented ones; nested imports are already in their cumulative time
+    top_indent = min(len(name) - len(name.lstrip()) for _, _, name in rows)
+    top_level = [(cumulative, name.strip()) for _, cumulative, name in rows if len(name) - len(name.lstrip()) == top_indent]
+    total_us = sum(cumulative for cumulative, _ in top_level)
+    print(f'import {module_name}: {total_us / 1000:.1f} ms over {len(rows)} modules (exit code {return_code})')
+    for cumulative, name in sorted(top_level, reverse=True)[:top_n]:
+        print(f'{cumulative / 1000:9.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
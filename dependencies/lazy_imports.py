@@ -0,0 +1,161 @@
+'''
+Lazy imports for heavy third-party modules.
+
+lazy_import('pandas') / lazy_from('matplotlib.figure', 'Figure') return proxies that stand in for
+the module / attribute and import it on first real use (attribute access or call), so startup only
+pays for what the first window needs. Every resolution is timed into a small registry that
+import_report() prints, next to the '-X importtime' report of benchmarks/startup_imports.py.
+
+Notes:
+  - on_import(name, hook) runs hook(module) right after the module is first imported, also when it is
+    imported as the parent of a lazily imported submodule (e.g. matplotlib.use('TkAgg')).
+  - Proxies cannot be used as exception classes in 'except' or as base classes; reach those through a
+    module proxy instead (e.g. 'except speech_recognition.WaitTimeoutError').
+  - module_available() checks that a module is installed without importing it.
+'''
+import importlib
+import importlib.util
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_lock = threading.RLock()
+_import_hooks: Dict[str, List[Callable[[types.ModuleType], None]]] = {}
+_hooked_modules: set = set()
+# module name -> (seconds spent importing, what triggered it)
+import_timings: Dict[str, Tuple[float, str]] = {}
+
+
+def on_import(module_name: str, hook: Callable[[types.ModuleType], None]) -> None:
+    '''
+    Run hook(module) once, right after module_name is imported through this registry.
+    '''
+    with _lock:
+        _import_hooks.setdefault(module_name, []).append(hook)
+
+
+def import_module(module_name: str, trigger: str = '') -> types.ModuleType:
+    '''
+    Import module_name, first importing any registered parent package so its hooks run beforehand.
+    '''
+    with _lock:
+        parts = module_name.split('.')
+        for depth in range(1, len(parts) + 1):
+            prefix = '.'.join(parts[:depth])
+            if prefix in _import_hooks and prefix not in _hooked_modules:
+                _hooked_modules.add(prefix)
+                prefix_module = _timed_import(prefix, trigger)
+                for hook in _import_hooks[prefix]:
+                    hook(prefix_module)
+        return _timed_import(module_name, trigger)
+
+
+def _timed_import(module_name: str, trigger: str) -> types.ModuleType:
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if module_name not in import_timings:
+        import_timings[module_name] = (time.perf_counter() - started, trigger)
+    return module
+
+
+def module_available(module_name: str) -> bool:
+    '''
+    True if module_name can be found on the path; nothing is imported (use top-level names).
+    '''
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule(types.ModuleType):
+    '''
+    Module proxy: 'pandas = lazy_import("pandas")' behaves like 'import pandas' once touched.
+    '''
+
+    def __init__(self, module_name: str):
+        super().__init__(module_name)
+        self.__dict__['_lazy_target'] = None
+
+    def _lazy_resolve(self, trigger: str = '') -> types.ModuleType:
+        target = self.__dict__['_lazy_target']
+        if target is None:
+            target = import_module(self.__name__, trigger or self.__name__)
+            self.__dict__['_lazy_target'] = target
+        return target
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._lazy_resolve(f'{self.__name__}.{attribute}'), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self._lazy_resolve(f'{self.__name__}.{attribute}'), attribute, value)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._lazy_resolve())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f'<lazy module {self.__name__!r} ({state})>'
+
+
+class LazyAttribute:
+    '''
+    Proxy for 'from module import name': resolved on the first call or attribute access.
+    '''
+    __slots__ = ('_lazy_module', '_lazy_attribute', '_lazy_target')
+
+    def __init__(self, module_name: str, attribute: str):
+        object.__setattr__(self, '_lazy_module', module_name)
+        object.__setattr__(self, '_lazy_attribute', attribute)
+        object.__setattr__(self, '_lazy_target', None)
+
+    def _lazy_resolve(self) -> Any:
+        target = object.__getattribute__(self, '_lazy_target')
+        if target is None:
+            module_name = object.__getattribute__(self, '_lazy_module')
+            attribute = object.__getattribute__(self, '_lazy_attribute')
+            target = getattr(import_module(module_name, f'{module_name}.{attribute}'), attribute)
+            object.__setattr__(self, '_lazy_target', target)
+        return target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._lazy_resolve()(*args, **kwargs)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._lazy_resolve(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self._lazy_resolve(), attribute, value)
+
+    def __repr__(self) -> str:
+        module_name = object.__getattribute__(self, '_lazy_module')
+        attribute = object.__getattribute__(self, '_lazy_attribute')
+        return f'<lazy {module_name}.{attribute}>'
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    return LazyModule(module_name)
+
+
+def lazy_from(module_name: str, attribute: str) -> LazyAttribute:
+    return LazyAttribute(module_name, attribute)
+
+
+def resolve(value: Any) -> Any:
+    '''
+    Return the real object behind a proxy (anything else is returned unchanged).
+    '''
+    if isinstance(value, (LazyModule, LazyAttribute)):
+        return value._lazy_resolve()
+    return value
+
+
+def import_report(limit: Optional[int] = None) -> str:
+    '''
+    Lazily resolved modules, slowest first, with the access that triggered each import.
+    '''
+    rows = sorted(import_timings.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    if not rows:
+        return 'no lazy imports resolved yet'
+    return '\n'.join(f'{seconds * 1000:9.1f} ms  {name:<40} {trigger}' for name, (seconds, trigger) in rows)
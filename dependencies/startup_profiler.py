@@ -0,0 +1,75 @@
+'''
+Wall-clock profiler for the startup phases of the main window.
+
+    profiler = StartupProfiler()
+    ...
+    profiler.lap('settings load')              # time since the previous lap (or since creation)
+    with profiler.phase('load_links'):         # or an explicit block, e.g. on a worker thread
+        ...
+    profiler.flush_to(record_list, get_time)   # once the record log exists
+
+Phases finished after flush_to (e.g. background loaders) go straight to the same log.
+'''
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.last_lap = self.started
+        self.ready: Optional[float] = None
+        self.phases: List[Tuple[str, float]] = []
+        self.sink: Optional[List[str]] = None
+        self.time_source: Optional[Callable[[], str]] = None
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - phase_start)
+
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        self.add(name, now - self.last_lap)
+        self.last_lap = now
+
+    def add(self, name: str, seconds: float) -> None:
+        with self.lock:
+            self.phases.append((name, seconds))
+            if self.sink is not None:
+                self.sink.append(self.format_line(name, seconds))
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def format_line(self, name: str, seconds: float) -> str:
+        stamp = self.time_source() if self.time_source else ''
+        return f'> [{stamp}] - Startup: {name} took {seconds * 1000:.1f} ms'
+
+    def flush_to(self, sink: List[str], time_source: Optional[Callable[[], str]] = None) -> None:
+        '''
+        Write the recorded phases and the total so far into the record log, and keep logging there.
+        '''
+        with self.lock:
+            self.ready = self.elapsed()
+            self.sink, self.time_source = sink, time_source
+            for name, seconds in self.phases:
+                sink.append(self.format_line(name, seconds))
+            sink.append(self.format_line('window ready (total)', self.ready))
+
+    def as_dict(self) -> Dict[str, float]:
+        '''
+        Phase name -> milliseconds (repeated phases are summed), plus 'total'.
+        '''
+        with self.lock:
+            timings: Dict[str, float] = {}
+            for name, seconds in self.phases:
+                timings[name] = timings.get(name, 0.0) + seconds * 1000
+        timings['total'] = (self.ready if self.ready is not None else self.elapsed()) * 1000
+        return timings
@@ -1,7 +1,6 @@
 from tkinter import END, ANCHOR, messagebox
 import webbrowser
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 from ctypes import WinDLL
 from dependencies.large_variables import languages
 
@@ -41,25 +40,26 @@ def ex_links(mode: str = '', link : str = ''):
     webbrowser.open(link)
 
 
-def check_file_changes(file_name, content):
-    '''+ beta function - need to be tested'''
-    proceed = False
-    if file_name:
-        with open(file_name, 'r', encoding='utf-8') as fp:
-            file_content = fp.read() + '\n'  # tkinter most often has an newline at the end
-
-        # checking the precantage of identicality, we would consider 95% percent and above equal
-        matcher = SequenceMatcher(None, file_content, content)
-        similarity = matcher.ratio()
-        if similarity >= 0.95:
-            proceed = True
-        else:
-            if messagebox.askyesno('EgonTE', 'its seems that the current file is not saved\ndo you wish to proceed?'):
-                proceed = True
-
-    else:
-        proceed = True
-    return proceed
+def check_file_changes(file_name, content, dirty_state=None):
+    '''
+    returns True if the buffer can be replaced: there is no file, it has no unsaved changes or the user agreed.
+    dirty_state (DirtyStateService) answers from the edit revision / a buffer digest; without a record
+    for the file the buffer is compared with the file on disk in one pass
+    '''
+    if not file_name:
+        return True
+    changed = dirty_state.is_dirty(file_name) if dirty_state is not None else None
+    if changed is None:
+        try:
+            with open(file_name, 'r', encoding='utf-8') as fp:
+                file_content = fp.read()
+        except (OSError, UnicodeDecodeError):
+            file_content = None
+        # tkinter most often has an newline at the end
+        changed = file_content is None or content not in (file_content, file_content + '\n')
+    if not changed:
+        return True
+    return bool(messagebox.askyesno('EgonTE', 'its seems that the current file is not saved\ndo you wish to proceed?'))
 
 
 @staticmethod
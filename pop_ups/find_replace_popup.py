@@ -2,7 +2,12 @@
 import tkinter as tk
 from tkinter import ttk
 import re
-from collections import Counter
+import time
+import threading
+import queue
+
+from services.search_service import LineOffsetTable, SearchService, ViewportHighlighter
+from services.token_index_service import TokenIndexService
 
 def open_find_replace(app, event=None):
     '''+ the tool is a bit too advanced, so we will probably preserve somehow also the origianl one'''
@@ -145,14 +150,47 @@ def open_find_replace(app, event=None):
     except Exception:
         pass
 
+    # 'Highlight all' and 'All' only tag the matches around the visible lines and follow scrolling
+    all_highlighter = ViewportHighlighter(text, TAG_ALL)
+    sel_highlighter = ViewportHighlighter(text, TAG_SEL)
+
     def _clear_tags():
+        all_highlighter.set_source(None)
+        sel_highlighter.set_source(None)
         try:
-            text.tag_remove(TAG_ALL, '1.0', 'end')
             text.tag_remove(TAG_CUR, '1.0', 'end')
-            text.tag_remove(TAG_SEL, '1.0', 'end')
         except Exception:
             pass
 
+    def _detach_highlighters(evt=None):
+        if evt is not None and evt.widget is not root:
+            return
+        all_highlighter.detach()
+        sel_highlighter.detach()
+        if edit_tracker is not None:
+            edit_tracker.remove_listener(_on_text_edit)
+
+    # The highlighters hold fixed line.col spans: an edit made outside the popup drops them and
+    # re-collects the matches, instead of painting them at stale positions on the next scroll.
+    _edits = {'own': False}
+
+    def _on_text_edit(edit):
+        if _edits['own'] or not State.matches:
+            return
+        all_highlighter.set_source(None)
+        sel_highlighter.set_source(None)
+        _schedule()
+
+    try:
+        app._ensure_edit_tracking_service()
+        edit_tracker = getattr(app, 'edit_tracking_service', None)
+        if edit_tracker is not None and not edit_tracker.install():
+            edit_tracker = None
+    except Exception:
+        edit_tracker = None
+    if edit_tracker is not None:
+        edit_tracker.add_listener(_on_text_edit)
+
     # --- Helpers ---
     def _bounds():
         '''
@@ -172,22 +210,6 @@ def open_find_replace(app, event=None):
         State.sel_start, State.sel_end = None, None
         return '1.0', 'end-1c'
 
-    def _to_tk_pattern(literal: str, partial: bool, allow_regex: bool) -> tuple[str, bool]:
-        '''
-        Returns (pattern, use_regex_flag) for Tk's Text.search.
-        - partial=True: use literal or raw regex as-is
-        - partial=False: enforce whole word with \m...\M
-        '''
-        if allow_regex:
-            pat = literal
-            if not partial:
-                pat = fr'\m(?:{pat})\M'
-            return pat, True
-        if not partial:
-            esc = re.escape(literal)
-            return fr'\m{esc}\M', True
-        return literal, False
-
     def _sync_state_from_ui():
         State.pattern = find_var.get()
         State.replace = repl_var.get()
@@ -198,13 +220,19 @@ def open_find_replace(app, event=None):
         State.in_selection = in_sel_var.get()
         State.highlight_all = all_var.get()
 
-    def _set_status_found(n: int):
-        status.config(text=f"{n} match{'es' if n != 1 else ''}")
+    def _set_status_found(n: int, elapsed: float):
+        status.config(text=f"{n} match{'es' if n != 1 else ''} ({elapsed * 1000:.1f} ms)")
 
-    def _set_status_not_found():
-        status.config(text='No matches')
+    def _set_status_not_found(elapsed: float):
+        status.config(text=f'No matches ({elapsed * 1000:.1f} ms)')
 
     def _update_counter():
+        search = _mapped_search()
+        if search is not None:
+            found, done = search.mapped_progress()
+            current = search.current_match_index + 1 if found else 0
+            occ_counter.configure(text=f"{current}/{found}{'' if done else '+'}")
+            return
         total = len(State.matches)
         if total == 0 or State.current < 0:
             occ_counter.configure(text='0/0')
@@ -222,12 +250,131 @@ def open_find_replace(app, event=None):
         except Exception:
             pass
 
+    # --- Mapped large-file view ---
+    # The editor then holds only a window of the file: SearchService scans the whole mapping on its
+    # worker and reveals each match; the view is read-only, so replace and the tag buttons are off.
+    def _mapped_search():
+        try:
+            app._ensure_search_service()
+            search = getattr(app, 'search_service', None)
+            return search if search is not None and search.mapped_view() is not None else None
+        except Exception:
+            return None
+
+    def _collect_mapped(search, generation):
+        search.find_text(State.pattern, case_sensitive=State.case, whole_word=not State.partial, regex=State.regex)
+        status.config(text='Searching...')
+        _update_counter()
+        root.after(100, _poll_mapped, search, generation, time.perf_counter())
+
+    def _poll_mapped(search, generation, started):
+        if _jobs['search'] != generation:
+            return
+        found, done = search.mapped_progress()
+        try:
+            _update_counter()
+            if found:
+                _set_nav_enabled(True)
+                for button in (btn_all_tag, btn_none_tag, btn_replace, btn_replace_all):
+                    button.config(state='disabled')
+            if not done:
+                status.config(text=f'Searching... {found} matches so far')
+                root.after(100, _poll_mapped, search, generation, started)
+            elif found:
+                _set_status_found(found, time.perf_counter() - started)
+            else:
+                _set_status_not_found(time.perf_counter() - started)
+        except tk.TclError:
+            pass  # popup closed
+
+    # --- Background jobs ---
+    # Match collection and popular terms run on worker threads. Every new request bumps a
+    # generation id: workers stop as soon as theirs is outdated and stale results are dropped.
+    _jobs = {'search': 0, 'terms': 0, 'running': 0, 'poll_id': None}
+    _results = queue.Queue()
+    PROGRESS_EVERY = 5000  # matches between partial counts
+
+    def _start_job(target, *args):
+        _jobs['running'] += 1
+        threading.Thread(target=target, args=args, daemon=True).start()
+        if _jobs['poll_id'] is None:
+            _jobs['poll_id'] = root.after(30, _poll_results)
+
+    def _poll_results():
+        _jobs['poll_id'] = None
+        try:
+            while True:
+                msg = _results.get_nowait()
+                kind = msg['type']
+                if kind == 'done':
+                    _jobs['running'] -= 1
+                elif kind == 'progress' and msg['generation'] == _jobs['search']:
+                    status.config(text=f"Searching... {msg['count']} matches so far")
+                elif kind == 'matches' and msg['generation'] == _jobs['search']:
+                    _apply_matches(msg['matches'], msg['elapsed'])
+                elif kind == 'token_counts' and msg['generation'] == _jobs['terms']:
+                    if token_index is not None:
+                        token_index.adopt(msg['counts'], msg['folded_counts'], msg['revision'])
+                    _show_terms(_popular_from(msg['counts'], msg['folded_counts']))
+        except queue.Empty:
+            pass
+        except tk.TclError:
+            return  # popup closed
+        if _jobs['running'] > 0:
+            try:
+                _jobs['poll_id'] = root.after(30, _poll_results)
+            except tk.TclError:
+                pass
+
+    def _cancel_jobs(evt=None):
+        if evt is not None and evt.widget is not root:
+            return
+        _jobs['search'] += 1
+        _jobs['terms'] += 1
+
+    def _scan_matches(generation, scope_text, first_index, options, report=None):
+        '''
+        Scan one scope snapshot with the SearchService engine (Python regex/literal; partial=False
+        enforces word boundaries; zero-length regex matches are skipped) and convert the spans to
+        line.col indices in bulk. Returns None once the generation is outdated.
+        '''
+        started = time.perf_counter()
+        spans = []
+        for span in SearchService.iter_offsets(scope_text, options['pattern'], case_sensitive=options['case'],
+                                               whole_word=not options['partial'], regex=options['regex']):
+            if span[1] <= span[0]:
+                continue
+            spans.append(span)
+            if len(spans) % PROGRESS_EVERY == 0:
+                if _jobs['search'] != generation:
+                    return None
+                if report:
+                    report(len(spans))
+        offset_table = LineOffsetTable.from_text(scope_text, *map(int, first_index.split('.')))
+        matches = offset_table.spans_to_indices(spans)
+        return matches, time.perf_counter() - started
+
+    def _search_worker(generation, scope_text, first_index, options):
+        try:
+            result = _scan_matches(generation, scope_text, first_index, options,
+                                   lambda n: _results.put({'type': 'progress', 'generation': generation, 'count': n}))
+            if result is not None:
+                _results.put({'type': 'matches', 'generation': generation, 'matches': result[0], 'elapsed': result[1]})
+        finally:
+            _results.put({'type': 'done'})
+
     # --- Core: collect matches and highlight ---
-    def _collect_matches():
+    def _collect_matches(wait: bool = False):
+        '''
+        Snapshot the scope and collect matches on a worker (results are applied by _poll_results).
+        wait=True scans inline, for callers that need State.matches right away.
+        '''
         _sync_state_from_ui()
         _clear_tags()
         State.matches.clear()
         State.current = -1
+        _jobs['search'] += 1
+        generation = _jobs['search']
 
         pat = State.pattern
         if not pat:
@@ -237,50 +384,56 @@ def open_find_replace(app, event=None):
             _update_terms()
             return
 
+        if State.regex:
+            try:
+                re.compile(pat)
+            except re.error:
+                status.config(text='Invalid regex')
+                _update_counter()
+                _set_nav_enabled(False)
+                _update_terms()
+                return
+
+        mapped_search = _mapped_search()
+        if mapped_search is not None:
+            _set_nav_enabled(False)
+            _collect_mapped(mapped_search, generation)
+            return
+
         start, stop = _bounds()
-        pat_tk, use_regex = _to_tk_pattern(pat, State.partial, State.regex)
-
-        options = {}
-        if not State.case:
-            options['nocase'] = 1
-        if use_regex:
-            options['regexp'] = 1
-
-        idx = start
-        count = tk.IntVar(value=0)
-        cap = 40000  # safety cap
-
-        while True:
-            pos = text.search(pat_tk, idx, stopindex=stop, count=count, **options)
-            if not pos:
-                break
-            length = count.get()
-            if length <= 0:
-                # avoid infinite loops on zero-length matches (e.g., empty regex)
-                idx = text.index(f'{pos}+1c')
-                continue
-            end = text.index(f'{pos}+{length}c')
-            State.matches.append((pos, end))
-            idx = end
-            if len(State.matches) >= cap:
-                break
+        # one snapshot of the scope; the scan itself never touches the widget
+        idx = text.index(start)
+        scope_text = text.get(idx, stop)
+        options = {'pattern': pat, 'case': State.case, 'partial': State.partial, 'regex': State.regex}
+        _set_nav_enabled(False)
+        _update_counter()
+        _update_terms()
+
+        if wait:
+            matches, elapsed = _scan_matches(generation, scope_text, idx, options)
+            _apply_matches(matches, elapsed)
+            return
+        status.config(text='Searching...')
+        _start_job(_search_worker, generation, scope_text, idx, options)
+
+    def _apply_matches(matches, elapsed: float):
+        State.matches.clear()
+        State.matches.extend(matches)
 
         # Highlight all and select first
         if State.highlight_all:
-            for s, e in State.matches:
-                text.tag_add(TAG_ALL, s, e)
+            all_highlighter.set_spans(list(State.matches))
 
         if State.matches:
             State.current = 0
             _focus_current()
-            _set_status_found(len(State.matches))
+            _set_status_found(len(State.matches), elapsed)
             _set_nav_enabled(True)
         else:
-            _set_status_not_found()
+            _set_status_not_found(elapsed)
             _set_nav_enabled(False)
 
         _update_counter()
-        _update_terms()
 
     def _focus_current():
         try:
@@ -300,8 +453,17 @@ def open_find_replace(app, event=None):
         _update_counter()
 
     def _goto(delta: int):
+        search = _mapped_search()
+        if search is not None:
+            if search.mapped_spans is None:
+                _collect_matches()
+            elif (search.find_next if delta > 0 else search.find_prev)(wrap=State.wrap) is not None:
+                _update_counter()
+                if auto_focus_var.get():
+                    text.focus_set()
+            return
         if not State.matches:
-            _collect_matches()
+            _collect_matches(wait=True)
             if not State.matches:
                 return
         nxt = State.current + delta
@@ -315,18 +477,10 @@ def open_find_replace(app, event=None):
         _focus_current()
 
     def _tag_all_matches():
-        try:
-            text.tag_remove(TAG_SEL, '1.0', 'end')
-        except Exception:
-            pass
-        for s, e in State.matches:
-            text.tag_add(TAG_SEL, s, e)
+        sel_highlighter.set_spans(list(State.matches))
 
     def _clear_all_tag():
-        try:
-            text.tag_remove(TAG_SEL, '1.0', 'end')
-        except Exception:
-            pass
+        sel_highlighter.set_source(None)
 
     def _reset():
         find_var.set('')
@@ -348,7 +502,7 @@ def open_find_replace(app, event=None):
         try:
             frag = text.get(s, e)
         except Exception:
-            _collect_matches()
+            _collect_matches(wait=True)
             if not (0 <= State.current < len(State.matches)):
                 return
             s, e = State.matches[State.current]
@@ -366,15 +520,19 @@ def open_find_replace(app, event=None):
             new_frag = repl
 
         text.edit_separator()
-        text.delete(s, e)
-        text.insert(s, new_frag)
+        _edits['own'] = True
+        try:
+            text.delete(s, e)
+            text.insert(s, new_frag)
+        finally:
+            _edits['own'] = False
         text.edit_separator()
 
         _collect_matches()
 
     def _replace_all():
         if not State.matches:
-            _collect_matches()
+            _collect_matches(wait=True)
         if not State.matches:
             return
 
@@ -387,42 +545,70 @@ def open_find_replace(app, event=None):
                 compiled = None
 
         text.edit_separator()
-        for s, e in reversed(State.matches):
-            try:
-                frag = text.get(s, e)
-            except Exception:
-                continue
-            if compiled:
-                new = compiled.sub(State.replace, frag)
-            else:
-                new = State.replace
-            text.delete(s, e)
-            text.insert(s, new)
+        _edits['own'] = True
+        try:
+            for s, e in reversed(State.matches):
+                try:
+                    frag = text.get(s, e)
+                except Exception:
+                    continue
+                if compiled:
+                    new = compiled.sub(State.replace, frag)
+                else:
+                    new = State.replace
+                text.delete(s, e)
+                text.insert(s, new)
+        finally:
+            _edits['own'] = False
         text.edit_separator()
 
         _collect_matches()
 
     # --- Popular terms ---
-    def _tokenize_for_popular():
-        full = text.get('1.0', 'end-1c')
-        tokens = re.findall(r'\w+', full)
-        if not case_var.get():
-            tokens = [t.lower() for t in tokens]
-        return tokens
+    # Counts come from the shared document token index; only its first build (or a rebuild after
+    # an untracked change) is done on a worker, from a snapshot the index adopts if still current.
+    try:
+        app._ensure_token_index_service()
+        token_index = getattr(app, 'token_index_service', None)
+    except Exception:
+        token_index = None
+
+    def _popular_worker(generation, full, revision):
+        try:
+            counts, folded_counts = TokenIndexService.count_tokens(full)
+            if _jobs['terms'] == generation:
+                _results.put({'type': 'token_counts', 'generation': generation, 'counts': counts,
+                              'folded_counts': folded_counts, 'revision': revision})
+        finally:
+            _results.put({'type': 'done'})
+
+    def _popular_from(counts, folded_counts):
+        source = counts if case_var.get() else folded_counts
+        return [t for (t, _) in source.most_common(10)]
 
     def _update_terms():
+        _jobs['terms'] += 1
+        if token_index is not None and token_index.is_current():
+            _show_terms(_popular_from(token_index.counts, token_index.folded_counts))
+            return
+        if token_index is not None:
+            full, revision = token_index.snapshot()
+        else:
+            try:
+                full, revision = text.get('1.0', 'end-1c'), None
+            except Exception:
+                return
+        _start_job(_popular_worker, _jobs['terms'], full, revision)
+
+    def _show_terms(popular):
         try:
             terms_list.delete(0, tk.END)
         except Exception:
             return
 
-        tokens = _tokenize_for_popular()
-        if not tokens:
+        if not popular:
             terms_frame.grid_forget()
             return
-
-        cnt = Counter(tokens)
-        popular = [t for (t, _) in cnt.most_common(10)]
         State.popular = popular
 
         # Respect case option
@@ -511,6 +697,8 @@ def open_find_replace(app, event=None):
     root.bind('<Control-Return>', _on_ctrl_enter)
     root.bind('<Control-Shift-Return>', _on_ctrl_shift_enter)
     root.bind('<Escape>', _on_escape)
+    root.bind('<Destroy>', _detach_highlighters, add='+')
+    root.bind('<Destroy>', _cancel_jobs, add='+')
 
     # Seed from current selection if find is empty
     try:
@@ -4,19 +4,27 @@ from tkinter import (
 )
 from tkinter import messagebox
 from tkinter import ttk
-from PIL import Image, ImageTk, UnidentifiedImageError
 from io import BytesIO
 import urllib.request
 import threading
 import webbrowser
-import requests
 from queue import Queue
-from wikipedia import page, summary, search as wiki_search, exceptions
-from PyDictionary import PyDictionary
 from urllib.parse import urlparse
 from threading import Thread
 import re
 
+from dependencies.lazy_imports import lazy_import, lazy_from
+
+# heavy modules are imported on first use
+Image = lazy_import('PIL.Image')
+ImageTk = lazy_import('PIL.ImageTk')
+requests = lazy_import('requests')
+page = lazy_from('wikipedia', 'page')
+summary = lazy_from('wikipedia', 'summary')
+wiki_search = lazy_from('wikipedia', 'search')
+exceptions = lazy_import('wikipedia.exceptions')
+PyDictionary = lazy_from('PyDictionary', 'PyDictionary')
+
 def open_knowledge_popup(app, mode: str):
 	'''
 	Knowledge popup for Dictionary and Wikipedia, with:
@@ -530,7 +538,7 @@ def open_knowledge_popup(app, mode: str):
 		try:
 			pil_image_obj = Image.open(BytesIO(image_bytes))
 			orig_size = getattr(pil_image_obj, 'size', (None, None))
-		except UnidentifiedImageError:
+		except Image.UnidentifiedImageError:
 			return None, None
 		except Exception:
 			return None, None
@@ -12,6 +12,8 @@ from collections import deque, OrderedDict
 from datetime import datetime, timedelta
 import difflib
 
+from services.search_service import LineOffsetTable, SearchService
+
 # --- Helper Class ---
 
 class Tooltip:
@@ -40,6 +42,58 @@ class Tooltip:
             self.tooltip_window.destroy()
         self.tooltip_window = None
 
+class RuleMatcher:
+    """
+    The highlight or alert rules of the viewer ({'pattern': regex, 'case_insensitive': bool, ...}) compiled once.
+    Plain-text patterns become substring tests on the line (lowered once for all case-insensitive ones);
+    the real regexes are also joined into one alternation that is searched first, so a line matching
+    none of them costs a single search. Invalid patterns are skipped, as before.
+    """
+    def __init__(self, rules):
+        self.rules = rules
+        self.rule_count = len(rules)
+        self.literals = []  # (rule index, needle, case_insensitive)
+        self.regexes = []  # (rule index, compiled pattern, covered by the prefilter)
+        alternatives = []
+        for i, rule in enumerate(rules):
+            try:
+                pattern = rule['pattern']
+                ignore_case = rule.get('case_insensitive', True)
+                compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+            except (re.error, KeyError, TypeError, AttributeError):
+                continue
+            if not RULE_META_REGEX.search(pattern):
+                self.literals.append((i, pattern.lower() if ignore_case else pattern, ignore_case))
+                continue
+            # a back reference would point at another rule's group once combined
+            combinable = not RULE_BACKREF_REGEX.search(pattern)
+            self.regexes.append((i, compiled, combinable))
+            if combinable:
+                alternatives.append(f"(?{'i' if ignore_case else '-i'}:{pattern})")
+        self.prefilter = None
+        if len(alternatives) > 1:
+            try:
+                self.prefilter = re.compile('|'.join(alternatives))
+            except re.error:  # e.g. inline global flags or a group name used by two rules
+                pass
+
+    def matches(self, line):
+        """Indexes of the rules matching line, in rule order."""
+        matched = []
+        lowered = None
+        for i, needle, ignore_case in self.literals:
+            if ignore_case:
+                if lowered is None: lowered = line.lower()
+                if needle in lowered: matched.append(i)
+            elif needle in line:
+                matched.append(i)
+        if self.regexes:
+            skip_combined = self.prefilter is not None and not self.prefilter.search(line)
+            matched.extend(i for i, compiled, combinable in self.regexes
+                           if not (skip_combined and combinable) and compiled.search(line))
+            matched.sort()
+        return matched
+
 # --- Constants ---
 TAG_ERROR = "error"
 TAG_WARNING = "warning"
@@ -65,7 +119,14 @@ CORRELATION_ID_REGEXES = {
     'TraceID': re.compile(r'trace_id[=:\s]+([\w-]+)'),
     'SessionID': re.compile(r'session_id[=:\s]+([\w-]+)'),
 }
+RULE_META_REGEX = re.compile(r'[.^$*+?{}\[\]\\|()]')  # a rule pattern without these is a plain substring
+RULE_BACKREF_REGEX = re.compile(r'\\\d|\(\?P=')
 TIMESTAMP_REGEX = re.compile(r'^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}[,\.]\d{3,6})?Z?\b')
+TREE_WINDOW_ROWS = 400  # records materialized as Treeview rows around the view
+TREE_EDGE_ROWS = 60  # re-window when the view gets this close to an edge of the materialized rows
+TAIL_BLOCK_BYTES = 1024 * 1024  # one read() of the tailed file
+TAIL_EMIT_INTERVAL = 0.25  # at most one batch of tailed lines per interval reaches the Tk queue
+TAIL_POLL_INTERVAL = 0.1  # sleep at end of file
 
 # --- Helper Functions ---
 
@@ -95,14 +156,19 @@ def get_tags_for_record(record, state):
     if record in state['bookmarks']: tags.append(TAG_BOOKMARK)
     
     # Custom highlight tags
-    for i, rule in enumerate(state.get('highlights', [])):
-        try:
-            if re.search(rule['pattern'], record, re.IGNORECASE if rule.get('case_insensitive', True) else 0):
-                tags.append(f"custom_highlight_{i}")
-        except re.error:
-            continue # Ignore invalid regex in rules
+    if state.get('highlights'):
+        tags.extend(f"custom_highlight_{i}" for i in _rule_matcher(state, 'highlights').matches(record))
     return tuple(tags)
 
+def _rule_matcher(state, key):
+    """Compiled form of state[key] ('highlights' or 'alerts'), rebuilt when that list is replaced or edited."""
+    matcher = state.get(f'{key}_matcher')
+    rules = state.get(key, [])
+    if matcher is None or matcher.rules is not rules or matcher.rule_count != len(rules):
+        matcher = RuleMatcher(rules)
+        state[f'{key}_matcher'] = matcher
+    return matcher
+
 def _save_setting(state, key, value):
     state['settings'][key] = value
 
@@ -111,6 +177,7 @@ def _stop_tailing_thread(state):
         state['stop_tailing'].set()
         state['tail_thread'].join(timeout=1)
     state['tailed_file_path'] = None
+    state['tail_rate'] = 0.0
 
 def close_record(state):
     state['app'].record_active = False
@@ -137,36 +204,94 @@ def close_record(state):
     state['app'].log_root = None
 
 def _alerting_engine(state, line):
+    if not state['alerts']: return
     now = time.time()
-    for i, rule in enumerate(state['alerts']):
+    alerts = _rule_matcher(state, 'alerts')
+    for i in alerts.matches(line):
         try:
-            if re.search(rule['pattern'], line, re.IGNORECASE if rule.get('case_insensitive', True) else 0):
-                history = state['alert_history'][i]
-                history.append(now)
-                while history and now - history[0] > rule['window']:
-                    history.popleft()
-                if len(history) >= rule['threshold']:
-                    state['queue'].put({'type': 'alert_triggered', 'rule_name': rule['name']})
-                    history.clear() # Reset after triggering
-        except (re.error, KeyError, TypeError):
+            rule = alerts.rules[i]
+            history = state['alert_history'][i]
+            history.append(now)
+            while history and now - history[0] > rule['window']:
+                history.popleft()
+            if len(history) >= rule['threshold']:
+                state['queue'].put({'type': 'alert_triggered', 'rule_name': rule['name']})
+                history.clear() # Reset after triggering
+        except (KeyError, TypeError, IndexError):
             continue # Ignore broken rules
 
 def _tail_log_file(state, file_path):
+    """
+    Follow file_path like `tail -F`: read big binary blocks, split complete lines in bulk, and post them
+    to the queue in batches, at most one per TAIL_EMIT_INTERVAL. The file is reopened from the start
+    when it is replaced (rotation: another inode) and re-read from the start when it shrinks (truncation).
+    A batch never mixes lines from before and after such a reopen; 'reopened' marks the first batch after it.
+    """
     state['tailed_file_path'] = file_path
     state['stop_tailing'].clear()
+    stop_event = state['stop_tailing']
+    f = None
+    batch = []
+    reopened = None
+    last_emit, last_rate = time.monotonic(), 0.0
+
+    def emit(now):
+        nonlocal batch, reopened, last_emit, last_rate
+        for line in batch:
+            _alerting_engine(state, line)
+        last_rate = len(batch) / max(now - last_emit, 1e-6)
+        state['queue'].put({'type': 'new_log_lines', 'lines': batch, 'rate': last_rate, 'reopened': reopened})
+        batch, reopened, last_emit = [], None, now
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            f.seek(0, 2) # Go to the end of the file
-            while not state['stop_tailing'].is_set():
-                line = f.readline()
-                if not line:
-                    time.sleep(0.1)
-                    continue
-                stripped_line = line.strip()
-                state['queue'].put({'type': 'new_log_lines', 'lines': [stripped_line]})
-                _alerting_engine(state, stripped_line)
+        f = open(file_path, 'rb')
+        f.seek(0, 2)  # Go to the end of the file
+        file_id = (os.fstat(f.fileno()).st_dev, os.fstat(f.fileno()).st_ino)
+        partial = b''
+        while not stop_event.is_set():
+            block = f.read(TAIL_BLOCK_BYTES)
+            if block:
+                data = partial + block
+                cut = data.rfind(b'\n') + 1
+                partial = data[cut:]
+                if cut:
+                    batch.extend(line.strip() for line in data[:cut].decode('utf-8', errors='replace').split('\n')[:-1])
+            now = time.monotonic()
+            # an empty batch still goes out once, so the shown rate drops to 0 when the file goes quiet
+            if (batch or reopened or last_rate) and now - last_emit >= TAIL_EMIT_INTERVAL:
+                emit(now)
+            if block:
+                continue
+
+            # at the end of the file: was it rotated or truncated?
+            try:
+                stat_info = os.stat(file_path)
+            except OSError:
+                # between the rename of the old file and the creation of the new one
+                stop_event.wait(TAIL_POLL_INTERVAL)
+                continue
+            if (stat_info.st_dev, stat_info.st_ino) != file_id:
+                if partial:
+                    batch.append(partial.decode('utf-8', errors='replace').strip())
+                if batch:
+                    emit(time.monotonic())
+                f.close()
+                f = open(file_path, 'rb')
+                file_id = (os.fstat(f.fileno()).st_dev, os.fstat(f.fileno()).st_ino)
+                partial, reopened = b'', 'rotated'
+                continue
+            if stat_info.st_size < f.tell():
+                if batch:
+                    emit(time.monotonic())
+                f.seek(0)
+                partial, reopened = b'', 'truncated'
+                continue
+            stop_event.wait(TAIL_POLL_INTERVAL)
     except Exception as e:
         state['queue'].put({'type': 'tail_error', 'error': str(e)})
+    finally:
+        if f is not None:
+            f.close()
 
 def open_and_tail_log(state):
     file_path = filedialog.askopenfilename(title="Select Log File to Tail", filetypes=[("Log files", "*.log"), ("Text files", "*.txt"), ("All files", "*.*")] )
@@ -221,10 +346,11 @@ def clear_all_logs(state):
 
 def update_status_bar(state, text):
     if state.get('tailed_file_path'):
-        text += f" | Tailing: {os.path.basename(state['tailed_file_path'])}"
+        text += f" | Tailing: {os.path.basename(state['tailed_file_path'])} ({state.get('tail_rate', 0.0):,.0f} lines/s)"
     state['status_bar'].config(text=text)
 
-def _background_filter(q, all_logs, filter_options, original_log_count):
+def _background_filter(q, all_logs, filter_options, original_log_count, append=False):
+    """Filter all_logs (with append: only the records added since the last filter) and post the result."""
     display_list = all_logs
     active_qf_levels = filter_options['active_qf_levels']
     if active_qf_levels:
@@ -267,7 +393,8 @@ def _background_filter(q, all_logs, filter_options, original_log_count):
         'filter_term': filter_term, 
         'filter_re': filter_re,
         'original_log_count': original_log_count,
-        'is_valid_regex': is_valid_regex
+        'is_valid_regex': is_valid_regex,
+        'append': append
     })
 
 def _parse_timestamp(line, state):
@@ -292,9 +419,11 @@ def _parse_timestamp(line, state):
     except (ValueError, IndexError):
         return None
 
-def _preprocess_logs(logs, state):
+def _preprocess_logs(logs, state, append=False):
     processed_logs = []
-    last_ts = None
+    # appended records continue the time deltas of the rendered ones
+    last_ts = state.get('render_last_ts') if append else None
+    state['render_ends_in_trace'] = False
 
     # Stack trace folding
     folding_mode = state['stack_trace_folding_mode_var'].get()
@@ -325,6 +454,8 @@ def _preprocess_logs(logs, state):
                 in_trace = False
                 temp_logs.append((line, []))
         if trace_buffer:
+            # the trace may go on in the next records: those need a full rebuild to fold it correctly
+            state['render_ends_in_trace'] = True
             if folding_mode == 'Compact' and len(trace_buffer) > 2:
                 summary = trace_buffer[0]
                 details = ["  ...", trace_buffer[-1]]
@@ -357,31 +488,156 @@ def _preprocess_logs(logs, state):
                 delta_str = "<PARSE ERROR>"
 
         processed_logs.append((delta_str, delta_tag, summary, details))
-    
+
+    state['render_last_ts'] = last_ts
     return processed_logs
 
-def _render_logs_treeview(state, processed_logs):
+def _render_logs_treeview(state, processed_logs, append=False):
+    """
+    Virtual list: the processed records are kept in state['tree_rows'] and only a window of TREE_WINDOW_ROWS
+    of them around the view exists as Treeview rows; the scrollbar describes all of them.
+    """
+    if append:
+        _tree_append(state, processed_logs)
+    else:
+        state['tree_rows'] = list(processed_logs)
+        state['current_search_iid'] = None
+        _tree_materialize(state, 0)
+
+def _tree_iid(index):
+    return f"item_{index}"
+
+def _tree_index(iid):
+    """Record index of a row iid, or None for the detail rows of a folded trace."""
+    return int(iid[5:]) if iid.startswith("item_") else None
+
+def _tree_insert_row(state, index):
+    delta, delta_tag, summary, details = state['tree_rows'][index]
+    iid = _tree_iid(index)
+    tags = get_tags_for_record(summary, state)
+    row_tag = (TAG_ODD_ROW,) if index % 2 else (TAG_EVEN_ROW,)
+    all_tags = tags + row_tag + ((delta_tag,) if delta_tag else ())
+    if iid == state.get('current_search_iid'): all_tags += (TAG_CURRENT_SEARCH,)
     log_tree = state['log_tree']
+    log_tree.insert("", tk.END, iid=iid, values=(delta, summary), tags=all_tags, open=False)
+    for detail_line in details:
+        log_tree.insert(iid, tk.END, values=("", detail_line), tags=row_tag)
+
+def _tree_materialize(state, first, top=None):
+    """Replace the Treeview rows by the records [first, first + TREE_WINDOW_ROWS) and scroll top to the top."""
+    log_tree, rows = state['log_tree'], state['tree_rows']
+    first = max(0, min(first, len(rows) - TREE_WINDOW_ROWS))
+    last = min(len(rows), first + TREE_WINDOW_ROWS)
+    selection = log_tree.selection()
     log_tree.delete(*log_tree.get_children())
-    for i, (delta, delta_tag, summary, details) in enumerate(processed_logs):
-        tags = get_tags_for_record(summary, state)
-        row_tag = (TAG_ODD_ROW,) if i % 2 else (TAG_EVEN_ROW,)
-        all_tags = tags + row_tag + ((delta_tag,) if delta_tag else ())
-        parent_iid = log_tree.insert("", tk.END, iid=f"item_{i}", values=(delta, summary), tags=all_tags, open=False)
-        if details:
-            for detail_line in details:
-                log_tree.insert(parent_iid, tk.END, values=("", detail_line), tags=row_tag)
+    for index in range(first, last):
+        _tree_insert_row(state, index)
+    state['tree_window'] = (first, last)
+    kept = [iid for iid in selection if iid.startswith("item_") and first <= _tree_index(iid) < last]
+    if kept: log_tree.selection_set(kept)
+    if last > first:
+        top = first if top is None else max(first, min(top, last - 1))
+        log_tree.yview_moveto((top - first) / (last - first))
+    _tree_update_scrollbar(state)
+
+def _tree_append(state, processed_logs):
+    rows = state['tree_rows']
+    first, last = state['tree_window']
+    old_count = len(rows)
+    rows.extend(processed_logs)
+    # the window grows with new records while it reaches the end and has room
+    if last == old_count:
+        new_last = min(len(rows), first + TREE_WINDOW_ROWS)
+        for index in range(last, new_last):
+            _tree_insert_row(state, index)
+        state['tree_window'] = (first, new_last)
+    _tree_update_scrollbar(state)
+
+def _tree_top_row(state):
+    first, last = state['tree_window']
+    return first + int(state['log_tree'].yview()[0] * (last - first))
+
+def _tree_bottom_row(state):
+    first, last = state['tree_window']
+    return first + int(state['log_tree'].yview()[1] * (last - first))
+
+def _tree_update_scrollbar(state):
+    total = max(1, len(state['tree_rows']))
+    try:
+        first, last = state['tree_window']
+        view_first, view_last = state['log_tree'].yview()
+        state['tree_scrollbar'].set((first + view_first * (last - first)) / total, (first + view_last * (last - first)) / total)
+    except (tk.TclError, KeyError):
+        pass
+
+def _tree_on_view_changed(state, *view):
+    """yscrollcommand of the Treeview: map the window onto all records and re-window near its edges."""
+    _tree_update_scrollbar(state)
+    if state.get('tree_repage_pending') or 'tree_window' not in state:
+        return
+    first, last = state['tree_window']
+    near_top = first > 0 and _tree_top_row(state) - first < TREE_EDGE_ROWS
+    near_bottom = last < len(state['tree_rows']) and last - _tree_bottom_row(state) < TREE_EDGE_ROWS
+    if near_top or near_bottom:
+        state['tree_repage_pending'] = True
+        state['log_root'].after_idle(lambda: _tree_repage(state))
+
+def _tree_repage(state):
+    state['tree_repage_pending'] = False
+    top = _tree_top_row(state)
+    _tree_materialize(state, top - TREE_WINDOW_ROWS // 2, top)
+
+def _tree_on_scrollbar(state, *scroll_args):
+    """Scrollbar command: 'moveto' jumps through all records, unit/page scrolls move the Treeview itself."""
+    if not scroll_args or 'tree_window' not in state:
+        return
+    if scroll_args[0] == 'moveto':
+        index = int(float(scroll_args[1]) * len(state['tree_rows']))
+        _tree_materialize(state, index - TREE_WINDOW_ROWS // 2, index)
+    else:
+        state['log_tree'].yview(*scroll_args)
+
+def _tree_show_record(state, index, select=False):
+    """Bring record index into view (re-windowing if it is not materialized) and optionally select it."""
+    rows = state.get('tree_rows', [])
+    if not rows: return
+    index = max(0, min(index, len(rows) - 1))
+    first, last = state['tree_window']
+    if not first <= index < last:
+        _tree_materialize(state, index - TREE_WINDOW_ROWS // 2, index)
+    iid = _tree_iid(index)
+    if select: state['log_tree'].selection_set(iid)
+    state['log_tree'].see(iid)
+
+def _tree_set_current_search(state, iid):
+    log_tree = state['log_tree']
+    for marked in (state.get('current_search_iid'), iid):
+        if marked and log_tree.exists(marked):
+            tags = [tag for tag in log_tree.item(marked, 'tags') if tag != TAG_CURRENT_SEARCH]
+            if marked == iid: tags.append(TAG_CURRENT_SEARCH)
+            log_tree.item(marked, tags=tags)
+    state['current_search_iid'] = iid
 
-def _render_logs_textview(state, display_list, filter_term, filter_re):
+def _tree_visible_records(state):
+    return [row[2] for row in state.get('tree_rows', [])]
+
+def _render_logs_textview(state, display_list, filter_term, filter_re, append=False):
     record_tb = state['record_tb']
     record_tb.configure(state=tk.NORMAL)
-    record_tb.delete('1.0', tk.END)
-    
+    if not append:
+        record_tb.delete('1.0', tk.END)
+        state['rendered_rows'], state['rendered_lines'] = 0, 0
+
     case_sensitive_filter = state['filter_case_var'].get()
     is_regex_filter = state['filter_regex_var'].get()
 
-    for i, record in enumerate(display_list):
-        line_start_index = record_tb.index("end-1c")
+    # records are written top to bottom, so their line numbers are tracked here instead of asking Tk
+    line_number = state['rendered_lines'] + 1
+    first_row = state['rendered_rows']
+    state['rendered_rows'] += len(display_list)
+    for i, record in enumerate(display_list, first_row):
+        record_line = line_number
+        line_number += record.count('\n') + 1
         tags = get_tags_for_record(record, state)
         row_tag = (TAG_ODD_ROW,) if i % 2 else (TAG_EVEN_ROW,)
         record_tb.insert(tk.END, record + '\n', tags + row_tag)
@@ -389,47 +645,56 @@ def _render_logs_textview(state, display_list, filter_term, filter_re):
         if not filter_term: continue
 
         if is_regex_filter and filter_re:
-            for match in filter_re.finditer(record):
-                start = f"{line_start_index}+{match.start()}c"; end = f"{line_start_index}+{match.end()}c"
-                record_tb.tag_add(TAG_FILTER_MATCH, start, end)
+            match_spans = [match.span() for match in filter_re.finditer(record)]
         elif not is_regex_filter:
-            term_to_find = filter_term if case_sensitive_filter else filter_term.lower()
-            record_to_search = record if case_sensitive_filter else record.lower()
-            start_char = 0
-            while True:
-                start_char = record_to_search.find(term_to_find, start_char)
-                if start_char == -1: break
-                end_char = start_char + len(term_to_find)
-                start = f"{line_start_index}+{start_char}c"; end = f"{line_start_index}+{end_char}c"
+            match_spans = SearchService.find_all_offsets(record, filter_term, case_sensitive=case_sensitive_filter, whole_word=False)
+        else:
+            continue
+        if match_spans:
+            for start, end in LineOffsetTable.from_text(record, record_line).spans_to_indices(match_spans):
                 record_tb.tag_add(TAG_FILTER_MATCH, start, end)
-                start_char = end_char
-                
+
+    state['rendered_lines'] = line_number - 1
     record_tb.configure(state=tk.DISABLED)
 
-def _render_view(state, display_list, filter_term, filter_re):
+def _render_view(state, display_list, filter_term, filter_re, append=False):
+    """Render display_list; with append, add it below the rows already shown instead of replacing them."""
     try:
-        processed_logs = _preprocess_logs(display_list, state)
+        processed_logs = _preprocess_logs(display_list, state, append)
         if state['use_virtual_view_var'].get():
-            _render_logs_treeview(state, processed_logs)
+            _render_logs_treeview(state, processed_logs, append)
         else:
             # Flatten for text view
             flat_logs = []
             for delta, delta_tag, summary, details in processed_logs:
                 flat_logs.append(summary)
                 flat_logs.extend(details)
-            _render_logs_textview(state, flat_logs, filter_term, filter_re)
+            _render_logs_textview(state, flat_logs, filter_term, filter_re, append)
 
         if state['auto_scroll_var'].get():
             if state['use_virtual_view_var'].get():
-                children = state['log_tree'].get_children()
-                if children: state['log_tree'].see(children[-1])
+                _tree_show_record(state, len(state['tree_rows']) - 1)
             else:
                 state['record_tb'].see(tk.END)
     except Exception as e:
         try: state['app'].record_list.append(f"> [LOGS_TOOL_ERROR] - Rendering failed: {e}")
         except Exception: pass
 
-def update_content(state, force_update=False, clear_only=False):
+def _view_signature(state, filter_options):
+    """Everything that decides which records are shown and how; a change means the view must be rebuilt."""
+    return (filter_options['filter_term'], filter_options['is_regex'], filter_options['is_case'],
+            tuple(filter_options['active_qf_levels']), state['use_virtual_view_var'].get(),
+            state['fold_stack_traces_var'].get(), state['stack_trace_folding_mode_var'].get(),
+            state['show_time_deltas_var'].get(), state['time_delta_units_var'].get(),
+            state['time_delta_warn_var'].get(), state['time_delta_crit_var'].get(), state['timestamp_format_var'].get())
+
+def update_content(state, force_update=False, clear_only=False, rebuild=False):
+    """
+    Refresh the view. While the filter options stay the same and records were only appended to the record
+    list, only the records from sequence number state['filter_cursor'] on are filtered and appended to the view;
+    otherwise (or with rebuild, or once records it shows were dropped from the bounded record list) the records
+    in memory are filtered and rendered again.
+    """
     app = state['app']
     if (state['is_paused_var'].get() and not force_update) or not getattr(app, 'record_active', False):
         return
@@ -437,7 +702,8 @@ def update_content(state, force_update=False, clear_only=False):
     if state.get('update_running', False):
         return
 
-    current_log_count = len(app.record_list)
+    records = app.record_list
+    current_log_count = records.next_seq
     if not force_update and not clear_only and current_log_count == state['last_log_count'] and not state['tailed_file_path']:
         if getattr(app, 'record_active', False) and not state['is_paused_var'].get():
             state['log_root'].after(1000, lambda: update_content(state))
@@ -447,14 +713,15 @@ def update_content(state, force_update=False, clear_only=False):
     
     if clear_only:
         _render_view(state, [], "", None)
-        state['last_log_count'] = 0
+        _update_statistics(state, [])
+        state['last_log_count'] = current_log_count
+        state['filter_cursor'], state['filter_first_seq'] = 0, None
         update_status_bar(state, f" Showing 0 of 0 logs")
         state['update_running'] = False
         if getattr(app, 'record_active', False) and not state['is_paused_var'].get():
             state['log_root'].after(1000, lambda: update_content(state))
         return
 
-    update_status_bar(state, "Filtering...")
     filter_options = {
         'active_qf_levels': [],
         'filter_term': state['filter_entry'].get().strip(),
@@ -465,20 +732,38 @@ def update_content(state, force_update=False, clear_only=False):
     if state['qf_warning_var'].get(): filter_options['active_qf_levels'].append("[WARNING]")
     if state['qf_debug_var'].get(): filter_options['active_qf_levels'].append("[DEBUG]")
 
-    all_logs_copy = app.record_list[:]
+    signature = _view_signature(state, filter_options)
+    cursor, first_seq = state.get('filter_cursor', 0), state.get('filter_first_seq')
+    # appended only: every record the view was built from is still in the record list
+    append = (not rebuild and signature == state.get('filter_signature') and first_seq is not None
+              and records.first_seq <= first_seq <= cursor <= current_log_count
+              and not state.get('render_ends_in_trace'))
+    if append and cursor == current_log_count:
+        # nothing new to filter (e.g. a tail batch that only updates the rate)
+        status = f" Showing {state['filter_stats']['Total']} of {len(records)} logs"
+        if state['is_paused_var'].get(): status += " | PAUSED"
+        update_status_bar(state, status)
+        state['update_running'] = False
+        if getattr(app, 'record_active', False) and not state['is_paused_var'].get() and not state['tailed_file_path']:
+            state['log_root'].after(1000, lambda: update_content(state))
+        return
+
+    update_status_bar(state, "Filtering...")
+    state['filter_signature'] = signature
+    start, logs_copy = records.slice_since(cursor if append else 0)
+    if not append: state['filter_first_seq'] = start
+    current_log_count = start + len(logs_copy)
+    state['filter_cursor'] = current_log_count
     threading.Thread(
         target=_background_filter,
-        args=(state['queue'], all_logs_copy, filter_options, current_log_count),
+        args=(state['queue'], logs_copy, filter_options, current_log_count, append),
         daemon=True
     ).start()
 
 def clear_search_state(state):
     if state['use_virtual_view_var'].get():
-        for iid in state['search_matches']:
-            try:
-                tags = list(state['log_tree'].item(iid, 'tags'))
-                if TAG_CURRENT_SEARCH in tags: tags.remove(TAG_CURRENT_SEARCH); state['log_tree'].item(iid, tags=tags)
-            except tk.TclError: pass
+        try: _tree_set_current_search(state, None)
+        except tk.TclError: pass
     else:
         state['record_tb'].tag_remove(TAG_SEARCH_MATCH, '1.0', tk.END)
         state['record_tb'].tag_remove(TAG_CURRENT_SEARCH, '1.0', tk.END)
@@ -489,7 +774,8 @@ def clear_search_state(state):
     state['find_next_btn'].config(state=tk.DISABLED)
     state['find_prev_btn'].config(state=tk.DISABLED)
 
-def _background_search(q, use_virtual, view_items, search_term, is_regex, is_case, highlight_all):
+def _background_search(q, use_virtual, view_rows, search_term, is_regex, is_case, highlight_all):
+    view_items = ((_tree_iid(i), row[2]) for i, row in enumerate(view_rows))
     search_matches = []
     is_valid_regex = True
     try:
@@ -537,10 +823,10 @@ def search_logs(state, event=None):
     use_virtual = state['use_virtual_view_var'].get()
 
     if use_virtual:
-        view_items = [(iid, state['log_tree'].item(iid, 'values')[1]) for iid in state['log_tree'].get_children()]
+        view_rows = list(state.get('tree_rows', []))
         threading.Thread(
             target=_background_search,
-            args=(state['queue'], use_virtual, view_items, search_term, state['search_regex_var'].get(), state['search_case_var'].get(), state['search_highlight_all_var'].get()),
+            args=(state['queue'], use_virtual, view_rows, search_term, state['search_regex_var'].get(), state['search_case_var'].get(), state['search_highlight_all_var'].get()),
             daemon=True
         ).start()
     else:
@@ -550,13 +836,8 @@ def highlight_current_match(state):
     if state['current_match_index'] == -1: return
     current_match = state['search_matches'][state['current_match_index']]
     if state['use_virtual_view_var'].get():
-        for iid in state['log_tree'].get_children():
-             tags = list(state['log_tree'].item(iid, 'tags'))
-             if TAG_CURRENT_SEARCH in tags: tags.remove(TAG_CURRENT_SEARCH); state['log_tree'].item(iid, tags=tags)
-        tags = list(state['log_tree'].item(current_match, 'tags'))
-        if TAG_CURRENT_SEARCH not in tags: tags.append(TAG_CURRENT_SEARCH)
-        state['log_tree'].item(current_match, tags=tags)
-        state['log_tree'].selection_set(current_match); state['log_tree'].see(current_match)
+        _tree_set_current_search(state, current_match)
+        _tree_show_record(state, _tree_index(current_match), select=True)
     else:
         record_tb = state['record_tb']
         record_tb.tag_remove(TAG_CURRENT_SEARCH, '1.0', tk.END)
@@ -589,10 +870,8 @@ def go_to_line(state):
     if not line_num_str or not line_num_str.isdigit(): return
     line_num = int(line_num_str)
     if state['use_virtual_view_var'].get():
-        all_visible_items = state['log_tree'].get_children()
-        if 0 < line_num <= len(all_visible_items):
-            target_iid = all_visible_items[line_num - 1]
-            state['log_tree'].selection_set(target_iid); state['log_tree'].see(target_iid)
+        if 0 < line_num <= len(state.get('tree_rows', [])):
+            _tree_show_record(state, line_num - 1, select=True)
         else: messagebox.showwarning("Go to Line", f"Line {line_num} does not exist in the current view.", parent=state['log_root'])
     else:
         record_tb = state['record_tb']
@@ -609,7 +888,7 @@ def toggle_pause(state):
     state['pause_button'].config(text="Resume" if is_paused else "Pause")
     if not is_paused:
         update_content(state, force_update=True)
-    visible_count = len(state['log_tree'].get_children()) if state['use_virtual_view_var'].get() else len(state['record_tb'].get("1.0", tk.END).strip().split('\n'))
+    visible_count = len(state.get('tree_rows', [])) if state['use_virtual_view_var'].get() else len(state['record_tb'].get("1.0", tk.END).strip().split('\n'))
     status = f" Showing {visible_count} of {len(state['app'].record_list)} logs"
     if is_paused: status += " | PAUSED"
     update_status_bar(state, status)
@@ -849,7 +1128,7 @@ def toggle_bookmark(state, record):
         del state['bookmarks'][record]
     else:
         state['bookmarks'][record] = "" # Add with empty note
-    update_content(state, force_update=True)
+    update_content(state, force_update=True, rebuild=True)
     _update_bookmark_list(state)
 
 def _update_bookmark_list(state):
@@ -868,10 +1147,9 @@ def _jump_to_bookmark(state, event):
     bookmark_text = b_tree.item(selection[0], 'values')[1]
     
     # Find the item in the main log view
-    for iid in state['log_tree'].get_children():
-        if state['log_tree'].item(iid, 'values')[1] == bookmark_text:
-            state['log_tree'].selection_set(iid)
-            state['log_tree'].see(iid)
+    for index, row in enumerate(state.get('tree_rows', [])):
+        if row[2] == bookmark_text:
+            _tree_show_record(state, index, select=True)
             return
 
 def _show_bookmark_note(state, event):
@@ -915,9 +1193,7 @@ def navigate_bookmarks(state, direction):
     
     visible_bookmarks = []
     if state['use_virtual_view_var'].get():
-        for iid in view.get_children():
-            if view.item(iid, 'values')[1] in state['bookmarks']:
-                visible_bookmarks.append(iid)
+        visible_bookmarks = [_tree_iid(index) for index, row in enumerate(state.get('tree_rows', [])) if row[2] in state['bookmarks']]
     else:
         ranges = view.tag_ranges(TAG_BOOKMARK)
         for i in range(0, len(ranges), 2):
@@ -941,8 +1217,7 @@ def navigate_bookmarks(state, direction):
     target_item = visible_bookmarks[next_index]
     
     if state['use_virtual_view_var'].get():
-        view.selection_set(target_item)
-        view.see(target_item)
+        _tree_show_record(state, _tree_index(target_item), select=True)
     else:
         view.see(f"{target_item}.0")
         view.mark_set(tk.INSERT, f"{target_item}.0")
@@ -1012,7 +1287,7 @@ def _parse_and_show_table(state):
             return
 
         parsed_data = []
-        visible_logs = [state['log_tree'].item(iid, 'values')[1] for iid in state['log_tree'].get_children()] if state['use_virtual_view_var'].get() else state['record_tb'].get('1.0', tk.END).splitlines()
+        visible_logs = _tree_visible_records(state) if state['use_virtual_view_var'].get() else state['record_tb'].get('1.0', tk.END).splitlines()
         
         for line in visible_logs:
             match = pattern.search(line)
@@ -1058,7 +1333,7 @@ def _manage_json_rules(state, file, title):
                         state['record_tb'].tag_configure(tag_name, background=color)
                 elif key == 'alerts':
                     state['alert_history'] = [deque() for _ in state['alerts']]
-                update_content(state, force_update=True)
+                update_content(state, force_update=True, rebuild=True)
                 win.destroy()
             else:
                 messagebox.showerror("Error", f"{key.capitalize()} must be a JSON list of objects.", parent=win)
@@ -1068,8 +1343,11 @@ def _manage_json_rules(state, file, title):
     save_button = ttk.Button(win, text="Save and Close", command=_save_rules_from_text)
     save_button.pack(pady=5)
 
-def _update_statistics(state, display_list):
-    stats = {'Total': len(display_list), 'Errors': 0, 'Warnings': 0, 'Debug': 0}
+def _update_statistics(state, display_list, append=False):
+    if not append or 'filter_stats' not in state:
+        state['filter_stats'] = {'Total': 0, 'Errors': 0, 'Warnings': 0, 'Debug': 0}
+    stats = state['filter_stats']
+    stats['Total'] += len(display_list)
     for record in display_list:
         if "[ERROR]" in record or "[CRITICAL]" in record: stats['Errors'] += 1
         if "[WARNING]" in record: stats['Warnings'] += 1
@@ -1090,7 +1368,7 @@ def show_log_context_menu(state, event):
         menu.add_separator()
 
     menu.add_command(label="Copy", command=lambda: state['log_root'].event_generate("<<Copy>>"))
-    menu.add_command(label="Copy All Visible", command=lambda: state['app'].clipboard_append('\n'.join([state['log_tree'].item(iid, 'values')[1] for iid in state['log_tree'].get_children()]))) # Simplified for brevity
+    menu.add_command(label="Copy All Visible", command=lambda: state['app'].clipboard_append('\n'.join(_tree_visible_records(state) if state['use_virtual_view_var'].get() else state['record_tb'].get('1.0', 'end-1c').splitlines())))
     
     try: menu.tk_popup(event.x_root, event.y_root)
     finally: menu.grab_release()
@@ -1100,11 +1378,13 @@ def _process_queue(state):
         while not state['queue'].empty():
             msg = state['queue'].get_nowait()
             if msg['type'] == 'filter_result':
-                _render_view(state, msg['display_list'], msg['filter_term'], msg['filter_re'])
-                _update_statistics(state, msg['display_list'])
-                _update_bookmark_list(state)
+                append = msg.get('append', False)
+                _render_view(state, msg['display_list'], msg['filter_term'], msg['filter_re'], append)
+                _update_statistics(state, msg['display_list'], append)
+                if not append:
+                    _update_bookmark_list(state)
                 state['last_log_count'] = msg['original_log_count']
-                status = f" Showing {len(msg['display_list'])} of {len(state['app'].record_list)} logs"
+                status = f" Showing {state['filter_stats']['Total']} of {len(state['app'].record_list)} logs"
                 if state['is_paused_var'].get(): status += " | PAUSED"
                 update_status_bar(state, status)
                 state['filter_entry'].config(background='white' if msg['is_valid_regex'] else 'pink')
@@ -1128,22 +1408,27 @@ def _process_queue(state):
                 is_regex = state['search_regex_var'].get()
                 try:
                     record_tb.configure(state=tk.NORMAL)
-                    start_pos = '1.0'
-                    while True:
-                        res = record_tb.search(search_term, start_pos, stopindex=tk.END, nocase=not is_case, regexp=is_regex, count=tk.Variable())
-                        if not res: break
-                        end_pos = f"{res}+{res.getvar(str(res))}c"
-                        search_matches.append((res, end_pos))
-                        if state['search_highlight_all_var'].get(): record_tb.tag_add(TAG_SEARCH_MATCH, res, end_pos)
-                        start_pos = end_pos
+                    if is_regex: re.compile(search_term)
+                    # one read of the view, matched in Python and converted to line.col indices in one pass
+                    view_text = record_tb.get('1.0', 'end-1c')
+                    match_spans = [span for span in SearchService.find_all_offsets(
+                        view_text, search_term, case_sensitive=is_case, whole_word=False, regex=is_regex) if span[1] > span[0]]
+                    search_matches = LineOffsetTable.from_text(view_text).spans_to_indices(match_spans)
+                    if state['search_highlight_all_var'].get():
+                        for start_pos, end_pos in search_matches:
+                            record_tb.tag_add(TAG_SEARCH_MATCH, start_pos, end_pos)
                     state['search_entry'].config(background='white')
                     state['queue'].put({'type': 'search_result', 'search_matches': search_matches, 'is_valid_regex': True})
-                except tk.TclError:
+                except (tk.TclError, re.error):
                     state['queue'].put({'type': 'search_result', 'search_matches': [], 'is_valid_regex': False})
                 finally:
                     record_tb.configure(state=tk.DISABLED)
             elif msg['type'] == 'new_log_lines':
+                if msg.get('reopened'):
+                    # the batch holds only lines read after the reopen, so the marker goes first
+                    state['app'].record_list.append(f"--- {os.path.basename(state['tailed_file_path'] or '')} {msg['reopened']}, reading from its start ---")
                 state['app'].record_list.extend(msg['lines'])
+                state['tail_rate'] = msg.get('rate', 0.0)
                 if not state['is_paused_var'].get():
                     update_content(state, force_update=True)
             elif msg['type'] == 'tail_error':
@@ -1194,7 +1479,8 @@ def open_record_logs(app):
         'stats_labels': {},
         'tail_thread': None,
         'stop_tailing': threading.Event(),
-        'tailed_file_path': None
+        'tailed_file_path': None,
+        'tail_rate': 0.0
     }
 
     state['log_font'] = tkfont.Font(family="arial", size=settings.get('font_size', 10))
@@ -1231,10 +1517,12 @@ def open_record_logs(app):
     log_tree = ttk.Treeview(tree_frame, columns=('delta', 'log'), show='headings')
     log_tree.heading('delta', text='Delta'); log_tree.column('delta', width=80, stretch=tk.NO)
     log_tree.heading('log', text='Log Entry')
-    tree_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=log_tree.yview)
-    log_tree.configure(yscrollcommand=tree_scrollbar.set); log_tree.grid(row=0, column=0, sticky='nsew'); tree_scrollbar.grid(row=0, column=1, sticky='ns')
+    # the scrollbar spans all records of the virtual list, not only the materialized rows
+    tree_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=lambda *a: _tree_on_scrollbar(state, *a))
+    log_tree.configure(yscrollcommand=lambda *v: _tree_on_view_changed(state, *v)); log_tree.grid(row=0, column=0, sticky='nsew'); tree_scrollbar.grid(row=0, column=1, sticky='ns')
     tree_frame.grid_rowconfigure(0, weight=1); tree_frame.grid_columnconfigure(0, weight=1); tree_frame.grid(row=0, column=0, sticky="nsew")
-    state.update({'style': style, 'tree_frame': tree_frame, 'log_tree': log_tree})
+    state.update({'style': style, 'tree_frame': tree_frame, 'log_tree': log_tree, 'tree_scrollbar': tree_scrollbar,
+                  'tree_rows': [], 'tree_window': (0, 0)})
 
     for view in (record_tb, log_tree):
         view.tag_configure(TAG_ERROR, foreground="red"); view.tag_configure(TAG_WARNING, foreground="orange")
@@ -1373,7 +1661,7 @@ def open_record_logs(app):
     display_sub_tab.grid_columnconfigure(0, weight=1)
     view_controls_frame = ttk.LabelFrame(display_sub_tab, text="Display Controls", padding=5); view_controls_frame.grid(row=0, column=0, sticky='ew')
     pause_button = ttk.Button(view_controls_frame, text="Pause", command=lambda: toggle_pause(state)); pause_button.pack(side=tk.LEFT, padx=(0,5)); state.update({'pause_button': pause_button}); Tooltip(pause_button, "Pause or resume the live log updates.")
-    refresh_button = ttk.Button(view_controls_frame, text="Refresh", command=lambda: update_content(state, force_update=True)); refresh_button.pack(side=tk.LEFT); Tooltip(refresh_button, "Manually force a refresh of the log view.")
+    refresh_button = ttk.Button(view_controls_frame, text="Refresh", command=lambda: update_content(state, force_update=True, rebuild=True)); refresh_button.pack(side=tk.LEFT); Tooltip(refresh_button, "Manually force a refresh of the log view.")
     font_size_frame = ttk.Frame(view_controls_frame); font_size_frame.pack(side=tk.RIGHT, padx=(10,0))
     ttk.Button(font_size_frame, text="A-", command=lambda: change_font_size(state, -1), width=3).pack(side=tk.LEFT)
     ttk.Button(font_size_frame, text="A+", command=lambda: change_font_size(state, 1), width=3).pack(side=tk.LEFT)
@@ -1414,8 +1702,8 @@ def open_record_logs(app):
     file_menu.add_command(label="Import Logs...", command=lambda: import_logs(state))
     file_menu.add_command(label="Open and Tail Log File...", command=lambda: open_and_tail_log(state))
     file_menu.add_separator()
-    file_menu.add_command(label='Save All Logs...', command=lambda: save_logs(state, lambda: '\n'.join(app.record_list), 'Save All Logs As'))
-    get_visible = lambda: '\n'.join([state['log_tree'].item(iid, 'values')[1] for iid in state['log_tree'].get_children()]) if state['use_virtual_view_var'].get() else record_tb.get('1.0', tk.END)
+    file_menu.add_command(label='Save All Logs...', command=lambda: save_logs(state, lambda: '\n'.join(app.record_list.slice_since(0, include_spilled=True)[1]), 'Save All Logs As'))
+    get_visible = lambda: '\n'.join(_tree_visible_records(state)) if state['use_virtual_view_var'].get() else record_tb.get('1.0', tk.END)
     file_menu.add_command(label='Save Visible Logs...', command=lambda: save_logs(state, get_visible, 'Save Visible Logs As'))
     file_menu.add_separator(); file_menu.add_command(label="Clear All Logs...", command=lambda: clear_all_logs(state)); file_menu.add_separator()
     file_menu.add_command(label='Close', command=lambda: close_record(state))
@@ -9,14 +9,18 @@ import threading
 import collections
 import json
 import os
-from pydub import AudioSegment
-from pydub.playback import play
 import hashlib
 import re
 import random
 from tkinter import filedialog
 import uuid
 
+from dependencies.lazy_imports import lazy_from
+
+# pydub is imported on first use (morse audio)
+AudioSegment = lazy_from('pydub', 'AudioSegment')
+play = lazy_from('pydub.playback', 'play')
+
 try:
     import lorem
 
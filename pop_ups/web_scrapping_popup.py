@@ -7,13 +7,15 @@ from tkinter import (
     Text, messagebox, simpledialog, filedialog, StringVar, BooleanVar, IntVar,
 )
 from typing import Any, Optional, List, Dict
-from bs4 import BeautifulSoup
 import webbrowser
 from urllib.parse import urlparse, urlsplit, urlunsplit, urljoin
 import csv
 import json
 
 from services.security_service import SecurityService
+from dependencies.lazy_imports import lazy_from
+
+BeautifulSoup = lazy_from('bs4', 'BeautifulSoup')  # imported on first parse
 
 
 def open_web_scrapping_popup(app: Any) -> None:
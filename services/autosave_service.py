@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+try:
+    from dependencies.universal_functions import get_time  # type: ignore
+except Exception:
+    from datetime import datetime as _dt
+
+    def get_time() -> str:
+        return _dt.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+@dataclass
+class AutoSaveService:
+    '''
+    Autosave scheduler for the main document.
+
+    'By pressing' no longer saves on every key release: edits (from the EditTrackingService) only
+    stamp the time, and one timer saves once typing pauses for idle_delay_ms, or at the latest
+    max_latency_ms after the first unsaved edit. 'By time' saves every interval_ms.
+    A save snapshots the buffer on the Tk thread, is skipped when DirtyStateService says the file
+    already holds it, and is handed to the FileWriterService (atomic, off the Tk thread, and
+    collapsed with other saves of the same file that are still queued).
+    '''
+    app: Any  # expects .EgonTE, .file_name, .auto_save_v, .autosave_by_p, .autosave_by_t, .after
+
+    idle_delay_ms: int = 2000
+    max_latency_ms: int = 30000
+    interval_ms: int = 300000
+
+    attached: bool = False
+    dirty_since: Optional[float] = None
+    last_edit: float = 0.0
+    edit_timer: Optional[str] = None
+    interval_timer: Optional[str] = None
+
+    # ---------- settings ----------
+    def enabled(self, method_variable: Any) -> bool:
+        try:
+            return bool(self.app.auto_save_v.get() and method_variable.get())
+        except Exception:
+            return False
+
+    def attach(self) -> None:
+        '''
+        Follow edits and (re)arm the timers for the current autosave settings; safe to call again after changes.
+        '''
+        if not self.attached:
+            try:
+                self.app._ensure_edit_tracking_service()
+                tracker = getattr(self.app, 'edit_tracking_service', None)
+                if tracker is not None and tracker.install():
+                    tracker.add_listener(self.on_edit)
+                    self.attached = True
+            except Exception:
+                pass
+        self.cancel_timer('interval_timer')
+        if self.enabled(self.app.autosave_by_t):
+            self.interval_timer = self.app.after(self.interval_ms, self.on_interval)
+        if not self.enabled(self.app.autosave_by_p):
+            self.cancel_timer('edit_timer')
+            self.dirty_since = None
+
+    def cancel_timer(self, attribute: str) -> None:
+        timer_id = getattr(self, attribute)
+        if timer_id is not None:
+            try:
+                self.app.after_cancel(timer_id)
+            except Exception:
+                pass
+            setattr(self, attribute, None)
+
+    # ---------- scheduling ----------
+    def on_edit(self, edit: Any = None) -> None:
+        '''
+        Called for every edit: O(1), no timer churn while typing.
+        '''
+        if not self.enabled(self.app.autosave_by_p):
+            return
+        self.last_edit = time.monotonic()
+        if self.dirty_since is None:
+            self.dirty_since = self.last_edit
+        if self.edit_timer is None:
+            self.edit_timer = self.app.after(self.idle_delay_ms, self.on_edit_timer)
+
+    def on_edit_timer(self) -> None:
+        self.edit_timer = None
+        if self.dirty_since is None:
+            return
+        now = time.monotonic()
+        idle_left = self.idle_delay_ms / 1000 - (now - self.last_edit)
+        latency_left = self.max_latency_ms / 1000 - (now - self.dirty_since)
+        if idle_left > 0 and latency_left > 0:
+            self.edit_timer = self.app.after(int(min(idle_left, latency_left) * 1000) + 1, self.on_edit_timer)
+            return
+        self.dirty_since = None
+        self.save_now()
+
+    def on_interval(self) -> None:
+        self.interval_timer = None
+        if self.enabled(self.app.autosave_by_t):
+            self.save_now()
+            self.interval_timer = self.app.after(self.interval_ms, self.on_interval)
+
+    # ---------- saving ----------
+    def save_now(self) -> bool:
+        '''
+        Snapshot the buffer and queue it for the writer; returns False if there was nothing to write.
+        '''
+        file_name = getattr(self.app, 'file_name', '')
+        if not file_name or not self.app.auto_save_v.get():
+            return False
+        file_service = getattr(self.app, 'file_service', None)
+        if file_service is not None and (file_service.mapped_view() is not None or file_service.stream_job is not None):
+            # read-only view / file still loading
+            return False
+        try:
+            self.app._ensure_dirty_state_service()
+            dirty_state = self.app.dirty_state_service
+        except Exception:
+            dirty_state = None
+        if dirty_state is not None and dirty_state.is_dirty(file_name) is False:
+            return False
+        revision = dirty_state.current_revision() if dirty_state is not None else None
+        try:
+            content = self.app.EgonTE.get('1.0', 'end-1c')
+        except Exception:
+            return False
+
+        try:
+            self.app._ensure_file_writer_service()
+            writer = self.app.file_writer_service
+        except Exception:
+            writer = None
+        if writer is None:
+            return False
+        writer.submit(file_name, content, lambda path, error: self.on_written(path, content, revision, error))
+        return True
+
+    def on_written(self, file_name: str, content: str, revision: Optional[int], error: Optional[BaseException]) -> None:
+        if error is not None:
+            self.app.record_list.append(f'> [{get_time()}] - Auto save of {file_name} failed: {error}')
+            return
+        try:
+            if getattr(self.app, 'file_name', '') == file_name:
+                self.app.dirty_state_service.mark_clean(file_name, content, revision)
+            self.app.file_bar.config(text=f'Auto saved: {file_name} - {get_time()}')
+        except Exception:
+            pass
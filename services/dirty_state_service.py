@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+
+@dataclass
+class DirtyStateService:
+    '''
+    Unsaved-changes tracker for the main document.
+
+    At load/save time it records the file's size/mtime, a digest of the saved text and the
+    EditTrackingService revision. is_dirty() is O(1) while the revision is unchanged; after edits
+    it digests the buffer once (so typing and undoing back to the saved text counts as clean).
+    '''
+    app: Any  # expects .EgonTE and ._ensure_edit_tracking_service()
+
+    file_name: str = ''
+    file_stat: Optional[Tuple[int, int]] = None  # (size, mtime_ns) of the file as loaded/saved
+    digest: Optional[bytes] = None
+    revision: Optional[int] = None
+
+    @staticmethod
+    def digest_text(text_value: str) -> bytes:
+        return hashlib.blake2b(text_value.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    @staticmethod
+    def stat_of(file_name: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat_info = os.stat(file_name)
+            return stat_info.st_size, stat_info.st_mtime_ns
+        except OSError:
+            return None
+
+    def current_revision(self) -> Optional[int]:
+        try:
+            self.app._ensure_edit_tracking_service()
+            tracker = getattr(self.app, 'edit_tracking_service', None)
+        except Exception:
+            tracker = None
+        if tracker is None or not tracker.install():
+            return None
+        return tracker.revision
+
+    def buffer_text(self) -> str:
+        try:
+            return self.app.EgonTE.get('1.0', 'end-1c')
+        except Exception:
+            return ''
+
+    def mark_clean(self, file_name: str, text_value: Optional[str] = None, revision: Optional[int] = None) -> None:
+        '''
+        Record file_name as matching text_value (default: the current buffer) at revision (default: now).
+        '''
+        if text_value is None:
+            revision, text_value = self.current_revision(), self.buffer_text()
+        self.file_name = file_name or ''
+        self.file_stat = self.stat_of(file_name) if file_name else None
+        self.digest = self.digest_text(text_value)
+        self.revision = revision
+        # the saved text is the new base of the crash-recovery journal
+        journal = getattr(self.app, 'edit_journal_service', None)
+        if journal is not None:
+            journal.checkpoint(self.file_name, text_value, self.digest, revision)
+        # the file's size/mtime changed: keep its recent-files entry valid
+        recent_files = getattr(self.app, 'recent_files_service', None)
+        if recent_files is not None and self.file_name:
+            recent_files.remember(self.file_name)
+
+    def is_dirty(self, file_name: str) -> Optional[bool]:
+        '''
+        True if the buffer differs from what file_name was loaded/saved with, None if there is no record for it.
+        '''
+        mapped_view = getattr(self.app, 'mapped_file_service', None)
+        if mapped_view is not None and mapped_view.active:
+            # read-only view: re-paging edits the widget, never the file
+            return False
+        if self.digest is None or file_name != self.file_name:
+            return None
+        revision = self.current_revision()
+        if revision is not None and revision == self.revision:
+            return False
+        if self.digest_text(self.buffer_text()) != self.digest:
+            return True
+        # back to the saved text: remember the revision to answer in O(1) next time
+        self.revision = revision
+        return False
+
+    def changed_on_disk(self) -> bool:
+        '''
+        True if the file was modified by someone else since it was loaded/saved here.
+        '''
+        return bool(self.file_name) and self.stat_of(self.file_name) != self.file_stat
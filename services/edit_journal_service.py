@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from tkinter import messagebox
+from typing import Any, List, Optional, Tuple
+
+try:
+    from services.dirty_state_service import DirtyStateService
+except Exception:
+    from dirty_state_service import DirtyStateService  # type: ignore
+
+try:
+    from dependencies.universal_functions import get_time  # type: ignore
+except Exception:
+    from datetime import datetime as _dt
+
+    def get_time() -> str:
+        return _dt.now().strftime('%Y-%m-%d %H:%M:%S')
+
+JOURNAL_DIR = 'EgonTE_journal'
+
+
+def encode_record(record: list) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+
+@dataclass
+class EditJournalService:
+    '''
+    Write-ahead journal of the edits made to the main document, for crash recovery.
+
+    Every insert/delete reported by the EditTrackingService proxy is appended as one compact JSON line
+    (["i", "line.col", text] / ["d", "line.col", "line.col"]), flushed right away and fsynced on a
+    short timer, so durability costs follow the size of the edit, not of the document.
+    A checkpoint rewrites the journal to a header (base digest of the saved file) and, for untitled
+    buffers or after many edits, a snapshot (["s", text]). Load/save marks (DirtyStateService)
+    are checkpoints; a clean exit discards the journal. On the next open of the same document
+    (or at launch for an untitled one) the remaining edits are offered for replay.
+    '''
+    app: Any  # expects .EgonTE, .after, ._ensure_edit_tracking_service()
+
+    directory: str = JOURNAL_DIR
+    checkpoint_records: int = 10000
+    checkpoint_bytes: int = 4 * 1024 * 1024
+    sync_delay_ms: int = 1000
+
+    file_name: Optional[str] = None  # document of the open journal (None: not journaling yet)
+    journal_file: Any = None
+    base_digest: str = ''
+    records: List[Tuple[int, str]] = field(default_factory=list)  # (revision, line) since the checkpoint
+    record_bytes: int = 0
+    attached: bool = False
+    sync_timer: Optional[str] = None
+    snapshot_pending: bool = False
+
+    # ---------- paths / state ----------
+    def journal_path(self, file_name: str) -> str:
+        key = hashlib.blake2b(str(file_name).encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest()
+        return os.path.join(self.directory, f'{key}.wal')
+
+    def current_document(self) -> str:
+        return str(getattr(self.app, 'file_name', '') or '')
+
+    def suspended(self) -> bool:
+        '''
+        True while the widget holds something other than the document (read-only view, file still loading).
+        '''
+        file_service = getattr(self.app, 'file_service', None)
+        if file_service is None:
+            return False
+        return file_service.mapped_view() is not None or file_service.stream_job is not None
+
+    def attach(self) -> bool:
+        if self.attached:
+            return True
+        try:
+            self.app._ensure_edit_tracking_service()
+            tracker = getattr(self.app, 'edit_tracking_service', None)
+        except Exception:
+            tracker = None
+        if tracker is None or not tracker.install():
+            return False
+        tracker.add_listener(self.on_edit)
+        self.attached = True
+        return True
+
+    def buffer_text(self) -> str:
+        try:
+            return self.app.EgonTE.get('1.0', 'end-1c')
+        except Exception:
+            return ''
+
+    # ---------- writing ----------
+    def on_edit(self, edit: Any) -> None:
+        if self.suspended():
+            return
+        if edit.kind == 'reset' or self.file_name != self.current_document():
+            # undescribed change / no journal for this document yet: start from a snapshot of the buffer
+            self.schedule_snapshot()
+            return
+        if self.snapshot_pending or self.journal_file is None:
+            return
+        if edit.kind == 'insert':
+            record = ['i', f'{edit.start[0]}.{edit.start[1]}', edit.text]
+        else:
+            record = ['d', f'{edit.start[0]}.{edit.start[1]}', f'{edit.end[0]}.{edit.end[1]}']
+        line = encode_record(record)
+        try:
+            self.journal_file.write(line + '\n')
+            self.journal_file.flush()
+        except Exception:
+            return
+        self.records.append((edit.revision, line))
+        self.record_bytes += len(line)
+        if len(self.records) >= self.checkpoint_records or self.record_bytes >= self.checkpoint_bytes:
+            self.schedule_snapshot()
+        elif self.sync_timer is None:
+            self.sync_timer = self.app.after(self.sync_delay_ms, self.sync)
+
+    def sync(self) -> None:
+        self.sync_timer = None
+        try:
+            os.fsync(self.journal_file.fileno())
+        except Exception:
+            pass
+
+    def schedule_snapshot(self) -> None:
+        if not self.snapshot_pending:
+            self.snapshot_pending = True
+            self.app.after_idle(self.snapshot_checkpoint)
+
+    def snapshot_checkpoint(self) -> None:
+        if not self.snapshot_pending or self.suspended():
+            # a load/save checkpoint came first
+            self.snapshot_pending = False
+            return
+        self.snapshot_pending = False
+        document = self.current_document()
+        if self.file_name is not None and self.file_name != document:
+            self.discard()
+        self.rewrite(document, self.base_digest if self.file_name == document else '', self.buffer_text(), [])
+
+    def checkpoint(self, file_name: str, text_value: str, digest: bytes, revision: Optional[int]) -> None:
+        '''
+        The buffer was loaded from / saved to file_name as text_value at revision: restart the journal there,
+        keeping only the edits made after that revision.
+        '''
+        file_name = str(file_name or '')
+        self.snapshot_pending = False
+        if self.file_name is not None and self.file_name != file_name:
+            self.discard()
+        kept_records = [record for record in self.records if revision is not None and record[0] > revision] \
+            if self.file_name == file_name else []
+        # an untitled buffer has no file to replay onto
+        self.rewrite(file_name, digest.hex(), None if file_name else text_value, kept_records)
+
+    def rewrite(self, file_name: str, base_digest: str, snapshot_text: Optional[str], kept_records: List[Tuple[int, str]]) -> None:
+        self.close()
+        path = self.journal_path(file_name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(prefix='.journal.', suffix='.tmp', dir=self.directory)
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as temp_file:
+                temp_file.write(json.dumps({'journal': 1, 'path': file_name, 'digest': base_digest}, ensure_ascii=False) + '\n')
+                if snapshot_text is not None:
+                    temp_file.write(encode_record(['s', snapshot_text]) + '\n')
+                for _, line in kept_records:
+                    temp_file.write(line + '\n')
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+            self.journal_file = open(path, 'a', encoding='utf-8')
+        except Exception:
+            self.journal_file = None
+            return
+        self.file_name, self.base_digest = file_name, base_digest
+        self.records = list(kept_records)
+        self.record_bytes = sum(len(line) for _, line in kept_records)
+
+    def close(self) -> None:
+        if self.sync_timer is not None:
+            try:
+                self.app.after_cancel(self.sync_timer)
+            except Exception:
+                pass
+            self.sync_timer = None
+        if self.journal_file is not None:
+            try:
+                self.journal_file.flush()
+                os.fsync(self.journal_file.fileno())
+                self.journal_file.close()
+            except Exception:
+                pass
+            self.journal_file = None
+
+    def discard(self) -> None:
+        '''
+        Drop the journal of the current document (clean exit, or its changes were abandoned).
+        '''
+        self.close()
+        if self.file_name is not None:
+            try:
+                os.remove(self.journal_path(self.file_name))
+            except OSError:
+                pass
+        self.file_name = None
+        self.records, self.record_bytes = [], 0
+
+    # ---------- recovery ----------
+    def read(self, file_name: str) -> Optional[dict]:
+        '''
+        Parse the journal left for file_name; None if there is none or it holds no edits.
+        Call before the document is checkpointed (which restarts its journal).
+        '''
+        try:
+            with open(self.journal_path(str(file_name or '')), 'r', encoding='utf-8') as journal_file:
+                header = json.loads(journal_file.readline())
+                snapshot_text, operations = None, []
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # torn last line of a crash
+                        break
+                    if record[0] == 's':
+                        snapshot_text, operations = record[1], []
+                    else:
+                        operations.append(record)
+        except (OSError, ValueError, IndexError):
+            return None
+        if not operations and (snapshot_text is None
+                               or DirtyStateService.digest_text(snapshot_text).hex() == header.get('digest')):
+            return None
+        return {'path': header.get('path', ''), 'digest': header.get('digest', ''), 'snapshot': snapshot_text,
+                'operations': operations}
+
+    def offer_recovery(self, journal: Optional[dict], base_digest: Optional[bytes]) -> bool:
+        '''
+        Ask to replay a journal from read(); base_digest is the digest of the text it would be replayed onto.
+        '''
+        if not journal:
+            return False
+        if journal['snapshot'] is None and (base_digest is None or base_digest.hex() != journal['digest']):
+            self.app.record_list.append(f'> [{get_time()}] - Edit journal of {journal["path"] or "untitled"} '
+                                        f'skipped: the file changed since')
+            return False
+        shown_name = os.path.basename(journal['path']) if journal['path'] else 'an untitled document'
+        if not messagebox.askyesno('EgonTE', f'Unsaved changes to {shown_name} from a previous session were found.\n'
+                                             f'Do you want to restore them?'):
+            return False
+        if not journal['path'] and self.file_name != '':
+            # start the untitled journal so the replayed edits are journaled again
+            self.rewrite('', '', self.buffer_text(), [])
+        editor = self.app.EgonTE
+        try:
+            if journal['snapshot'] is not None:
+                editor.delete('1.0', 'end')
+                editor.insert('1.0', journal['snapshot'])
+            for record in journal['operations']:
+                if record[0] == 'i':
+                    editor.insert(record[1], record[2])
+                elif record[0] == 'd':
+                    editor.delete(record[1], record[2])
+            editor.edit_separator()
+        except Exception:
+            self.app.record_list.append(f'> [{get_time()}] - Edit journal of {shown_name} could not be replayed')
+            return False
+        self.app.record_list.append(f'> [{get_time()}] - Restored {len(journal["operations"])} journaled edits to {shown_name}')
+        return True
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Tcl body of the widget command proxy; only insert/delete/replace reach Python
+PROXY_BODY = '''
+    if {{[lindex $args 0] ni {{insert delete replace}}}} {{
+        return [{original} {{*}}$args]
+    }}
+    set token [{before} {{*}}$args]
+    set code [catch {{{original} {{*}}$args}} result options]
+    if {{$token ne ""}} {{
+        {after} $token [expr {{$code == 0}}]
+    }}
+    return -options $options $result
+'''
+
+
+@dataclass
+class TextEdit:
+    '''
+    A single insert/delete applied to the tracked Text widget.
+
+    Positions are (line, column) pairs as Tk reports them (1-based line, 0-based column).
+      - kind == 'insert': start is where text was inserted, end is the position right after it.
+      - kind == 'delete': start/end is the removed range as it was before the deletion.
+      - kind == 'reset': the change could not be described; listeners should rebuild from the widget.
+    old_block/new_block hold the complete lines touched by the edit before and after it, so
+    listeners can re-scan only those lines instead of the whole buffer.
+    '''
+    kind: str
+    start: Tuple[int, int]
+    end: Tuple[int, int]
+    text: str
+    old_block: str
+    new_block: str
+    revision: int
+
+    @property
+    def line_delta(self) -> int:
+        '''
+        Number of lines added (positive) or removed (negative) by this edit.
+        '''
+        return self.new_block.count('\n') - self.old_block.count('\n')
+
+    @property
+    def char_delta(self) -> int:
+        '''
+        Number of characters added (positive) or removed (negative) by this edit.
+        '''
+        return len(self.text) if self.kind == 'insert' else -len(self.text)
+
+
+@dataclass
+class EditTrackingService:
+    '''
+    Widget-level change feed for the main Text widget (app.EgonTE).
+
+    The widget's Tcl command is wrapped by a proxy so every insert/delete/replace,
+    whether typed, pasted, undone or done programmatically, is reported to listeners
+    as a TextEdit delta. Listeners are plain callables taking one TextEdit.
+    '''
+    app: Any  # expects access to .EgonTE (tk.Text)
+
+    listeners: List[Callable[[TextEdit], None]] = field(default_factory=list)
+    revision: int = 0
+    installed: bool = False
+    widget: Any = None
+    original_command: str = ''
+    prepared_edits: Dict[str, tuple] = field(default_factory=dict)  # token -> state before the edit
+    token_serial: int = 0
+
+    # ---------- install / listeners ----------
+    def install(self, widget: Optional[Any] = None) -> bool:
+        '''
+        Wrap the widget's Tcl command with the change proxy. Safe to call more than once.
+        '''
+        if self.installed:
+            return True
+        target_widget = widget if widget is not None else getattr(self.app, 'EgonTE', None)
+        if target_widget is None:
+            return False
+        try:
+            widget_path = str(target_widget)
+            original_command = f'{widget_path}_ete_orig'
+            before_command, after_command = f'{widget_path}_ete_before', f'{widget_path}_ete_after'
+            target_widget.tk.createcommand(before_command, self.before_edit)
+            target_widget.tk.createcommand(after_command, self.after_edit)
+            target_widget.tk.call('rename', widget_path, original_command)
+            # The proxy is a Tcl proc, so an error of the forwarded call stays a plain Tcl error: Python
+            # callers get their TclError and Tcl's catch (tk_textCopy, ...) handles it, while an exception
+            # raised in a Python command callback would stay pending in _tkinter and end mainloop.
+            target_widget.tk.call('proc', widget_path, 'args', PROXY_BODY.format(
+                original=original_command, before=before_command, after=after_command))
+        except Exception:
+            return False
+        self.widget = target_widget
+        self.original_command = original_command
+        self.installed = True
+        return True
+
+    def add_listener(self, callback: Callable[[TextEdit], None]) -> None:
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[TextEdit], None]) -> None:
+        try:
+            self.listeners.remove(callback)
+        except ValueError:
+            pass
+
+    # ---------- tk helpers (bypass the proxy) ----------
+    def raw(self, *args: Any) -> Any:
+        return self.widget.tk.call(self.original_command, *args)
+
+    def position(self, index_value: Any) -> Tuple[int, int]:
+        '''
+        Resolve any Tk index expression to a (line, column) tuple.
+        '''
+        line_text, column_text = str(self.raw('index', index_value)).split('.')
+        return int(line_text), int(column_text)
+
+    def end_position(self) -> Tuple[int, int]:
+        '''
+        Position of the last real character boundary ('end-1c').
+        '''
+        return self.position('end-1c')
+
+    def line_block(self, first_line: int, last_line: int) -> str:
+        '''
+        Full text of lines first_line..last_line (inclusive), without the final newline.
+        '''
+        return str(self.raw('get', f'{first_line}.0', f'{last_line}.end'))
+
+    # ---------- proxy ----------
+    def before_edit(self, *args: Any) -> str:
+        '''
+        Called by the proxy before an insert/delete/replace is forwarded: records what the edit is about
+        to change and returns a token for after_edit ('' when nobody listens or nothing will change).
+        '''
+        if not self.listeners:
+            return ''
+        try:
+            operation = args[0]
+            if operation == 'insert':
+                prepared = self.prepare_insert(args)
+            elif operation == 'delete':
+                prepared = self.prepare_delete(args)
+            else:
+                prepared = self.prepare_replace(args)
+        except Exception:
+            # a bad index makes Tk fail the call too; if it goes through anyway, listeners rebuild
+            prepared = ('reset',)
+        if prepared is None:
+            return ''
+        self.token_serial += 1
+        token = str(self.token_serial)
+        self.prepared_edits[token] = prepared
+        return token
+
+    def after_edit(self, token: str, succeeded: str) -> str:
+        '''
+        Called by the proxy once the forwarded call returned; reports the edit if it succeeded.
+        '''
+        prepared = self.prepared_edits.pop(token, None)
+        if prepared is None or succeeded != '1':
+            return ''
+        if prepared[0] == 'reset':
+            self.notify_reset()
+            return ''
+        try:
+            self.complete_edit(prepared)
+        except Exception:
+            self.notify_reset()
+        return ''
+
+    def resolve_insert_position(self, index_value: Any) -> Tuple[int, int]:
+        '''
+        Tk never inserts on the trailing dummy line; inserts at 'end' land before the final newline.
+        '''
+        insert_pos = self.position(index_value)
+        end_pos = self.position('end')
+        if insert_pos >= end_pos:
+            insert_pos = self.end_position()
+        return insert_pos
+
+    def resolve_delete_range(self, args: Tuple[Any, ...]) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        '''
+        Mirror Tk's own index adjustment for 'delete index1 ?index2?' and return the range that
+        will actually be removed, or None when nothing will be deleted.
+        '''
+        start_pos = self.position(args[1])
+        end_pos = self.position(args[2]) if len(args) > 2 else self.position(f'{args[1]}+1c')
+        if start_pos >= end_pos:
+            return None
+        if end_pos >= self.position('end'):
+            # the final newline is never removed; Tk deletes the one before the range instead
+            end_pos = self.end_position()
+            if start_pos[1] == 0 and start_pos[0] > 1:
+                start_pos = self.position(f'{start_pos[0]}.0-1c')
+        if start_pos >= end_pos:
+            return None
+        return start_pos, end_pos
+
+    @staticmethod
+    def insert_end_position(start_pos: Tuple[int, int], inserted_text: str) -> Tuple[int, int]:
+        '''
+        Position right after inserted_text once it is placed at start_pos.
+        '''
+        added_lines = inserted_text.count('\n')
+        if added_lines:
+            return start_pos[0] + added_lines, len(inserted_text) - inserted_text.rfind('\n') - 1
+        return start_pos[0], start_pos[1] + len(inserted_text)
+
+    def prepare_insert(self, args: Tuple[Any, ...]) -> Optional[tuple]:
+        start_pos = self.resolve_insert_position(args[1])
+        inserted_text = ''.join(str(chunk) for chunk in args[2::2])
+        if not inserted_text:
+            return None
+        return ('insert', start_pos, inserted_text, self.line_block(start_pos[0], start_pos[0]))
+
+    def prepare_delete(self, args: Tuple[Any, ...]) -> Optional[tuple]:
+        delete_range = self.resolve_delete_range(args)
+        if delete_range is None:
+            return None
+        start_pos, end_pos = delete_range
+        removed_text = str(self.raw('get', f'{start_pos[0]}.{start_pos[1]}', f'{end_pos[0]}.{end_pos[1]}'))
+        return ('delete', start_pos, end_pos, removed_text, self.line_block(start_pos[0], end_pos[0]))
+
+    def prepare_replace(self, args: Tuple[Any, ...]) -> tuple:
+        '''
+        'replace index1 index2 chars ?tags chars tags ...?' is reported as a delete followed by an insert.
+        '''
+        delete_range = self.resolve_delete_range(args[:3])
+        if delete_range is None:
+            start_pos = end_pos = self.resolve_insert_position(args[1])
+            removed_text = ''
+        else:
+            start_pos, end_pos = delete_range
+            removed_text = str(self.raw('get', f'{start_pos[0]}.{start_pos[1]}', f'{end_pos[0]}.{end_pos[1]}'))
+        old_block = self.line_block(start_pos[0], end_pos[0])
+        inserted_text = ''.join(str(chunk) for chunk in args[3::2])
+        return ('replace', start_pos, end_pos, removed_text, old_block, inserted_text)
+
+    def complete_edit(self, prepared: tuple) -> None:
+        kind = prepared[0]
+        if kind == 'insert':
+            _, start_pos, inserted_text, old_block = prepared
+            end_pos = self.insert_end_position(start_pos, inserted_text)
+            new_block = self.line_block(start_pos[0], end_pos[0])
+            self.notify('insert', start_pos, end_pos, inserted_text, old_block, new_block)
+        elif kind == 'delete':
+            _, start_pos, end_pos, removed_text, old_block = prepared
+            new_block = self.line_block(start_pos[0], start_pos[0])
+            self.notify('delete', start_pos, end_pos, removed_text, old_block, new_block)
+        else:
+            _, start_pos, end_pos, removed_text, old_block, inserted_text = prepared
+            old_lines = old_block.split('\n')
+            middle_block = old_lines[0][:start_pos[1]] + old_lines[-1][end_pos[1]:]
+            if removed_text:
+                self.notify('delete', start_pos, end_pos, removed_text, old_block, middle_block)
+            if inserted_text:
+                insert_end = self.insert_end_position(start_pos, inserted_text)
+                new_block = self.line_block(start_pos[0], insert_end[0])
+                self.notify('insert', start_pos, insert_end, inserted_text, middle_block, new_block)
+
+    def notify(self, kind: str, start_pos: Tuple[int, int], end_pos: Tuple[int, int], text_value: str,
+               old_block: str, new_block: str) -> None:
+        self.revision += 1
+        edit = TextEdit(kind, start_pos, end_pos, text_value, old_block, new_block, self.revision)
+        for listener in list(self.listeners):
+            try:
+                listener(edit)
+            except Exception:
+                continue
+
+    def notify_reset(self) -> None:
+        '''
+        Tell listeners a change could not be described; they should rebuild from the widget.
+        '''
+        self.notify('reset', (1, 0), (1, 0), '', '', '')
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Optional, Any, Sequence
+import codecs
+import locale
 import os
 import pathlib
+import queue
 import sys
+import tempfile
+import threading
+import time
 from tkinter import END, filedialog, messagebox
 from datetime import datetime
 
@@ -23,6 +29,11 @@ except Exception:
     except Exception:
         text_extensions = (('Text Files', '*.txt'), ('HTML Files', '*.html'), ('Python Files', '*.py'))
 
+try:
+    from services.file_writer_service import FileWriterService
+except Exception:
+    from file_writer_service import FileWriterService  # type: ignore
+
 # Time + unsaved changes prompt (try canonical path first)
 try:
     from dependencies.universal_functions import get_time, check_file_changes  # type: ignore
@@ -35,10 +46,14 @@ except Exception:
         def get_time() -> str:
             return _dt.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        def check_file_changes(file_name: str, content: str) -> bool:
+        def check_file_changes(file_name: str, content: str, dirty_state: Any = None) -> bool:
             return True
 
 
+class MergeCancelled(Exception):
+    pass
+
+
 @dataclass
 class FileService:
     '''
@@ -46,9 +61,24 @@ class FileService:
     - Reads/writes are utf-8 first, then fallback to legacy where possible.
     - Saves use buffer 'end-1c' to avoid saving tkinter's trailing newline.
     - Preserves existing UI behavior (file bar text, record_list).
+    - Files of stream_threshold_bytes and up are read on a worker thread and inserted in
+      after()-scheduled batches, with progress in the file bar (click it or press Escape to cancel).
+    - Files of mapped_view_threshold_bytes and up are shown read-only through MappedFileService.
+    - Merges stream the chosen files (into the editor or a file on disk) the same way.
     '''
     app: Any  # main Window-like object
 
+    stream_threshold_bytes: int = 4 * 1024 * 1024
+    stream_chunk_chars: int = 256 * 1024
+    stream_queue_chunks: int = 8  # bounds the memory held between the reader and the widget
+    stream_batch_ms: int = 30  # time budget of one insert batch on the Tk thread
+    stream_job: Optional[dict] = None
+    merge_job: Optional[dict] = None
+    prettify_job: Optional[dict] = None
+    prettify_poll_ms: int = 20
+    open_serial: int = 0  # bumped per opened file; deferred open stages of older files are dropped
+    mapped_view_threshold_bytes: int = 256 * 1024 * 1024
+
     # ---------- helpers ----------
     def title_text(self, suffix: str = '') -> str:
         return f'{getattr(self.app, "title_struct", "")}{suffix}'
@@ -78,6 +108,57 @@ class FileService:
         except Exception:
             pass
 
+    def dirty_state(self) -> Any:
+        '''
+        The app's DirtyStateService (unsaved-changes tracker), or None.
+        '''
+        try:
+            self.app._ensure_dirty_state_service()
+            return getattr(self.app, 'dirty_state_service', None)
+        except Exception:
+            return None
+
+    def mark_clean(self, file_name: str, text_value: Optional[str] = None, revision: Optional[int] = None) -> None:
+        dirty_state = self.dirty_state()
+        if dirty_state is not None:
+            dirty_state.mark_clean(file_name, text_value, revision)
+
+    def recent_files(self) -> Any:
+        '''
+        The app's RecentFilesService (per-file encoding / view position / line index cache), or None.
+        '''
+        try:
+            self.app._ensure_recent_files_service()
+            return getattr(self.app, 'recent_files_service', None)
+        except Exception:
+            return None
+
+    def decode_attempts(self, text_name: str) -> list:
+        '''
+        (encoding, errors) to read text_name with, in order: utf-8, then the permissive locale fallback.
+        A file last read with the fallback (and unchanged since) goes straight to it.
+        '''
+        attempts = [('utf-8', 'strict'), (locale.getpreferredencoding(False), 'replace')]
+        recent_files = self.recent_files()
+        cached_encoding = recent_files.encoding_of(text_name) if recent_files is not None else None
+        if cached_encoding and cached_encoding != 'utf-8':
+            attempts.insert(0, (cached_encoding, 'replace'))
+        return attempts
+
+    def edit_journal(self) -> Any:
+        try:
+            self.app._ensure_edit_journal_service()
+            return getattr(self.app, 'edit_journal_service', None)
+        except Exception:
+            return None
+
+    def save_revision(self) -> Optional[int]:
+        '''
+        Edit revision of the buffer about to be saved, taken before reading it.
+        '''
+        dirty_state = self.dirty_state()
+        return dirty_state.current_revision() if dirty_state is not None else None
+
     def append_record(self, message_text: str) -> None:
         try:
             self.app.record_list.append(message_text)
@@ -131,19 +212,25 @@ class FileService:
         '''
         Create a blank workspace (no file path).
         '''
-        if check_file_changes(getattr(self.app, 'file_name', ''), self.editor_get_all()):
+        if check_file_changes(getattr(self.app, 'file_name', ''), self.editor_get_all(), self.dirty_state()):
+            self.cancel_open(restore=False)
+            recent_files = self.recent_files()
+            if recent_files is not None:
+                recent_files.store_view(getattr(self.app, 'file_name', ''))
+            self.close_mapped_view()
             try:
                 self.app.file_name = ''
                 self.app.open_status_name = ''
             except Exception:
                 pass
             self.editor_set_all('')
+            self.mark_clean('')
             self.update_file_bar('New file')
             self.append_record(f'> [{get_time()}] - New blank file opened')
 
     def open_file(self, event: Optional[object] = None) -> None:
         '''
-        Open a file; prettify HTML and prepare Python console if needed.
+        Open a file; the content is shown first, HTML prettify and the Python console follow.
         '''
         prior_content = self.editor_get_all()
 
@@ -156,30 +243,64 @@ class FileService:
         else:
             text_name = self.get_file('open')
 
-        if not check_file_changes(getattr(self.app, 'file_name', ''), self.editor_get_all()):
+        if not check_file_changes(getattr(self.app, 'file_name', ''), self.editor_get_all(), self.dirty_state()):
             return
 
         if not text_name:
             self.show_error('File not found / selected')
             return
 
-        # Try utf-8 first, fallback to permissive open
-        try:
-            with open(text_name, 'r', encoding='utf-8') as file_pointer:
-                file_content = file_pointer.read()
-        except UnicodeDecodeError:
+        self.cancel_open(restore=False)
+        # where the previous file was left is restored when it is opened again
+        recent_files = self.recent_files()
+        if recent_files is not None:
+            recent_files.store_view(getattr(self.app, 'file_name', ''))
+
+        # Very large files get the read-only mapped view instead of being loaded
+        if self.should_map(text_name):
+            self.prepare_python_console(text_name)
+            self.open_mapped_view(text_name)
+            return
+        self.close_mapped_view()
+
+        # Large files are streamed into the editor in chunks (HTML still needs the whole text to prettify)
+        if self.should_stream(text_name):
+            self.prepare_python_console(text_name)
+            self.open_file_streaming(text_name, prior_content)
+            return
+
+        # Try utf-8 first (or the encoding the file was last read with), fallback to permissive open
+        file_content, used_encoding = None, None
+        for encoding, errors in self.decode_attempts(text_name):
             try:
-                with open(text_name, 'r', errors='replace') as file_pointer:
-                    file_content = file_pointer.read()
+                with open(text_name, 'r', encoding=encoding, errors=errors) as file_pointer:
+                    file_content, used_encoding = file_pointer.read(), encoding
+                break
+            except UnicodeDecodeError:
+                continue
             except Exception:
-                self.show_error('File contains not supported characters')
+                self.show_error('Could not open file')
                 self.editor_set_all(prior_content)
                 return
-        except Exception:
-            self.show_error('Could not open file')
+        if file_content is None:
+            self.show_error('File contains not supported characters')
             self.editor_set_all(prior_content)
             return
 
+        self.prepare_python_console(text_name)
+        self.set_opened_file(text_name)
+        self.update_file_bar(f'Opened file: {os.path.basename(text_name)}')
+        self.editor_set_all(file_content)
+        self.finish_open(text_name, used_encoding)
+
+        # HTML is shown raw right away and prettified on a worker
+        if text_name.endswith('.html') and BeautifulSoup is not None:
+            self.start_prettify(text_name, file_content)
+
+    def prepare_python_console(self, text_name: str) -> None:
+        '''
+        Drop the console of a previously opened Python file and mark text_name if it is a Python file.
+        '''
         # Disable legacy python console if switching types
         try:
             if getattr(self.app, 'python_file', False):
@@ -209,39 +330,43 @@ class FileService:
         except Exception:
             pass
 
-        # HTML prettify (best effort)
+        # Python file – mark it; the output box is built once the content is shown (setup_file_type)
+        if text_name.endswith('.py'):
+            self.app.python_file = True
+
+    def build_python_console(self) -> None:
         try:
-            if text_name.endswith('.html') and BeautifulSoup is not None:
+            parent_frame = getattr(self.app, 'editor_container_frame', None) or getattr(self.app, 'root', None)
+            result_tuple = self.app.make_rich_textbox(
+                parent_frame, size=[100, 1], selectbg='blue', wrap=None, font='arial 12', bd=2
+            )
+            if isinstance(result_tuple, tuple) and len(result_tuple) >= 3:
+                self.app.output_frame, self.app.output_box, self.app.output_scroll = result_tuple[:3]
                 try:
-                    soup = BeautifulSoup(file_content, 'html.parser')  # type: ignore
-                    file_content = soup.prettify()
-                    self.app.soup = soup
+                    self.app.output_box.configure(state='disabled')
                 except Exception:
                     pass
         except Exception:
             pass
 
-        # Python file – mark and try setting up output box
+    def setup_file_type(self, text_name: str, open_serial: int) -> None:
+        '''
+        Deferred part of opening text_name: Python console and menus, after the content was drawn.
+        '''
+        if open_serial != self.open_serial:
+            # another file was opened in the meantime; its own setup follows
+            return
+        if text_name.endswith('.py') and getattr(self.app, 'python_file', False):
+            self.build_python_console()
         try:
-            if text_name.endswith('.py'):
-                self.app.python_file = True
-                try:
-                    parent_frame = getattr(self.app, 'editor_container_frame', None) or getattr(self.app, 'root', None)
-                    result_tuple = self.app.make_rich_textbox(
-                        parent_frame, size=[100, 1], selectbg='blue', wrap=None, font='arial 12', bd=2
-                    )
-                    if isinstance(result_tuple, tuple) and len(result_tuple) >= 3:
-                        self.app.output_frame, self.app.output_box, self.app.output_scroll = result_tuple[:3]
-                        try:
-                            self.app.output_box.configure(state='disabled')
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            # benign even if not a Python file; menu logic checks python_file flag
+            self.app.manage_menus(mode='python')
         except Exception:
             pass
 
-        # Update state and UI
+    def set_opened_file(self, text_name: str) -> None:
+        self.open_serial += 1
+        self.prettify_job = None
         try:
             self.app.EgonTE.delete('1.0', END)
         except Exception:
@@ -254,16 +379,24 @@ class FileService:
         except Exception:
             pass
 
-        shown_name = os.path.basename(text_name)
-        self.update_file_bar(f'Opened file: {shown_name}')
-
         try:
-            # benign even if not a Python file; menu logic checks python_file flag
-            self.app.manage_menus(mode='python')
+            self.app.after_idle(self.setup_file_type, text_name, self.open_serial)
         except Exception:
-            pass
+            self.setup_file_type(text_name, self.open_serial)
 
-        self.editor_set_all(file_content)
+    def finish_open(self, text_name: str, encoding: Optional[str] = None) -> None:
+        # edits journaled for this file before a crash are read before the checkpoint restarts its journal
+        journal_service = self.edit_journal()
+        journal = journal_service.read(text_name) if journal_service is not None and self.mapped_view() is None else None
+        self.mark_clean(text_name)
+        recent_files = self.recent_files()
+        if recent_files is not None:
+            recent_files.remember(text_name, encoding)
+            if self.mapped_view() is None:
+                recent_files.restore_view(text_name)
+        if journal is not None:
+            dirty_state = self.dirty_state()
+            journal_service.offer_recovery(journal, dirty_state.digest if dirty_state is not None else None)
 
         # Persist 'open last file'
         try:
@@ -274,6 +407,251 @@ class FileService:
 
         self.append_record(f'> [{get_time()}] - Opened {getattr(self.app, "file_name", text_name)}')
 
+    # ---------- HTML prettify ----------
+    def start_prettify(self, text_name: str, raw_text: str) -> None:
+        '''
+        Parse and prettify raw_text on a worker thread; prettify_poll swaps the result in.
+        '''
+        job = {'path': text_name, 'result': queue.Queue(maxsize=1)}
+        self.prettify_job = job
+        threading.Thread(target=self.prettify_worker, args=(job, raw_text), daemon=True).start()
+        self.app.after(self.prettify_poll_ms, self.prettify_poll, job)
+
+    def prettify_worker(self, job: dict, raw_text: str) -> None:
+        try:
+            soup = BeautifulSoup(raw_text, 'html.parser')  # type: ignore
+            job['result'].put((soup, soup.prettify()))
+        except Exception:
+            job['result'].put(None)
+
+    def prettify_poll(self, job: dict) -> None:
+        if job is not self.prettify_job:
+            return
+        try:
+            result = job['result'].get_nowait()
+        except queue.Empty:
+            self.app.after(self.prettify_poll_ms, self.prettify_poll, job)
+            return
+        self.prettify_job = None
+        if result is None or getattr(self.app, 'file_name', '') != job['path'] or self.mapped_view() is not None:
+            return
+        soup, pretty_text = result
+        self.app.soup = soup
+        # only replace the raw text if it is still exactly what was loaded
+        dirty_state = self.dirty_state()
+        if dirty_state is None or dirty_state.is_dirty(job['path']) is not False:
+            return
+        editor = self.app.EgonTE
+        try:
+            insert_index = editor.index('insert')
+            editor.edit_separator()
+            self.editor_set_all(pretty_text)
+            editor.edit_separator()
+            editor.mark_set('insert', insert_index)
+        except Exception:
+            return
+        # the prettified text counts as the saved state, as when it was prettified before showing
+        self.mark_clean(job['path'])
+
+    # ---------- mapped large-file view ----------
+    def mapped_view(self) -> Any:
+        service = getattr(self.app, 'mapped_file_service', None)
+        return service if service is not None and service.active else None
+
+    def should_map(self, text_name: str) -> bool:
+        try:
+            return os.path.getsize(text_name) >= self.mapped_view_threshold_bytes
+        except OSError:
+            return False
+
+    def open_mapped_view(self, text_name: str) -> None:
+        try:
+            self.app._ensure_mapped_file_service()
+            service = self.app.mapped_file_service
+            self.set_opened_file(text_name)
+            shown_name = os.path.basename(text_name)
+            recent_files = self.recent_files()
+
+            def on_indexed() -> None:
+                self.update_file_bar(f'Viewing (read-only): {shown_name} • {service.mapped.line_count()} lines')
+                if recent_files is not None:
+                    recent_files.restore_view(text_name)
+
+            service.open(text_name, on_indexed=on_indexed, index_cache=recent_files)
+        except Exception:
+            self.close_mapped_view()
+            self.show_error('Could not open file')
+            return
+        self.update_file_bar(f'Viewing (read-only): {shown_name}')
+        self.finish_open(text_name)
+
+    def close_mapped_view(self) -> None:
+        service = self.mapped_view()
+        if service is not None:
+            service.close()
+
+    def refuse_mapped_save(self) -> bool:
+        if self.mapped_view() is None:
+            return False
+        self.show_warning('Large files are opened read-only; the shown text is only a part of the file')
+        return True
+
+    # ---------- streaming open ----------
+    def should_stream(self, text_name: str) -> bool:
+        if text_name.endswith('.html'):
+            return False
+        try:
+            return os.path.getsize(text_name) >= self.stream_threshold_bytes
+        except OSError:
+            return False
+
+    def open_file_streaming(self, text_name: str, prior_content: str) -> None:
+        '''
+        Show text_name while it is still being read: a worker thread reads fixed-size chunks into a
+        bounded queue and the Tk thread inserts them at the end of the editor in short batches.
+        '''
+        editor = self.app.EgonTE
+        job = {
+            'path': text_name,
+            'size': max(os.path.getsize(text_name), 1),
+            'position': 0,
+            'first_chunk': True,
+            'cancel': threading.Event(),
+            'chunks': queue.Queue(maxsize=self.stream_queue_chunks),
+            # restored if the user cancels
+            'prior_content': prior_content[:-1] if prior_content.endswith('\n') else prior_content,
+            'prior_names': tuple(getattr(self.app, name, '') for name in ('text_name', 'open_status_name', 'file_name')),
+            'undo': None,
+            'bindings': [],
+            'decode_attempts': self.decode_attempts(text_name),
+            'encoding': None,
+        }
+        self.stream_job = job
+        self.set_opened_file(text_name)
+
+        # one undo step per chunk would keep a second copy of the file in the undo stack
+        try:
+            job['undo'] = editor.cget('undo')
+            editor.configure(undo=False)
+        except Exception:
+            pass
+        try:
+            job['bindings'].append((self.app.file_bar, '<Button-1>', self.app.file_bar.bind('<Button-1>', lambda event: self.cancel_open())))
+            job['bindings'].append((editor, '<Escape>', editor.bind('<Escape>', lambda event: self.cancel_open(), add='+')))
+        except Exception:
+            pass
+
+        self.update_stream_progress(job)
+        threading.Thread(target=self.stream_worker, args=(job,), daemon=True).start()
+        self.app.after(1, self.stream_poll, job)
+
+    def stream_worker(self, job: dict) -> None:
+        def post(message: tuple) -> bool:
+            while not job['cancel'].is_set():
+                try:
+                    job['chunks'].put(message, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        # utf-8 first; on a decoding error start over with the permissive fallback of the regular open
+        for encoding, errors in job['decode_attempts']:
+            try:
+                with open(job['path'], 'r', encoding=encoding, errors=errors) as file_pointer:
+                    while True:
+                        chunk = file_pointer.read(self.stream_chunk_chars)
+                        if not chunk:
+                            job['encoding'] = encoding
+                            post(('done',))
+                            return
+                        if not post(('chunk', chunk, file_pointer.buffer.tell())):
+                            return
+            except UnicodeDecodeError:
+                if not post(('restart',)):
+                    return
+            except Exception:
+                post(('error', 'Could not open file'))
+                return
+        post(('error', 'File contains not supported characters'))
+
+    def stream_poll(self, job: dict) -> None:
+        if job is not self.stream_job:
+            return
+        editor = self.app.EgonTE
+        deadline = time.perf_counter() + self.stream_batch_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                message = job['chunks'].get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            try:
+                if kind == 'chunk':
+                    editor.insert('end-1c', message[1])
+                    job['position'] = message[2]
+                    if job['first_chunk']:
+                        job['first_chunk'] = False
+                        editor.mark_set('insert', '1.0')
+                        editor.see('1.0')
+                elif kind == 'restart':
+                    editor.delete('1.0', END)
+                    job['position'] = 0
+                elif kind == 'error':
+                    self.cancel_open()
+                    self.show_error(message[1])
+                    return
+                elif kind == 'done':
+                    self.end_stream(job)
+                    self.update_file_bar(f'Opened file: {os.path.basename(job["path"])}')
+                    self.finish_open(job['path'], job['encoding'])
+                    return
+            except Exception:
+                self.cancel_open()
+                self.show_error('Could not open file')
+                return
+        self.update_stream_progress(job)
+        self.app.after(1, self.stream_poll, job)
+
+    def update_stream_progress(self, job: dict) -> None:
+        percent = min(100, job['position'] * 100 // job['size'])
+        self.update_file_bar(f'Opening {os.path.basename(job["path"])}: {percent}% (click or Esc to cancel)')
+
+    def end_stream(self, job: dict) -> None:
+        job['cancel'].set()
+        if self.stream_job is job:
+            self.stream_job = None
+        for widget, sequence, function_id in job['bindings']:
+            try:
+                widget.unbind(sequence, function_id)
+            except Exception:
+                pass
+        try:
+            if job['undo'] is not None:
+                self.app.EgonTE.configure(undo=job['undo'])
+            self.app.EgonTE.edit_reset()
+        except Exception:
+            pass
+
+    def cancel_open(self, restore: bool = True) -> None:
+        '''
+        Stop a streaming open; with restore, bring back the buffer and file that were shown before it.
+        '''
+        job = self.stream_job
+        if job is None:
+            return
+        self.end_stream(job)
+        if not restore:
+            return
+        self.editor_set_all(job['prior_content'])
+        try:
+            self.app.text_name, self.app.open_status_name, self.app.file_name = job['prior_names']
+        except Exception:
+            pass
+        prior_file = job['prior_names'][2]
+        self.update_file_bar(f'Opened file: {os.path.basename(prior_file)}' if prior_file else 'New file')
+        self.append_record(f'> [{get_time()}] - Cancelled opening {job["path"]}')
+
     def save_as(self, event: Optional[object] = None) -> Optional[str]:
         '''
         Save current buffer into a new file path; returns the resolved path or None.
@@ -285,6 +663,8 @@ class FileService:
                 return file_name
             self.show_error('You cannot copy a file path if there is no active file')
             return None
+        if self.refuse_mapped_save():
+            return None
 
         text_file_path = filedialog.asksaveasfilename(
             defaultextension='.*',
@@ -295,17 +675,16 @@ class FileService:
         if not text_file_path:
             return None
 
+        revision = self.save_revision()
         content = self.editor_get_all_for_write()
-        try:
-            with open(text_file_path, 'w', encoding='utf-8') as file_pointer:
-                file_pointer.write(content)
-        except Exception:
-            try:
-                with open(text_file_path, 'w') as file_pointer:
-                    file_pointer.write(content)
-            except Exception:
-                self.show_error('Failed to save file')
-                return None
+        self.write_file(text_file_path, content, lambda path, error: self.finish_save_as(path, content, revision, error))
+        return text_file_path
+
+    def finish_save_as(self, text_file_path: str, content: str, revision: Optional[int], error: Optional[BaseException]) -> None:
+        if error is not None:
+            self.show_error('Failed to save file')
+            return
+        self.mark_clean(text_file_path, content, revision)
 
         # Update state and status bar
         try:
@@ -331,34 +710,65 @@ class FileService:
             pass
 
         self.append_record(f'> [{get_time()}] - Saved {text_file_path}')
-        return text_file_path
 
     def save(self, event: Optional[object] = None) -> bool:
         '''
         Save current buffer into the existing file path, or fallback to save_as.
+        The write itself runs in the background: True means it was queued, and a failure is reported
+        when it completes. Callers that go on to use the file on disk call flush_writes() first.
         '''
+        if self.refuse_mapped_save():
+            return False
         open_status_name = getattr(self.app, 'open_status_name', '')
         if open_status_name:
+            revision = self.save_revision()
             content = self.editor_get_all_for_write()
-            try:
-                with open(open_status_name, 'w', encoding='utf-8') as file_pointer:
-                    file_pointer.write(content)
-            except Exception:
-                try:
-                    with open(open_status_name, 'w') as file_pointer:
-                        file_pointer.write(content)
-                except Exception:
+            file_name = getattr(self.app, 'file_name', open_status_name)
+
+            def on_done(path: str, error: Optional[BaseException]) -> None:
+                if error is not None:
                     self.show_error('Failed to save file')
-                    return False
+                    return
+                self.mark_clean(path, content, revision)
+                self.update_file_bar(f'Saved: {file_name} - {get_time()}')
+                self.append_record(f'> [{get_time()}] - Saved {file_name}')
 
-            file_name = getattr(self.app, 'file_name', open_status_name)
-            self.update_file_bar(f'Saved: {file_name} - {get_time()}')
-            self.append_record(f'> [{get_time()}] - Saved {file_name}')
+            self.write_file(str(open_status_name), content, on_done)
             return True
 
         # No existing path -> Save As
         return bool(self.save_as(event=None))
 
+    # ---------- background writes ----------
+    def file_writer(self) -> Any:
+        try:
+            self.app._ensure_file_writer_service()
+            return getattr(self.app, 'file_writer_service', None)
+        except Exception:
+            return None
+
+    def write_file(self, path: str, content: str, on_done: Any) -> None:
+        '''
+        Write content to path atomically on the writer thread; on_done(path, error) runs on the Tk thread.
+        '''
+        writer = self.file_writer()
+        if writer is not None:
+            writer.submit(path, content, on_done)
+            return
+        try:
+            FileWriterService.write_atomic(path, content)
+            error = None
+        except Exception as write_error:
+            error = write_error
+        on_done(path, error)
+
+    def flush_writes(self, timeout: Optional[float] = 30) -> bool:
+        '''
+        Wait for queued saves to reach the disk (before running or leaving with the saved file).
+        '''
+        writer = getattr(self.app, 'file_writer_service', None)
+        return writer.flush(timeout) if writer is not None else True
+
     def print_file(self) -> bool:
         '''
         Best-effort print for the current file (Windows supports os.startfile(..., 'print')).
@@ -387,10 +797,41 @@ class FileService:
             self.show_error('Print is not supported on this system')
             return False
 
-    def merge_files(self, paths: Optional[Sequence[str]] = None, separator: str = '\n') -> bool:
+    # ---------- merging ----------
+    @staticmethod
+    def sniff_encoding(path: str, sample_bytes: int = 64 * 1024) -> str:
         '''
-        Merge the content of provided files (or ask via dialog if None) into the editor buffer.
+        Encoding of path judged from its first block: a BOM, else utf-8 if the block decodes, else the locale encoding.
         '''
+        with open(path, 'rb') as file_pointer:
+            sample = file_pointer.read(sample_bytes)
+        # the utf-32 BOMs start with the utf-16 ones, so they are checked first
+        for bom, encoding in ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF32_LE, 'utf-32'), (codecs.BOM_UTF32_BE, 'utf-32'),
+                              (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16')):
+            if sample.startswith(bom):
+                return encoding
+        try:
+            # not final unless the whole file was read: the block may end inside a character
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=len(sample) < sample_bytes)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return locale.getpreferredencoding(False)
+
+    def merge_files(self, paths: Optional[Sequence[str]] = None, separator: str = '\n', to_disk: bool = False,
+                    target: Optional[str] = None) -> bool:
+        '''
+        Merge the content of provided files (or ask via dialog if None) into the editor buffer,
+        or with to_disk into a new file (target, or asked via dialog).
+        Files are streamed in chunks by a worker thread (the encoding of each is sniffed from its first block),
+        so memory stays bounded by the queue, not by the size or number of the files; progress is shown
+        in the file bar (click it or press Escape to cancel).
+        '''
+        if self.merge_job is not None or self.stream_job is not None:
+            self.show_warning('Wait for the current merge / open to finish (or cancel it)')
+            return False
+        if not to_disk and self.mapped_view() is not None:
+            self.show_warning('Large files are opened read-only; merge to disk instead')
+            return False
         try:
             selected_paths = list(paths or filedialog.askopenfilenames(
                 title='Choose files to merge', filetypes=text_extensions
@@ -399,27 +840,210 @@ class FileService:
             selected_paths = []
         if not selected_paths:
             return False
+        if to_disk and not target:
+            try:
+                target = filedialog.asksaveasfilename(title='Merge into', defaultextension='.txt', filetypes=text_extensions)
+            except Exception:
+                target = ''
+            if not target:
+                return False
 
-        parts: list[str] = []
-        for path_item in selected_paths:
+        editor = self.app.EgonTE
+        prepend_text = ''
+        if not to_disk:
             try:
-                with open(path_item, 'r', encoding='utf-8') as file_pointer:
-                    parts.append(file_pointer.read())
+                # any non-blank character in the buffer, without copying it
+                prepend_text = separator if editor.search(r'\S', '1.0', 'end', regexp=True) else ''
+                editor.edit_separator()
             except Exception:
-                try:
-                    with open(path_item, 'r') as file_pointer:
-                        parts.append(file_pointer.read())
-                except Exception:
-                    parts.append('')
-        merged_text = separator.join(parts)
+                pass
+        job = {
+            'paths': selected_paths,
+            'separator': separator,
+            'prepend': prepend_text,
+            'target': target if to_disk else None,
+            'size': 1,
+            'position': 0,  # bytes read so far, over all files (written by the worker)
+            'file_index': 0,
+            'skipped': [],
+            'cancel': threading.Event(),
+            'chunks': queue.Queue(maxsize=self.stream_queue_chunks),
+            'bindings': [],
+        }
+        self.merge_job = job
         try:
-            prepend_text = (separator if self.editor_get_all_for_write().strip() else '')
-            self.app.EgonTE.insert('end', prepend_text + merged_text)
-            self.append_record(f'> [{get_time()}] - Merged {len(selected_paths)} files')
-            return True
+            job['bindings'].append((self.app.file_bar, '<Button-1>', self.app.file_bar.bind('<Button-1>', lambda event: self.cancel_merge())))
+            job['bindings'].append((editor, '<Escape>', editor.bind('<Escape>', lambda event: self.cancel_merge(), add='+')))
         except Exception:
+            pass
+        self.update_merge_progress(job)
+        threading.Thread(target=self.merge_worker, args=(job,), daemon=True).start()
+        self.app.after(1, self.merge_poll, job)
+        return True
+
+    def merge_worker(self, job: dict) -> None:
+        def post(message: tuple) -> bool:
+            while not job['cancel'].is_set():
+                try:
+                    job['chunks'].put(message, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
             return False
 
+        sizes = []
+        for path_item in job['paths']:
+            try:
+                sizes.append(os.path.getsize(path_item))
+            except OSError:
+                sizes.append(0)
+        job['size'] = max(sum(sizes), 1)
+
+        output, temp_path = None, None
+        if job['target']:
+            # written next to the target and moved over it when complete
+            try:
+                directory = os.path.dirname(os.path.abspath(job['target']))
+                file_descriptor, temp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(job["target"])}.', suffix='.tmp', dir=directory)
+                output = open(file_descriptor, 'w', encoding='utf-8', newline='')
+            except Exception:
+                if temp_path is not None:
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+                post(('error', 'Could not create the merged file'))
+                return
+
+        def emit(text_chunk: str) -> bool:
+            if output is None:
+                return post(('chunk', text_chunk))
+            if job['cancel'].is_set():
+                return False
+            output.write(text_chunk)
+            return True
+
+        try:
+            pending_separator = job['prepend']
+            done_bytes = 0
+            for file_index, (path_item, size) in enumerate(zip(job['paths'], sizes)):
+                job['file_index'] = file_index
+                if file_index:
+                    pending_separator = job['separator']
+                # only errors of the source count as a skipped file; output errors abort the merge
+                try:
+                    file_pointer = open(path_item, 'r', encoding=self.sniff_encoding(path_item), errors='replace')
+                except (OSError, LookupError):
+                    job['skipped'].append(path_item)
+                    file_pointer = None
+                if file_pointer is not None:
+                    with file_pointer:
+                        if pending_separator and not emit(pending_separator):
+                            raise MergeCancelled()
+                        while True:
+                            try:
+                                chunk = file_pointer.read(self.stream_chunk_chars)
+                            except (OSError, LookupError):
+                                job['skipped'].append(path_item)
+                                break
+                            if not chunk:
+                                break
+                            if not emit(chunk):
+                                raise MergeCancelled()
+                            job['position'] = done_bytes + file_pointer.buffer.tell()
+                done_bytes += size
+                job['position'] = done_bytes
+            if output is not None:
+                output.flush()
+                os.fsync(output.fileno())
+                output.close()
+                output = None
+                try:
+                    os.chmod(temp_path, os.stat(job['target']).st_mode & 0o7777)
+                except OSError:
+                    pass
+                os.replace(temp_path, job['target'])
+                temp_path = None
+            post(('done',))
+        except MergeCancelled:
+            return
+        except Exception:
+            post(('error', 'Could not merge the files'))
+        finally:
+            if output is not None:
+                try:
+                    output.close()
+                except Exception:
+                    pass
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    def merge_poll(self, job: dict) -> None:
+        if job is not self.merge_job:
+            return
+        editor = self.app.EgonTE
+        deadline = time.perf_counter() + self.stream_batch_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                message = job['chunks'].get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            if kind == 'chunk':
+                try:
+                    editor.insert('end-1c', message[1])
+                except Exception:
+                    self.end_merge(job)
+                    self.show_error('Could not merge the files')
+                    return
+            elif kind == 'error':
+                self.end_merge(job)
+                self.show_error(message[1])
+                return
+            else:
+                self.end_merge(job)
+                where = f' into {job["target"]}' if job['target'] else ''
+                self.update_file_bar(f'Merged {len(job["paths"])} files{where}')
+                skipped = f' ({len(job["skipped"])} could not be read)' if job['skipped'] else ''
+                self.append_record(f'> [{get_time()}] - Merged {len(job["paths"])} files{where}{skipped}')
+                return
+        self.update_merge_progress(job)
+        self.app.after(1, self.merge_poll, job)
+
+    def update_merge_progress(self, job: dict) -> None:
+        percent = min(100, job['position'] * 100 // job['size'])
+        self.update_file_bar(f'Merging file {job["file_index"] + 1}/{len(job["paths"])}: {percent}% (click or Esc to cancel)')
+
+    def end_merge(self, job: dict) -> None:
+        job['cancel'].set()
+        if self.merge_job is job:
+            self.merge_job = None
+        for widget, sequence, function_id in job['bindings']:
+            try:
+                widget.unbind(sequence, function_id)
+            except Exception:
+                pass
+        if not job['target']:
+            try:
+                # the merged text is one undo step
+                self.app.EgonTE.edit_separator()
+            except Exception:
+                pass
+
+    def cancel_merge(self) -> None:
+        '''
+        Stop a running merge; text merged into the editor so far is kept, a partial merged file is removed.
+        '''
+        job = self.merge_job
+        if job is None:
+            return
+        self.end_merge(job)
+        self.update_file_bar(f'Merge cancelled after {job["file_index"]}/{len(job["paths"])} files')
+        self.append_record(f'> [{get_time()}] - Cancelled merging {len(job["paths"])} files')
+
     def delete_file(self, path: Optional[str] = None, custom: Optional[str] = None) -> bool:
         '''
         Delete the given path or the currently open file; asks for confirmation.
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import errno
+import locale
+import os
+import queue
+import stat
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# on_done(path, error) – error is None on success
+DoneCallback = Callable[[str, Optional[BaseException]], None]
+
+
+@dataclass
+class FileWriterService:
+    '''
+    Background, atomic file writes for save / save as / autosave.
+
+    submit() only queues the text: a worker thread writes it to a temp file in the target's directory,
+    fsyncs it and os.replace()s it over the target, so an interrupted save never leaves a truncated file
+    (see write_atomic for the files that are rewritten in place instead).
+    Completion is reported on the Tk thread through after(). Requests for a path that is still queued
+    collapse into the newest one (every caller's callback runs once it is written).
+    '''
+    app: Any  # expects .after
+
+    poll_ms: int = 25
+
+    pending: Dict[str, dict] = field(default_factory=dict)
+    order: queue.Queue = field(default_factory=queue.Queue)
+    results: queue.Queue = field(default_factory=queue.Queue)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    idle: threading.Event = field(default_factory=threading.Event)
+    worker: Optional[threading.Thread] = None
+    polling: bool = False
+
+    @staticmethod
+    def write_text(path: str, content: str) -> None:
+        '''
+        Write content to path and fsync it. Text mode, so '\n' is written as os.linesep like the former
+        open(path, 'w') save. utf-8 first; text utf-8 cannot encode (e.g. lone surrogates) falls back to
+        the locale encoding.
+        '''
+        try:
+            with open(path, 'w', encoding='utf-8') as file_pointer:
+                file_pointer.write(content)
+                file_pointer.flush()
+                os.fsync(file_pointer.fileno())
+        except UnicodeEncodeError:
+            with open(path, 'w', encoding=locale.getpreferredencoding(False), errors='replace') as file_pointer:
+                file_pointer.write(content)
+                file_pointer.flush()
+                os.fsync(file_pointer.fileno())
+
+    @staticmethod
+    def write_atomic(path: str, content: str) -> None:
+        '''
+        Write content to path through a same-directory temp file + fsync + os.replace.
+
+        A symlink is followed: its target is replaced and the link stays. A file that is not writable is
+        refused (PermissionError, as open(path, 'w') raised). A file with other hard links or another
+        owner is rewritten in place, since replacing it would split the links or drop its owner and ACLs;
+        so is one whose directory does not allow the temp file.
+        '''
+        path = os.path.realpath(path)
+        try:
+            target_stat = os.stat(path)
+        except FileNotFoundError:
+            target_stat = None
+        if target_stat is not None:
+            if not os.access(path, os.W_OK):
+                raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), path)
+            owner_id = os.getuid() if hasattr(os, 'getuid') else target_stat.st_uid
+            if target_stat.st_nlink > 1 or target_stat.st_uid != owner_id:
+                FileWriterService.write_text(path, content)
+                return
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp',
+                                                          dir=os.path.dirname(path))
+        except OSError:
+            if target_stat is None:
+                raise
+            FileWriterService.write_text(path, content)
+            return
+        os.close(file_descriptor)
+        try:
+            FileWriterService.write_text(temp_path, content)
+            if target_stat is not None:
+                # keep the permissions of the file being replaced (mkstemp creates 0600)
+                try:
+                    os.chmod(temp_path, stat.S_IMODE(target_stat.st_mode))
+                except OSError:
+                    pass
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def submit(self, path: str, content: str, on_done: Optional[DoneCallback] = None) -> None:
+        '''
+        Queue content to be written to path; O(1) on the calling thread.
+        '''
+        with self.lock:
+            request = self.pending.get(path)
+            if request is None:
+                request = {'content': content, 'callbacks': []}
+                self.pending[path] = request
+                self.order.put(path)
+            else:
+                request['content'] = content
+            if on_done is not None:
+                request['callbacks'].append(on_done)
+            self.idle.clear()
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self.write_loop, daemon=True)
+                self.worker.start()
+        if not self.polling:
+            self.polling = True
+            self.app.after(self.poll_ms, self.poll_results)
+
+    def write_loop(self) -> None:
+        while True:
+            path = self.order.get()
+            with self.lock:
+                request = self.pending.pop(path)
+            try:
+                self.write_atomic(path, request['content'])
+                error = None
+            except Exception as write_error:
+                error = write_error
+            self.results.put((path, error, request['callbacks']))
+            with self.lock:
+                if not self.pending:
+                    self.idle.set()
+
+    def poll_results(self) -> None:
+        while True:
+            try:
+                path, error, callbacks = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.run_callbacks(path, error, callbacks)
+        with self.lock:
+            busy = bool(self.pending) or not self.idle.is_set()
+        if busy or not self.results.empty():
+            self.app.after(self.poll_ms, self.poll_results)
+        else:
+            self.polling = False
+
+    @staticmethod
+    def run_callbacks(path: str, error: Optional[BaseException], callbacks: List[DoneCallback]) -> None:
+        for callback in callbacks:
+            try:
+                callback(path, error)
+            except Exception:
+                pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        '''
+        Block until every queued write is on disk (e.g. before exiting) and run their callbacks.
+        '''
+        with self.lock:
+            if not self.pending and self.worker is None:
+                return True
+        finished = self.idle.wait(timeout)
+        while True:
+            try:
+                path, error, callbacks = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.run_callbacks(path, error, callbacks)
+        return finished
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Tuple
+
+# lines rendered into the editor at once, and how close to the rendered edge the view may get before re-paging
+WINDOW_LINES = 3000
+EDGE_LINES = 300
+INDEX_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class MappedFile:
+    '''
+    A read-only memory map of a file plus the byte offset of every line start.
+
+    The index is built by build_index (normally on a worker thread) and can be read while it grows;
+    estimated_line_count() extrapolates the total from the part indexed so far.
+    '''
+    path: str
+    file_pointer: Any
+    mapping: Any
+    encoding: str = 'utf-8'
+    line_starts: array = field(default_factory=lambda: array('q', [0]))
+    indexed_bytes: int = 0
+    complete: bool = False
+
+    @classmethod
+    def open(cls, path: str, encoding: str = 'utf-8') -> 'MappedFile':
+        file_pointer = open(path, 'rb')
+        try:
+            mapping = mmap.mmap(file_pointer.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            mapping = b''
+        return cls(path, file_pointer, mapping, encoding)
+
+    @property
+    def size(self) -> int:
+        return len(self.mapping)
+
+    def build_index(self, cancel_event: Optional[threading.Event] = None) -> None:
+        size = self.size
+        line_starts = self.line_starts
+        for block_start in range(0, size, INDEX_BLOCK_BYTES):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            try:
+                block = self.mapping[block_start:block_start + INDEX_BLOCK_BYTES]
+            except ValueError:
+                # closed underneath us
+                return
+            find = block.find
+            found_at = find(b'\n')
+            while found_at != -1:
+                line_starts.append(block_start + found_at + 1)
+                found_at = find(b'\n', found_at + 1)
+            self.indexed_bytes = block_start + len(block)
+        self.indexed_bytes = size
+        self.complete = True
+
+    def line_count(self) -> int:
+        '''
+        Lines indexed so far (a trailing newline starts an empty last line, as in a Text widget).
+        '''
+        return len(self.line_starts)
+
+    def estimated_line_count(self) -> int:
+        if self.complete or not self.indexed_bytes:
+            return self.line_count()
+        return max(self.line_count(), int(self.line_count() * self.size / self.indexed_bytes))
+
+    def read_lines(self, first_line: int, last_line: int) -> str:
+        '''
+        Decoded text of the 0-based lines [first_line, last_line), without the final newline.
+        '''
+        line_starts = self.line_starts
+        known_lines = len(line_starts)
+        if first_line >= known_lines:
+            return ''
+        start = line_starts[first_line]
+        if last_line < known_lines:
+            end = line_starts[last_line] - 1
+        else:
+            # the last indexed line is only complete once the whole file is indexed
+            end = self.size if self.complete else line_starts[known_lines - 1] - 1
+        text_value = self.mapping[start:max(start, end)].decode(self.encoding, errors='replace')
+        return text_value.replace('\r\n', '\n')
+
+    def position(self, byte_offset: int) -> Tuple[int, int]:
+        '''
+        0-based (line, character column) of a byte offset.
+        '''
+        line_number = bisect_right(self.line_starts, byte_offset) - 1
+        line_start = self.line_starts[line_number]
+        column = len(self.mapping[line_start:byte_offset].decode(self.encoding, errors='replace'))
+        return line_number, column
+
+    def close(self) -> None:
+        try:
+            if isinstance(self.mapping, mmap.mmap):
+                self.mapping.close()
+        finally:
+            self.file_pointer.close()
+
+
+@dataclass
+class MappedFileService:
+    '''
+    Read-only viewer for files too large for a Text widget.
+
+    The file is memory-mapped and indexed by line on a worker thread; only a window of WINDOW_LINES
+    lines around the view is rendered into the editor. The vertical scrollbar is rewired to describe
+    the whole file, and when the view nears the rendered edge (wheel, keys, dragging) the window is
+    re-rendered around it. SearchService searches the mapping itself and reveals matches through here.
+    '''
+    app: Any  # expects .EgonTE, .text_scroll and .after
+
+    mapped: Optional[MappedFile] = None
+    window_start: int = 0
+    window_end: int = 0
+    index_cancel: Optional[threading.Event] = None
+    repage_pending: bool = False
+    saved_state: dict = field(default_factory=dict)
+
+    @property
+    def active(self) -> bool:
+        return self.mapped is not None
+
+    # ---------- lifecycle ----------
+    def open(self, path: str, on_indexed: Optional[Callable[[], None]] = None, index_cache: Any = None) -> None:
+        '''
+        Show path; index_cache (RecentFilesService) supplies the line index of an unchanged file and keeps new ones.
+        '''
+        self.close()
+        self.mapped = MappedFile.open(path)
+        editor = self.app.EgonTE
+        self.saved_state = {
+            'yscrollcommand': editor.cget('yscrollcommand'),
+            'scroll_command': self.app.text_scroll.cget('command'),
+            'undo': editor.cget('undo'),
+        }
+        editor.configure(yscrollcommand=self.on_view_changed, undo=False)
+        self.app.text_scroll.configure(command=self.on_scrollbar)
+
+        self.index_cancel = threading.Event()
+        indexed_file = self.mapped
+        threading.Thread(target=self.index_worker, args=(indexed_file, self.index_cancel, index_cache), daemon=True).start()
+        self.render(0)
+        self.app.after(100, self.poll_index, indexed_file, on_indexed)
+
+    @staticmethod
+    def index_worker(indexed_file: MappedFile, cancel_event: threading.Event, index_cache: Any) -> None:
+        cached_index = index_cache.load_index(indexed_file.path) if index_cache is not None else None
+        if cached_index is not None and cached_index[-1] <= indexed_file.size:
+            indexed_file.line_starts = cached_index
+            indexed_file.indexed_bytes = indexed_file.size
+            indexed_file.complete = True
+            return
+        indexed_file.build_index(cancel_event)
+        if indexed_file.complete and index_cache is not None:
+            try:
+                index_cache.write_index(indexed_file.path, indexed_file.line_starts, os.fstat(indexed_file.file_pointer.fileno()))
+            except Exception:
+                pass
+
+    def poll_index(self, indexed_file: MappedFile, on_indexed: Optional[Callable[[], None]]) -> None:
+        if indexed_file is not self.mapped:
+            return
+        if self.window_end - self.window_start < WINDOW_LINES and self.window_end < indexed_file.line_count():
+            # the first window was rendered before its lines were indexed
+            self.render(self.window_start, self.top_line())
+        self.update_scrollbar()
+        if not indexed_file.complete:
+            self.app.after(100, self.poll_index, indexed_file, on_indexed)
+        elif on_indexed is not None:
+            on_indexed()
+
+    def close(self) -> None:
+        if self.mapped is None:
+            return
+        if self.index_cancel is not None:
+            self.index_cancel.set()
+        editor = self.app.EgonTE
+        try:
+            editor.configure(state='normal', yscrollcommand=self.saved_state.get('yscrollcommand', ''),
+                             undo=self.saved_state.get('undo', True))
+            self.app.text_scroll.configure(command=self.saved_state.get('scroll_command') or editor.yview)
+            editor.delete('1.0', 'end')
+            editor.edit_reset()
+        except Exception:
+            pass
+        self.mapped.close()
+        self.mapped = None
+        self.window_start = self.window_end = 0
+
+    # ---------- rendering ----------
+    def render(self, first_line: int, top_line: Optional[int] = None) -> None:
+        '''
+        Render the window starting at the 0-based first_line and scroll top_line (default first_line) to the top.
+        '''
+        mapped = self.mapped
+        first_line = max(0, min(first_line, mapped.line_count() - 1))
+        last_line = min(mapped.line_count(), first_line + WINDOW_LINES)
+        editor = self.app.EgonTE
+        try:
+            editor.configure(state='normal')
+            editor.delete('1.0', 'end')
+            editor.insert('1.0', mapped.read_lines(first_line, last_line))
+            editor.configure(state='disabled')
+        except Exception:
+            return
+        self.window_start, self.window_end = first_line, last_line
+        self.scroll_local(max(first_line, top_line if top_line is not None else first_line) - first_line)
+
+    def scroll_local(self, local_line: int) -> None:
+        try:
+            self.app.EgonTE.yview(f'{local_line + 1}.0')
+        except Exception:
+            pass
+
+    def top_line(self) -> int:
+        try:
+            return self.window_start + int(self.app.EgonTE.index('@0,0').split('.')[0]) - 1
+        except Exception:
+            return self.window_start
+
+    def bottom_line(self) -> int:
+        try:
+            editor = self.app.EgonTE
+            return self.window_start + int(editor.index(f'@0,{editor.winfo_height()}').split('.')[0]) - 1
+        except Exception:
+            return self.window_start
+
+    def show_line(self, line_number: int) -> None:
+        '''
+        Bring the 0-based line_number to the top of the view, re-rendering only if it is near or past the edge.
+        '''
+        line_count = self.mapped.line_count()
+        line_number = max(0, min(line_number, line_count - 1))
+        inside = self.window_start <= line_number < self.window_end
+        near_top = self.window_start > 0 and line_number - self.window_start < EDGE_LINES
+        near_bottom = self.window_end < line_count and self.window_end - line_number < EDGE_LINES
+        if inside and not near_top and not near_bottom:
+            self.scroll_local(line_number - self.window_start)
+        else:
+            self.render(line_number - WINDOW_LINES // 2, line_number)
+
+    def reveal(self, byte_start: int, byte_end: int) -> Tuple[str, str]:
+        '''
+        Show the byte span of the mapping and return its Tk index span in the rendered window.
+        '''
+        start_line, start_column = self.mapped.position(byte_start)
+        end_line, end_column = self.mapped.position(byte_end)
+        self.show_line(max(0, start_line - 5))
+        if not self.window_start <= end_line < self.window_end:
+            self.render(start_line - WINDOW_LINES // 2, max(0, start_line - 5))
+        start_index = f'{start_line - self.window_start + 1}.{start_column}'
+        end_index = f'{end_line - self.window_start + 1}.{end_column}'
+        try:
+            self.app.EgonTE.see(start_index)
+        except Exception:
+            pass
+        return start_index, end_index
+
+    # ---------- scrolling ----------
+    def on_view_changed(self, *view: Any) -> None:
+        '''
+        yscrollcommand of the editor: map the window-relative view onto the whole file and re-page near the edges.
+        '''
+        self.update_scrollbar()
+        if self.repage_pending or self.mapped is None:
+            return
+        top_line, bottom_line = self.top_line(), self.bottom_line()
+        near_top = self.window_start > 0 and top_line - self.window_start < EDGE_LINES
+        near_bottom = self.window_end < self.mapped.line_count() and self.window_end - bottom_line < EDGE_LINES
+        if near_top or near_bottom:
+            self.repage_pending = True
+            self.app.after_idle(self.repage)
+
+    def repage(self) -> None:
+        self.repage_pending = False
+        if self.mapped is not None:
+            top_line = self.top_line()
+            self.render(top_line - WINDOW_LINES // 2, top_line)
+
+    def update_scrollbar(self) -> None:
+        if self.mapped is None:
+            return
+        total_lines = max(1, self.mapped.estimated_line_count())
+        try:
+            self.app.text_scroll.set(self.top_line() / total_lines, min(1.0, (self.bottom_line() + 1) / total_lines))
+        except Exception:
+            pass
+
+    def on_scrollbar(self, *scroll_args: Any) -> None:
+        '''
+        Scrollbar command: 'moveto' jumps through the whole file, unit/page scrolls move the editor itself.
+        '''
+        if self.mapped is None or not scroll_args:
+            return
+        if scroll_args[0] == 'moveto':
+            self.show_line(int(float(scroll_args[1]) * self.mapped.estimated_line_count()))
+        else:
+            try:
+                self.app.EgonTE.yview(*scroll_args)
+            except Exception:
+                pass
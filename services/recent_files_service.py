@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+RECENT_DIR = 'EgonTE_recent'
+RECENT_FILE = 'recent.json'
+
+
+@dataclass
+class RecentFilesService:
+    '''
+    Cache of what was learned about the last max_files opened files.
+
+    Per file it keeps size + mtime (the entry is only trusted while both still match), the encoding
+    the file was decoded with (so reopening skips the utf-8 attempt / re-detection), the cursor and
+    scroll position (restored right after the content is shown) and, for files shown in the read-only
+    mapped view, the line-offset index (a binary side file, so the view skips re-indexing the file).
+    The metadata is a small json file, rewritten atomically a moment after it changes.
+    '''
+    app: Any  # expects .EgonTE, .file_name, .after
+
+    directory: str = RECENT_DIR
+    max_files: int = 20
+    max_index_lines: int = 4_000_000  # larger indexes (32 MB+) are rebuilt instead of cached
+    save_delay_ms: int = 1000
+
+    entries: List[Dict[str, Any]] = field(default_factory=list)  # most recent first
+    loaded: bool = False
+    save_timer: Optional[str] = None
+
+    # ---------- storage ----------
+    @staticmethod
+    def key_of(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def index_path(self, path: str) -> str:
+        digest = hashlib.blake2b(self.key_of(path).encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest()
+        return os.path.join(self.directory, f'{digest}.idx')
+
+    def load(self) -> None:
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            with open(os.path.join(self.directory, RECENT_FILE), 'r', encoding='utf-8') as cache_file:
+                entries = json.load(cache_file)
+            self.entries = [entry for entry in entries if isinstance(entry, dict) and entry.get('path')][:self.max_files]
+        except (OSError, ValueError):
+            self.entries = []
+
+    def schedule_save(self) -> None:
+        if self.save_timer is None:
+            try:
+                self.save_timer = self.app.after(self.save_delay_ms, self.save)
+            except Exception:
+                self.save()
+
+    def save(self) -> None:
+        if self.save_timer is not None:
+            try:
+                self.app.after_cancel(self.save_timer)
+            except Exception:
+                pass
+            self.save_timer = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(prefix='.recent.', suffix='.tmp', dir=self.directory)
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as temp_file:
+                json.dump(self.entries, temp_file, ensure_ascii=False)
+            os.replace(temp_path, os.path.join(self.directory, RECENT_FILE))
+        except Exception:
+            pass
+
+    # ---------- entries ----------
+    def find(self, path: str) -> Optional[Dict[str, Any]]:
+        self.load()
+        key = self.key_of(path)
+        for entry in self.entries:
+            if entry['path'] == key:
+                return entry
+        return None
+
+    def lookup(self, path: str) -> Optional[Dict[str, Any]]:
+        '''
+        The cached entry of path if the file is unchanged since (same size and mtime), else None.
+        '''
+        entry = self.find(path)
+        if entry is None:
+            return None
+        try:
+            stat_info = os.stat(path)
+        except OSError:
+            return None
+        if entry.get('size') != stat_info.st_size or entry.get('mtime_ns') != stat_info.st_mtime_ns:
+            self.forget_stale(entry)
+            return None
+        return entry
+
+    def touch(self, path: str) -> Optional[Dict[str, Any]]:
+        '''
+        Entry of path moved to the front (created if needed), with the file's current size and mtime.
+        '''
+        try:
+            stat_info = os.stat(path)
+        except OSError:
+            return None
+        entry = self.find(path)
+        if entry is None:
+            entry = {'path': self.key_of(path)}
+        else:
+            self.entries.remove(entry)
+            if entry.get('size') != stat_info.st_size or entry.get('mtime_ns') != stat_info.st_mtime_ns:
+                self.forget_stale(entry)
+        entry.update(size=stat_info.st_size, mtime_ns=stat_info.st_mtime_ns, opened=int(time.time()))
+        self.entries.insert(0, entry)
+        for dropped in self.entries[self.max_files:]:
+            self.forget_index(dropped)
+        del self.entries[self.max_files:]
+        self.schedule_save()
+        return entry
+
+    def remember(self, path: str, encoding: Optional[str] = None) -> None:
+        '''
+        path was opened (or saved); encoding is the one its content was decoded with, if known.
+        '''
+        entry = self.touch(path)
+        if entry is not None and encoding:
+            entry['encoding'] = encoding
+
+    def encoding_of(self, path: str) -> Optional[str]:
+        entry = self.lookup(path)
+        return entry.get('encoding') if entry is not None else None
+
+    def recent_paths(self) -> List[str]:
+        self.load()
+        return [entry['path'] for entry in self.entries]
+
+    # ---------- view position ----------
+    def store_view(self, path: str) -> None:
+        '''
+        Remember the cursor and scroll position of path, the file currently shown in the editor.
+        '''
+        if not path:
+            return
+        entry = self.find(path)
+        if entry is None:
+            return
+        mapped_view = getattr(self.app, 'mapped_file_service', None)
+        try:
+            if mapped_view is not None and mapped_view.active:
+                entry['view'] = {'top_line': mapped_view.top_line()}
+            else:
+                editor = self.app.EgonTE
+                entry['view'] = {'cursor': editor.index('insert'), 'yview': editor.yview()[0]}
+        except Exception:
+            return
+        self.schedule_save()
+
+    def restore_view(self, path: str) -> None:
+        entry = self.lookup(path)
+        view = entry.get('view') if entry is not None else None
+        if not view:
+            return
+        try:
+            mapped_view = getattr(self.app, 'mapped_file_service', None)
+            if 'top_line' in view:
+                if mapped_view is not None and mapped_view.active:
+                    mapped_view.show_line(int(view['top_line']))
+                return
+            editor = self.app.EgonTE
+            editor.mark_set('insert', view['cursor'])
+            editor.yview_moveto(float(view['yview']))
+        except Exception:
+            pass
+
+    # ---------- line index of mapped files ----------
+    def load_index(self, path: str) -> Optional[array]:
+        '''
+        Cached line starts of path, or None if there are none for its current size and mtime.
+        Only file IO: called from the mapped view's indexing thread.
+        '''
+        try:
+            stat_info = os.stat(path)
+            with open(self.index_path(path), 'rb') as index_file:
+                header = array('q')
+                header.fromfile(index_file, 2)
+                if list(header) != [stat_info.st_size, stat_info.st_mtime_ns]:
+                    return None
+                line_starts = array('q')
+                line_starts.frombytes(index_file.read())
+        except (OSError, EOFError, ValueError):
+            return None
+        if not line_starts or line_starts[0] != 0 or line_starts[-1] > stat_info.st_size:
+            return None
+        return line_starts
+
+    def write_index(self, path: str, line_starts: array, stat_info: os.stat_result) -> None:
+        '''
+        Cache the complete line index of path as it was at stat_info (header: size, mtime_ns).
+        Only file IO: called from the mapped view's indexing thread.
+        '''
+        if len(line_starts) > self.max_index_lines:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(prefix='.index.', suffix='.tmp', dir=self.directory)
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                array('q', [stat_info.st_size, stat_info.st_mtime_ns]).tofile(temp_file)
+                line_starts.tofile(temp_file)
+            os.replace(temp_path, self.index_path(path))
+        except Exception:
+            pass
+
+    def forget_stale(self, entry: Dict[str, Any]) -> None:
+        '''
+        The file of entry changed since it was cached: nothing learned about its content still holds.
+        '''
+        self.forget_index(entry)
+        entry.pop('encoding', None)
+        entry.pop('view', None)
+
+    def forget_index(self, entry: Dict[str, Any]) -> None:
+        try:
+            os.remove(self.index_path(entry['path']))
+        except OSError:
+            pass
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+SESSION_PREFIX = 'records.'  # session directories are records.<pid>.<random>
+SESSION_LOCK_NAME = 'session.lock'
+
+
+def default_spill_directory() -> str:
+    '''
+    Per-user spill location: the temp directory is already per user on Windows and macOS, not on Linux.
+    '''
+    user_suffix = f'-{os.getuid()}' if hasattr(os, 'getuid') else ''
+    return os.path.join(tempfile.gettempdir(), f'EgonTE_records{user_suffix}')
+
+
+@dataclass
+class RecordLogService:
+    '''
+    Bounded store of the record log (Window.record_list).
+
+    Records get monotonic sequence numbers (never reused, not even after clear). At most capacity of
+    them stay in memory: once capacity + capacity // 4 are held, the oldest quarter is dropped in one
+    step, so trimming costs O(1) per append. With a spill_directory the dropped records are first written
+    to a segment file there (one json line per record, at most max_spill_segments files) inside a session
+    directory removed by close; remove_stale_sessions clears the ones a crashed run left. Readers take what they have not seen with slice_since(seq) instead of copying
+    the whole history; len, indexing, slicing and iteration cover the records in memory, like the
+    list this replaces.
+    '''
+    capacity: int = 100_000
+    spill_directory: Optional[str] = None
+    max_spill_segments: int = 64
+
+    records: List[Any] = field(default_factory=list)
+    first_seq: int = 0  # sequence number of records[0]
+    segments: List[Tuple[int, int, str]] = field(default_factory=list)  # (first seq, count, path), oldest first
+    session_directory: Optional[str] = None
+    session_lock: Any = None  # kept open while the session lives (Windows then refuses to delete it)
+    lock: Any = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def next_seq(self) -> int:
+        return self.first_seq + len(self.records)
+
+    # ---------- writing ----------
+    def append(self, record: Any) -> None:
+        with self.lock:
+            self.records.append(record)
+            self.trim()
+
+    def extend(self, records: Any) -> None:
+        with self.lock:
+            self.records.extend(records)
+            self.trim()
+
+    def clear(self) -> None:
+        '''
+        Drop every record, spilled ones included; sequence numbers continue from where they were.
+        '''
+        with self.lock:
+            self.first_seq = self.next_seq
+            self.records = []
+            for _, _, path in self.segments:
+                self.remove_segment(path)
+            self.segments = []
+
+    def trim(self) -> None:
+        if len(self.records) <= self.capacity + max(1, self.capacity // 4):
+            return
+        dropped_count = len(self.records) - self.capacity
+        if self.spill_directory:
+            self.spill(self.first_seq, self.records[:dropped_count])
+        del self.records[:dropped_count]
+        self.first_seq += dropped_count
+
+    # ---------- spill segments ----------
+    def spill(self, first_seq: int, dropped: List[Any]) -> None:
+        try:
+            if self.session_directory is None:
+                os.makedirs(self.spill_directory, mode=0o700, exist_ok=True)
+                self.session_directory = tempfile.mkdtemp(prefix=f'{SESSION_PREFIX}{os.getpid()}.',
+                                                          dir=self.spill_directory)
+                self.session_lock = open(os.path.join(self.session_directory, SESSION_LOCK_NAME), 'w')
+            path = os.path.join(self.session_directory, f'{first_seq:012d}.jsonl')
+            with open(path, 'w', encoding='utf-8') as segment_file:
+                segment_file.writelines(json.dumps(record if isinstance(record, str) else str(record),
+                                                   ensure_ascii=False) + '\n' for record in dropped)
+        except Exception:
+            return
+        self.segments.append((first_seq, len(dropped), path))
+        while len(self.segments) > self.max_spill_segments:
+            self.remove_segment(self.segments.pop(0)[2])
+
+    @staticmethod
+    def remove_segment(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def read_segment(path: str) -> List[str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as segment_file:
+                return [json.loads(line) for line in segment_file]
+        except (OSError, ValueError):
+            return []
+
+    def close(self) -> None:
+        '''
+        Remove the spill segments of this session (the records in memory stay).
+        '''
+        with self.lock:
+            self.segments = []
+            if self.session_lock is not None:
+                self.session_lock.close()
+                self.session_lock = None
+            if self.session_directory is not None:
+                shutil.rmtree(self.session_directory, ignore_errors=True)
+                self.session_directory = None
+
+    def remove_stale_sessions(self) -> None:
+        '''
+        Remove the session directories of runs that ended without close (a crash or a kill).
+        '''
+        try:
+            entries = os.listdir(self.spill_directory) if self.spill_directory else []
+        except OSError:
+            return
+        for entry in entries:
+            session_path = os.path.join(self.spill_directory, entry)
+            if entry.startswith(SESSION_PREFIX) and session_path != self.session_directory \
+                    and self.session_is_stale(session_path):
+                shutil.rmtree(session_path, ignore_errors=True)
+
+    @staticmethod
+    def session_is_stale(session_path: str) -> bool:
+        try:
+            owner_pid = int(os.path.basename(session_path)[len(SESSION_PREFIX):].split('.')[0])
+        except ValueError:
+            return False
+        if owner_pid == os.getpid():
+            return False
+        if os.name == 'nt':
+            # os.kill cannot probe a process there; the owner's open lock file cannot be removed instead
+            try:
+                os.remove(os.path.join(session_path, SESSION_LOCK_NAME))
+            except FileNotFoundError:
+                return True
+            except OSError:
+                return False
+            return True
+        try:
+            os.kill(owner_pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return False
+        return False
+
+    # ---------- reading ----------
+    def slice_since(self, seq: int, include_spilled: bool = False) -> Tuple[int, List[Any]]:
+        '''
+        (start, records): the records from sequence number seq on, where start is the sequence number of
+        the first one returned - later than seq when older records were dropped (or, without
+        include_spilled, only exist in spill segments).
+        '''
+        with self.lock:
+            offset = max(0, seq - self.first_seq)
+            in_memory = self.records[offset:]
+            memory_start = self.first_seq + offset
+            segments = list(self.segments) if include_spilled and seq < self.first_seq else []
+        if not segments:
+            return memory_start, in_memory
+        start, spilled = None, []
+        for segment_first, count, path in segments:
+            if segment_first + count <= seq:
+                continue
+            segment_records = self.read_segment(path)
+            skip = max(0, seq - segment_first)
+            if start is None:
+                start = segment_first + skip
+            elif start + len(spilled) != segment_first:
+                # a gap (a segment that failed to be written or was dropped): keep the newer run only
+                start, spilled = segment_first + skip, []
+            spilled.extend(segment_records[skip:])
+        if start is None or start + len(spilled) != memory_start:
+            return memory_start, in_memory
+        return start, spilled + in_memory
+
+    # ---------- list protocol (records in memory) ----------
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self.records))
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.records[index]
@@ -1,8 +1,334 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, List, Tuple, Optional
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Tuple, Optional
 import re
+import threading
+
+# regex fragments that can consume a newline; such patterns get a few lines of rescan context
+MULTILINE_REGEX_HINTS = ('\n', '\\n', '\\s', '\\S', '\\W', '\\D', '[^', '(?s')
+# patterns anchored to the buffer start/end cannot be rescanned from the middle of the text
+ANCHORED_REGEX_HINTS = ('^', '$', '\\A', '\\Z')
+REGEX_CONTEXT_LINES = 2
+# the mapped large-file view is searched in windows; a regex match may run this far past its window
+MAPPED_WINDOW_BYTES = 4 * 1024 * 1024
+MAPPED_WINDOW_OVERLAP = 64 * 1024
+
+
+@dataclass
+class LineOffsetTable:
+    '''
+    Start offset of every line of a text block, for converting character offsets into absolute
+    Tk 'line.col' indices with a bisect, instead of '1.0+Nc' strings that make Tk count
+    characters from the start of the buffer for every index.
+
+    first_line/first_col place the block inside the widget (e.g. a selection starting at 12.4).
+    '''
+    line_starts: List[int]
+    first_line: int = 1
+    first_col: int = 0
+
+    @classmethod
+    def from_text(cls, text_value: str, first_line: int = 1, first_col: int = 0) -> 'LineOffsetTable':
+        line_starts = [0]
+        newline_at = text_value.find('\n')
+        while newline_at != -1:
+            line_starts.append(newline_at + 1)
+            newline_at = text_value.find('\n', newline_at + 1)
+        return cls(line_starts, first_line, first_col)
+
+    def position(self, offset_value: int) -> Tuple[int, int]:
+        '''
+        Return the absolute (line, column) of a 0-based offset inside the block.
+        '''
+        row = bisect_right(self.line_starts, max(0, offset_value)) - 1
+        column = offset_value - self.line_starts[row]
+        return self.first_line + row, column + (self.first_col if row == 0 else 0)
+
+    def index(self, offset_value: int) -> str:
+        line_number, column = self.position(offset_value)
+        return f'{line_number}.{column}'
+
+    def offset(self, index_value: str) -> int:
+        '''
+        Inverse of index(): offset inside the block of an absolute 'line.col' index.
+        '''
+        line_text, column_text = str(index_value).split('.')
+        row = int(line_text) - self.first_line
+        return self.line_starts[row] + int(column_text) - (self.first_col if row == 0 else 0)
+
+    def spans_to_positions(self, spans: List[Tuple[int, int]]) -> List[Tuple[int, int, int, int]]:
+        '''
+        Convert sorted (start, end) offsets to (start_line, start_col, end_line, end_col) in one pass:
+        the row cursor only moves forward, so each line start is visited once.
+        '''
+        line_starts = self.line_starts
+        last_row = len(line_starts) - 1
+        positions: List[Tuple[int, int, int, int]] = []
+        row = 0
+        for start_off, end_off in spans:
+            if start_off < line_starts[row]:
+                row = bisect_right(line_starts, start_off) - 1
+            while row < last_row and line_starts[row + 1] <= start_off:
+                row += 1
+            end_row = row
+            while end_row < last_row and line_starts[end_row + 1] <= end_off:
+                end_row += 1
+            start_col = start_off - line_starts[row] + (self.first_col if row == 0 else 0)
+            end_col = end_off - line_starts[end_row] + (self.first_col if end_row == 0 else 0)
+            positions.append((self.first_line + row, start_col, self.first_line + end_row, end_col))
+        return positions
+
+    def spans_to_indices(self, spans: List[Tuple[int, int]]) -> List[Tuple[str, str]]:
+        return [(f'{start_line}.{start_col}', f'{end_line}.{end_col}')
+                for start_line, start_col, end_line, end_col in self.spans_to_positions(spans)]
+
+
+@dataclass
+class LineMatchIndex:
+    '''
+    Matches of one needle/flags combination, stored per start line.
+
+    line_matches[i] holds the matches starting on line i + 1 as (start_col, end_line_delta, end_col).
+    The end line is kept relative to the start line, so inserting or removing lines is a single
+    list splice and never a renumbering pass. On edit only the dirty line range (widened by
+    context_lines for patterns that can span lines) is searched again; a regex match spanning
+    more lines than that context is picked up again on the next full build.
+    '''
+    finder: Callable[[str], List[Tuple[int, int]]]
+    context_lines: int = 0
+    incremental: bool = True
+    line_matches: List[List[Tuple[int, int, int]]] = field(default_factory=list)
+    total: int = 0
+    widest_span: int = 0
+
+    def scan_block(self, block_text: str, first_line: int) -> List[List[Tuple[int, int, int]]]:
+        '''
+        Search block_text (complete lines starting at first_line) and return its per-line match lists.
+        '''
+        block_matches: List[List[Tuple[int, int, int]]] = [[] for _ in range(block_text.count('\n') + 1)]
+        offset_table = LineOffsetTable.from_text(block_text, first_line)
+        for start_line, start_col, end_line, end_col in offset_table.spans_to_positions(self.finder(block_text)):
+            span_lines = end_line - start_line
+            block_matches[start_line - first_line].append((start_col, span_lines, end_col))
+            if span_lines > self.widest_span:
+                self.widest_span = span_lines
+        return block_matches
+
+    def build(self, text_value: str) -> None:
+        self.widest_span = 0
+        self.line_matches = self.scan_block(text_value, 1)
+        self.total = sum(len(matches) for matches in self.line_matches)
+
+    def apply_edit(self, edit: Any, read_lines: Callable[[int, int], str]) -> Optional[Tuple[int, int]]:
+        '''
+        Update the index after an EditTrackingService delta.
+
+        read_lines(first, last) must return the current text of lines first..last.
+        Returns the (first_line, last_line) range that was searched again, or None if the
+        index could not be updated incrementally and needs a full build.
+        '''
+        if not self.incremental or edit.kind not in ('insert', 'delete'):
+            return None
+        edit_line = edit.start[0]
+        old_count = edit.old_block.count('\n') + 1
+        new_count = edit.new_block.count('\n') + 1
+        if edit_line + old_count - 1 > len(self.line_matches):
+            return None
+
+        widen = max(self.context_lines, self.widest_span)
+        new_total_lines = len(self.line_matches) - old_count + new_count
+        first_line = max(1, edit_line - widen)
+        old_last = min(len(self.line_matches), edit_line + old_count - 1 + widen)
+        new_last = min(new_total_lines, edit_line + new_count - 1 + widen)
+
+        # read past the replaced range too, so matches starting in it may end beyond it
+        scan_last = min(new_total_lines, new_last + widen)
+        if first_line == edit_line and scan_last == edit_line + new_count - 1:
+            block_text = edit.new_block
+        else:
+            block_text = read_lines(first_line, scan_last)
+        fresh_matches = self.scan_block(block_text, first_line)[:new_last - first_line + 1]
+
+        dropped = sum(len(matches) for matches in self.line_matches[first_line - 1:old_last])
+        self.line_matches[first_line - 1:old_last] = fresh_matches
+        self.total += sum(len(matches) for matches in fresh_matches) - dropped
+        return first_line, new_last
+
+    def spans_in_lines(self, first_line: int, last_line: int) -> List[Tuple[str, str]]:
+        '''
+        Tk index spans of the matches starting on lines first_line..last_line.
+        '''
+        index_spans: List[Tuple[str, str]] = []
+        for line_number in range(max(1, first_line), min(last_line, len(self.line_matches)) + 1):
+            for start_col, span_lines, end_col in self.line_matches[line_number - 1]:
+                index_spans.append((f'{line_number}.{start_col}', f'{line_number + span_lines}.{end_col}'))
+        return index_spans
+
+    def spans(self) -> List[Tuple[str, str]]:
+        return self.spans_in_lines(1, len(self.line_matches))
+
+
+@dataclass
+class ViewportHighlighter:
+    '''
+    Lazy highlight-all: keeps the full match list but only tags the matches on the visible lines
+    of the widget (plus margin_lines above and below), so the tagging cost is proportional to the
+    screen instead of the document.
+
+    span_source(first_line, last_line) returns the (start, end) index spans starting on those lines;
+    list_source() builds one over a sorted span list, and LineMatchIndex.spans_in_lines fits as is.
+    The widget's yscrollcommand is chained while attached, which Tk calls on every scroll, resize
+    and edit that moves the view, and the visible range is re-tagged after a short debounce.
+    '''
+    widget: Any
+    tag_name: str
+    margin_lines: int = 60
+    refresh_delay_ms: int = 15
+
+    span_source: Optional[Callable[[int, int], List[Tuple[str, str]]]] = None
+    tagged_lines: Optional[Tuple[int, int]] = None
+    pending_refresh: Optional[str] = None
+    attached: bool = False
+    scroll_hook: str = ''
+    chained_command: str = ''
+
+    # attached highlighters per widget path, so one can be unlinked from the middle of the chain
+    chains: ClassVar[Dict[str, List['ViewportHighlighter']]] = {}
+
+    @staticmethod
+    def list_source(index_spans: List[Tuple[str, str]]) -> Callable[[int, int], List[Tuple[str, str]]]:
+        '''
+        Span source over a list of index spans sorted by start.
+        '''
+        start_lines = [int(str(start_index).split('.', 1)[0]) for start_index, _ in index_spans]
+
+        def source(first_line: int, last_line: int) -> List[Tuple[str, str]]:
+            return index_spans[bisect_left(start_lines, first_line):bisect_right(start_lines, last_line)]
+
+        return source
+
+    # ---------- lifecycle ----------
+    def attach(self) -> None:
+        if self.attached:
+            return
+        try:
+            self.chained_command = str(self.widget.cget('yscrollcommand') or '')
+            self.scroll_hook = self.widget.register(self.on_scroll)
+            self.widget.configure(yscrollcommand=self.scroll_hook)
+            self.attached = True
+            self.chains.setdefault(str(self.widget), []).append(self)
+        except Exception:
+            self.attached = False
+
+    def detach(self) -> None:
+        '''
+        Stop following the view, drop the tags and hand yscrollcommand back.
+        '''
+        self.cancel_refresh()
+        self.clear()
+        self.span_source = None
+        if not self.attached:
+            return
+        self.attached = False
+        chain = self.chains.get(str(self.widget), [])
+        try:
+            if str(self.widget.cget('yscrollcommand')) == self.scroll_hook:
+                self.widget.configure(yscrollcommand=self.chained_command)
+            else:
+                above = next((highlighter for highlighter in chain if highlighter.chained_command == self.scroll_hook), None)
+                if above is None:
+                    # chained on by someone else: on_scroll keeps forwarding
+                    return
+                above.chained_command = self.chained_command
+        except Exception:
+            return
+        chain[:] = [highlighter for highlighter in chain if highlighter is not self]
+        if not chain:
+            self.chains.pop(str(self.widget), None)
+        try:
+            self.widget.deletecommand(self.scroll_hook)
+        except Exception:
+            pass
+
+    def set_source(self, span_source: Optional[Callable[[int, int], List[Tuple[str, str]]]]) -> None:
+        '''
+        Show a new match set; None clears the highlight.
+        '''
+        self.span_source = span_source
+        if span_source is None:
+            self.cancel_refresh()
+            self.clear()
+            return
+        self.attach()
+        self.invalidate()
+        self.refresh()
+
+    def set_spans(self, index_spans: List[Tuple[str, str]]) -> None:
+        self.set_source(self.list_source(index_spans) if index_spans else None)
+
+    # ---------- tagging ----------
+    def on_scroll(self, *scroll_args: Any) -> None:
+        if self.chained_command:
+            try:
+                self.widget.tk.call(*self.widget.tk.splitlist(self.chained_command), *scroll_args)
+            except Exception:
+                pass
+        if self.attached and self.span_source is not None:
+            self.schedule_refresh()
+
+    def invalidate(self) -> None:
+        '''
+        Force the next refresh to re-tag even if the view did not move (e.g. the matches changed).
+        '''
+        self.tagged_lines = None
+
+    def schedule_refresh(self) -> None:
+        if self.pending_refresh is not None:
+            return
+        try:
+            self.pending_refresh = self.widget.after(self.refresh_delay_ms, self.refresh)
+        except Exception:
+            self.refresh()
+
+    def cancel_refresh(self) -> None:
+        if self.pending_refresh is not None:
+            try:
+                self.widget.after_cancel(self.pending_refresh)
+            except Exception:
+                pass
+            self.pending_refresh = None
+
+    def visible_lines(self) -> Tuple[int, int]:
+        first_line = int(str(self.widget.index('@0,0')).split('.', 1)[0])
+        last_line = int(str(self.widget.index(f'@0,{max(1, self.widget.winfo_height())}')).split('.', 1)[0])
+        return first_line, last_line
+
+    def refresh(self) -> None:
+        self.pending_refresh = None
+        if self.span_source is None:
+            return
+        try:
+            first_visible, last_visible = self.visible_lines()
+            if self.tagged_lines and self.tagged_lines[0] <= first_visible and last_visible <= self.tagged_lines[1]:
+                return
+            first_line = max(1, first_visible - self.margin_lines)
+            last_line = last_visible + self.margin_lines
+            # only a screenful of ranges carries the tag, so dropping it everywhere stays cheap
+            self.widget.tag_remove(self.tag_name, '1.0', 'end')
+            for start_index, end_index in self.span_source(first_line, last_line):
+                self.widget.tag_add(self.tag_name, start_index, end_index)
+            self.tagged_lines = (first_line, last_line)
+        except Exception:
+            self.tagged_lines = None
+
+    def clear(self) -> None:
+        self.tagged_lines = None
+        try:
+            self.widget.tag_remove(self.tag_name, '1.0', 'end')
+        except Exception:
+            pass
 
 
 @dataclass
@@ -12,10 +338,13 @@ class SearchService:
 
     This service performs:
       - Plain and regex finds with optional case sensitivity and whole-word matching.
-      - Highlighting all matches and marking the current match.
+      - Highlighting all matches and marking the current match ('viewport' mode only tags the
+        matches around the visible lines and follows scrolling; 'full' tags every match).
       - Next/previous navigation across found matches.
       - Replace (single/all) with optional regex backreferences.
       - Basic navigation helpers (go to offset or line/column).
+    While a large file is shown by the read-only MappedFileService view, finds run over the mapped
+    bytes and navigation reveals each match through the view.
     It expects the hosting app to expose:
       - app.EgonTE: a tk.Text-compatible widget
       - app.highlight_search_c: a (background, foreground) tuple for highlight colors
@@ -27,10 +356,27 @@ class SearchService:
     last_flags: Tuple[bool, bool, bool] = (False, False, False)  # (case_sensitive, whole_word, regex)
     last_index_spans: Optional[List[Tuple[str, str]]] = None  # tk index spans
     current_match_index: int = 0
-    haystack_snapshot: Optional[str] = None
     search_in_selection: bool = False
     selection_bounds: Optional[Tuple[str, str]] = None
 
+    # persistent match index (full-buffer scope), kept current from edit deltas
+    match_index: Optional[LineMatchIndex] = None
+    indexed_revision: Optional[int] = None
+    spans_stale: bool = False
+    live_highlight: bool = False
+    tracking_edits: bool = False
+
+    # highlight-all strategy: 'viewport' (lazy, screen-sized) or 'full'
+    highlight_mode: str = 'viewport'
+    viewport_highlighter: Optional[ViewportHighlighter] = None
+
+    # byte spans found in the mapped large-file view, and the mapped file they belong to
+    mapped_spans: Optional[List[Tuple[int, int]]] = None
+    mapped_source: Any = None
+    mapped_job: Optional[dict] = None  # running scan of the mapped file
+    mapped_poll_ms: int = 50
+    max_mapped_matches: int = 1_000_000
+
     # ---------- pure find logic ----------
     @staticmethod
     def is_word_char(character: str) -> bool:
@@ -49,7 +395,7 @@ class SearchService:
         return (not char_before or not cls.is_word_char(char_before)) and (not char_after or not cls.is_word_char(char_after))
 
     @classmethod
-    def find_all_offsets(
+    def iter_offsets(
         cls,
         haystack_text: str,
         needle_text: str,
@@ -57,36 +403,29 @@ class SearchService:
         case_sensitive: bool,
         whole_word: bool,
         regex: bool = False,
-    ) -> List[Tuple[int, int]]:
+    ) -> Iterator[Tuple[int, int]]:
         '''
-        Find all occurrences of needle_text in haystack_text and return a list of (start, end) offsets.
-
-        Parameters:
-            haystack_text: the source string to search in
-            needle_text: the pattern or literal substring to search
-            case_sensitive: when False, perform a case-insensitive match
-            whole_word: when True, only accept matches with word boundaries
-            regex: when True, treat needle_text as a regular expression
+        Lazily yield the (start, end) offsets of needle_text in haystack_text, in order.
+        An invalid regex yields nothing. Callers that report progress or can be cancelled
+        consume this directly; find_all_offsets collects it into a list.
         '''
         if not haystack_text or not needle_text:
-            return []
+            return
 
         if regex:
             regex_flags = 0 if case_sensitive else re.IGNORECASE
             try:
                 compiled_pattern = re.compile(needle_text, regex_flags)
             except re.error:
-                return []
-            result_spans: List[Tuple[int, int]] = []
+                return
             for match_obj in compiled_pattern.finditer(haystack_text):
                 span_start, span_end = match_obj.start(), match_obj.end()
                 if not whole_word or cls.is_word_boundary(haystack_text, span_start, span_end):
-                    result_spans.append((span_start, span_end))
-            return result_spans
+                    yield span_start, span_end
+            return
 
         prepared_haystack = haystack_text if case_sensitive else haystack_text.lower()
         prepared_needle = needle_text if case_sensitive else needle_text.lower()
-        result_spans: List[Tuple[int, int]] = []
         search_from = 0
         needle_length = len(prepared_needle)
         while True:
@@ -95,9 +434,94 @@ class SearchService:
                 break
             found_end = found_at + needle_length
             if not whole_word or cls.is_word_boundary(haystack_text, found_at, found_end):
-                result_spans.append((found_at, found_end))
+                yield found_at, found_end
             search_from = found_end
-        return result_spans
+
+    @classmethod
+    def find_all_offsets(
+        cls,
+        haystack_text: str,
+        needle_text: str,
+        *,
+        case_sensitive: bool,
+        whole_word: bool,
+        regex: bool = False,
+    ) -> List[Tuple[int, int]]:
+        '''
+        Find all occurrences of needle_text in haystack_text and return a list of (start, end) offsets.
+
+        Parameters:
+            haystack_text: the source string to search in
+            needle_text: the pattern or literal substring to search
+            case_sensitive: when False, perform a case-insensitive match
+            whole_word: when True, only accept matches with word boundaries
+            regex: when True, treat needle_text as a regular expression
+        '''
+        return list(cls.iter_offsets(haystack_text, needle_text, case_sensitive=case_sensitive,
+                                     whole_word=whole_word, regex=regex))
+
+    @staticmethod
+    def iter_mapped_offsets(
+        buffer: Any,
+        needle_text: str,
+        *,
+        case_sensitive: bool,
+        whole_word: bool,
+        regex: bool = False,
+        encoding: str = 'utf-8',
+        window_bytes: int = MAPPED_WINDOW_BYTES,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Iterator[Tuple[int, int]]:
+        '''
+        Yield the (start, end) byte offsets of needle_text in a bytes-like buffer (e.g. an mmap) without
+        decoding it. Case folding and word boundaries follow bytes regex rules (ASCII only).
+        The buffer is searched window_bytes at a time (a regex sees MAPPED_WINDOW_OVERLAP more bytes, so
+        matches may cross a window edge but not be longer than that), which bounds every single C-level
+        search and lets a worker thread give up the GIL and notice cancel_event between windows.
+        '''
+        if not needle_text:
+            return
+        needle_bytes = needle_text.encode(encoding)
+        buffer_size = len(buffer)
+        if not regex and case_sensitive and not whole_word:
+            search_from = 0
+            while search_from < buffer_size:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                window_end = min(buffer_size, search_from + window_bytes + len(needle_bytes) - 1)
+                found_at = buffer.find(needle_bytes, search_from, window_end)
+                if found_at == -1:
+                    if window_end == buffer_size:
+                        return
+                    search_from = window_end - len(needle_bytes) + 1
+                    continue
+                yield found_at, found_at + len(needle_bytes)
+                search_from = found_at + len(needle_bytes)
+            return
+        pattern_bytes = needle_bytes if regex else re.escape(needle_bytes)
+        if whole_word:
+            pattern_bytes = rb'(?<!\w)(?:' + pattern_bytes + rb')(?!\w)'
+        try:
+            compiled_pattern = re.compile(pattern_bytes, 0 if case_sensitive else re.IGNORECASE)
+        except re.error:
+            return
+        window_start = 0
+        while window_start < buffer_size:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            window_end = min(buffer_size, window_start + window_bytes)
+            search_end = min(buffer_size, window_end + MAPPED_WINDOW_OVERLAP)
+            next_start = window_end
+            for match_obj in compiled_pattern.finditer(buffer, window_start, search_end):
+                if match_obj.start() >= window_end:
+                    break
+                if match_obj.end() == search_end and search_end < buffer_size:
+                    # may continue past the searched bytes: search again from its start
+                    next_start = max(match_obj.start(), window_start + 1)
+                    break
+                yield match_obj.start(), match_obj.end()
+                next_start = max(window_end, match_obj.end())
+            window_start = next_start
 
     # ---------- tk index helpers ----------
     @staticmethod
@@ -108,11 +532,19 @@ class SearchService:
         return f'1.0+{max(0, offset_value)}c'
 
     @classmethod
-    def offsets_to_indices(cls, spans: List[Tuple[int, int]]) -> List[Tuple[str, str]]:
+    def offsets_to_indices(cls, spans: List[Tuple[int, int]], text_value: Optional[str] = None,
+                           first_index: str = '1.0') -> List[Tuple[str, str]]:
         '''
         Convert a list of (start_offset, end_offset) into Tk Text index spans.
+
+        When the searched text_value is given (starting at first_index in the widget), the spans are
+        converted to absolute 'line.col' indices through a LineOffsetTable; otherwise they fall back
+        to '1.0+Nc' expressions.
         '''
-        return [(cls.offset_to_index(start_off), cls.offset_to_index(end_off)) for (start_off, end_off) in spans]
+        if text_value is None:
+            return [(cls.offset_to_index(start_off), cls.offset_to_index(end_off)) for (start_off, end_off) in spans]
+        first_line, first_col = map(int, str(first_index).split('.'))
+        return LineOffsetTable.from_text(text_value, first_line, first_col).spans_to_indices(spans)
 
     # ---------- tag management ----------
     def configure_tags(self) -> None:
@@ -130,18 +562,36 @@ class SearchService:
         '''
         Remove all highlight tags from the entire buffer.
         '''
+        self.live_highlight = False
+        if self.viewport_highlighter is not None:
+            self.viewport_highlighter.set_source(None)
         try:
             self.app.EgonTE.tag_remove('highlight_all_result', '1.0', 'end')
             self.app.EgonTE.tag_remove('current_match', '1.0', 'end')
         except Exception:
             pass
 
-    def apply_all_highlights(self, index_spans: List[Tuple[str, str]]) -> None:
+    def ensure_viewport_highlighter(self) -> ViewportHighlighter:
+        if self.viewport_highlighter is None:
+            self.viewport_highlighter = ViewportHighlighter(self.app.EgonTE, 'highlight_all_result')
+        return self.viewport_highlighter
+
+    def apply_all_highlights(self, index_spans: List[Tuple[str, str]],
+                             span_source: Optional[Callable[[int, int], List[Tuple[str, str]]]] = None) -> None:
         '''
-        Apply the 'highlight_all_result' tag to all provided index spans.
+        Apply the 'highlight_all_result' tag to the provided index spans: every one of them in 'full'
+        mode, or only those near the visible lines in 'viewport' mode (span_source, when given, is
+        queried per line range instead of the list).
         '''
         self.configure_tags()
         self.clear_all_tags()
+        if self.highlight_mode == 'viewport':
+            highlighter = self.ensure_viewport_highlighter()
+            if span_source is not None:
+                highlighter.set_source(span_source)
+            else:
+                highlighter.set_spans(index_spans)
+            return
         for start_index, end_index in index_spans:
             try:
                 self.app.EgonTE.tag_add('highlight_all_result', start_index, end_index)
@@ -153,6 +603,7 @@ class SearchService:
         Remove any existing 'current_match' tag and apply it to the match at match_index.
         Also moves the cursor and ensures visibility.
         '''
+        self.sync_spans()
         try:
             self.app.EgonTE.tag_remove('current_match', '1.0', 'end')
             if not self.last_index_spans:
@@ -189,15 +640,118 @@ class SearchService:
             pass
         return None
 
+    def edit_revision(self) -> Optional[int]:
+        '''
+        Return the buffer revision from the app's edit tracker (subscribing on first use), or None if
+        edits cannot be tracked and every query has to search from scratch.
+        '''
+        try:
+            self.app._ensure_edit_tracking_service()
+            tracker = getattr(self.app, 'edit_tracking_service', None)
+        except Exception:
+            tracker = None
+        if tracker is None or not tracker.install():
+            return None
+        if not self.tracking_edits:
+            tracker.add_listener(self.on_edit)
+            self.tracking_edits = True
+        return tracker.revision
+
+    def make_match_index(self, needle_text: str, flags_tuple: Tuple[bool, bool, bool]) -> LineMatchIndex:
+        '''
+        Build a LineMatchIndex whose finder uses the same matching rules as find_all_offsets.
+        '''
+        case_sensitive, whole_word, regex = flags_tuple
+
+        def finder(block_text: str) -> List[Tuple[int, int]]:
+            return self.find_all_offsets(block_text, needle_text, case_sensitive=case_sensitive,
+                                         whole_word=whole_word, regex=regex)
+
+        if regex:
+            context_lines = REGEX_CONTEXT_LINES if any(hint in needle_text for hint in MULTILINE_REGEX_HINTS) else 0
+            incremental = not any(hint in needle_text for hint in ANCHORED_REGEX_HINTS)
+        else:
+            context_lines = needle_text.count('\n')
+            incremental = True
+        return LineMatchIndex(finder, context_lines=context_lines, incremental=incremental)
+
+    def read_lines(self, first_line: int, last_line: int) -> str:
+        return self.app.EgonTE.get(f'{first_line}.0', f'{last_line}.end')
+
+    def on_edit(self, edit: Any) -> None:
+        '''
+        EditTrackingService listener: re-search only the dirty lines of the persistent index
+        and re-tag them when highlight-all is showing.
+        '''
+        if self.match_index is None or self.search_in_selection:
+            return
+        dirty_range = self.match_index.apply_edit(edit, self.read_lines)
+        if dirty_range is None:
+            # cannot patch in place (reset / anchored regex): rebuild on the next query
+            self.match_index = None
+            self.indexed_revision = None
+            if self.live_highlight and self.viewport_highlighter is not None:
+                # the lazy tags would be drawn from an index that no longer follows the buffer
+                self.viewport_highlighter.set_source(None)
+                self.live_highlight = False
+            return
+        self.indexed_revision = edit.revision
+        self.spans_stale = True
+        if self.live_highlight and self.highlight_mode == 'viewport' and self.viewport_highlighter is not None:
+            self.viewport_highlighter.invalidate()
+            self.viewport_highlighter.schedule_refresh()
+        elif self.live_highlight:
+            first_line, last_line = dirty_range
+            try:
+                self.app.EgonTE.tag_remove('highlight_all_result', f'{first_line}.0', f'{last_line}.end')
+                for start_index, end_index in self.match_index.spans_in_lines(first_line, last_line):
+                    self.app.EgonTE.tag_add('highlight_all_result', start_index, end_index)
+            except Exception:
+                pass
+
+    def sync_spans(self) -> None:
+        '''
+        Refresh last_index_spans from the index after edits moved or changed matches.
+        '''
+        if self.spans_stale and self.match_index is not None:
+            self.last_index_spans = self.match_index.spans()
+            self.spans_stale = False
+            if self.last_index_spans:
+                self.current_match_index = min(self.current_match_index, len(self.last_index_spans) - 1)
+
     def rebuild_if_needed(self, needle_text: str, flags_tuple: Tuple[bool, bool, bool], in_selection_flag: bool) -> None:
         '''
-        Rebuild internal match cache if haystack, scope, needle or flags have changed.
+        Rebuild internal match cache if scope, needle or flags have changed, or if the buffer changed
+        in a way the persistent index could not follow.
         '''
-        haystack_text = self.get_haystack_text()
-        same_source = (haystack_text == self.haystack_snapshot) and (self.search_in_selection == in_selection_flag)
-        if same_source and needle_text == self.last_needle and flags_tuple == self.last_flags and self.last_index_spans:
+        revision = self.edit_revision()
+        same_query = (needle_text == self.last_needle and flags_tuple == self.last_flags
+                      and self.search_in_selection == in_selection_flag)
+
+        if not in_selection_flag:
+            if same_query and revision is not None and self.match_index is not None and self.indexed_revision == revision:
+                self.sync_spans()
+                return
+            match_index = self.make_match_index(needle_text, flags_tuple)
+            match_index.build(self.get_haystack_text() if needle_text else '')
+            self.match_index = match_index if revision is not None else None
+            self.indexed_revision = revision
+            self.last_needle = needle_text
+            self.last_flags = flags_tuple
+            self.last_index_spans = match_index.spans()
+            self.spans_stale = False
+            self.current_match_index = 0
+            self.search_in_selection = False
             return
 
+        if (same_query and revision is not None and self.indexed_revision == revision
+                and self.last_index_spans is not None):
+            return
+
+        self.match_index = None
+        self.indexed_revision = revision
+        self.search_in_selection = True
+        haystack_text = self.get_haystack_text()
         case_sensitive, whole_word, regex = flags_tuple
         span_offsets = self.find_all_offsets(
             haystack_text,
@@ -207,23 +761,111 @@ class SearchService:
             regex=regex,
         )
 
-        if in_selection_flag and self.selection_bounds:
-            selection_start_abs = self.selection_bounds[0]
-            base_line, base_col = map(int, selection_start_abs.split('.'))
-            absolute_spans: List[Tuple[str, str]] = []
-            for start_off, end_off in span_offsets:
-                absolute_spans.append((f'{base_line}.{base_col}+{start_off}c', f'{base_line}.{base_col}+{end_off}c'))
-            index_spans = absolute_spans
-        else:
-            index_spans = self.offsets_to_indices(span_offsets)
+        first_index = self.selection_bounds[0] if (in_selection_flag and self.selection_bounds) else '1.0'
+        index_spans = self.offsets_to_indices(span_offsets, haystack_text, first_index)
 
         self.last_needle = needle_text
         self.last_flags = flags_tuple
         self.last_index_spans = index_spans
         self.current_match_index = 0
-        self.haystack_snapshot = haystack_text
         self.search_in_selection = in_selection_flag
 
+    # ---------- mapped large-file view ----------
+    def mapped_view(self) -> Any:
+        '''
+        The app's MappedFileService while it shows a file, else None.
+        '''
+        mapped_view = getattr(self.app, 'mapped_file_service', None)
+        if mapped_view is None or not mapped_view.active:
+            return None
+        if self.mapped_source is not mapped_view.mapped:
+            self.cancel_mapped_scan()
+            self.mapped_spans, self.mapped_source = None, None
+        return mapped_view
+
+    def find_mapped(self, mapped_view: Any, needle_text: str, flags_tuple: Tuple[bool, bool, bool],
+                    reveal: bool = True) -> List[Tuple[str, str]]:
+        '''
+        Scan the mapped file on a worker thread (the file can be several GB): the first match is revealed
+        as soon as the after() poll sees it (unless reveal is False), and find_next/find_prev walk the
+        matches found so far. At most max_mapped_matches are kept (the rest are only counted).
+        Returns [] (no Tk span exists yet).
+        '''
+        self.cancel_mapped_scan()
+        job = {'cancel': threading.Event(), 'spans': [], 'count': 0, 'done': False, 'shown': not reveal}
+        self.mapped_job = job
+        self.mapped_spans = job['spans']
+        self.mapped_source = mapped_view.mapped
+        self.last_needle, self.last_flags = needle_text, flags_tuple
+        self.last_index_spans = None
+        self.current_match_index = 0
+        threading.Thread(target=self.scan_mapped, args=(job, mapped_view.mapped.mapping, needle_text, flags_tuple),
+                         daemon=True).start()
+        self.app.after(self.mapped_poll_ms, self.poll_mapped_scan, job)
+        return []
+
+    def scan_mapped(self, job: dict, buffer: Any, needle_text: str, flags_tuple: Tuple[bool, bool, bool]) -> None:
+        case_sensitive, whole_word, regex = flags_tuple
+        try:
+            for span in self.iter_mapped_offsets(buffer, needle_text, case_sensitive=case_sensitive,
+                                                 whole_word=whole_word, regex=regex, cancel_event=job['cancel']):
+                if job['count'] < self.max_mapped_matches:
+                    job['spans'].append(span)
+                job['count'] += 1
+        except Exception:
+            # e.g. the view closed its mapping meanwhile
+            pass
+        finally:
+            job['done'] = True
+
+    def poll_mapped_scan(self, job: dict) -> None:
+        if job is not self.mapped_job or job['cancel'].is_set():
+            return
+        if not job['shown'] and job['spans'] and self.mapped_view() is not None:
+            job['shown'] = True
+            self.mark_mapped(0)
+        if not job['done']:
+            self.app.after(self.mapped_poll_ms, self.poll_mapped_scan, job)
+
+    def mapped_progress(self) -> Tuple[int, bool]:
+        '''
+        (matches found so far, whether the scan is over) for the last find/count in the mapped view.
+        '''
+        if self.mapped_job is None:
+            return len(self.mapped_spans or []), True
+        return self.mapped_job['count'], self.mapped_job['done']
+
+    def cancel_mapped_scan(self) -> None:
+        if self.mapped_job is not None:
+            self.mapped_job['cancel'].set()
+            self.mapped_job = None
+
+    def step_mapped(self, step: int, wrap: bool) -> Optional[Tuple[str, str]]:
+        if not self.mapped_spans:
+            return None
+        next_index = self.current_match_index + step
+        if not 0 <= next_index < len(self.mapped_spans):
+            # matches found so far only: wrapping waits for the end of the scan
+            if not wrap or (self.mapped_job is not None and not self.mapped_job['done']):
+                return None
+            next_index %= len(self.mapped_spans)
+        self.current_match_index = next_index
+        return self.mark_mapped(next_index)
+
+    def mark_mapped(self, match_index: int) -> Tuple[str, str]:
+        '''
+        Render the mapped match at match_index and tag it as the current match.
+        '''
+        start_index, end_index = self.mapped_view().reveal(*self.mapped_spans[match_index])
+        self.configure_tags()
+        try:
+            self.app.EgonTE.tag_remove('current_match', '1.0', 'end')
+            self.app.EgonTE.tag_add('current_match', start_index, end_index)
+            self.app.EgonTE.mark_set('insert', end_index)
+        except Exception:
+            pass
+        return start_index, end_index
+
     # ---------- public API ----------
     def find_text(
         self,
@@ -239,13 +881,22 @@ class SearchService:
         Find all matches and optionally highlight them.
 
         Returns:
-            A copy of the list of Tk index spans for each match.
+            A copy of the list of Tk index spans for each match (in the mapped large-file view, an empty
+            list: the scan runs on a worker, reveals the first match when found and keeps the byte spans
+            in mapped_spans).
         '''
+        mapped_view = self.mapped_view()
+        if mapped_view is not None:
+            return self.find_mapped(mapped_view, needle_text, (case_sensitive, whole_word, regex))
+
         self.selection_bounds = self.get_selection_bounds_or_none() if in_selection else None
 
         self.rebuild_if_needed(needle_text, (case_sensitive, whole_word, regex), in_selection)
         if highlight:
-            self.apply_all_highlights(self.last_index_spans or [])
+            self.apply_all_highlights(self.last_index_spans or [],
+                                      self.match_index.spans_in_lines if self.match_index is not None else None)
+            # keep the tags of edited lines current while the index is live
+            self.live_highlight = self.match_index is not None
             if self.last_index_spans:
                 self.mark_current(0)
         return list(self.last_index_spans or [])
@@ -254,6 +905,9 @@ class SearchService:
         '''
         Move to the next match and return its index span. If wrap is False, stop at the last match.
         '''
+        if self.mapped_view() is not None and self.mapped_spans is not None:
+            return self.step_mapped(1, wrap)
+        self.sync_spans()
         if not self.last_index_spans:
             return None
         self.current_match_index += 1
@@ -270,6 +924,9 @@ class SearchService:
         '''
         Move to the previous match and return its index span. If wrap is False, stop at the first match.
         '''
+        if self.mapped_view() is not None and self.mapped_spans is not None:
+            return self.step_mapped(-1, wrap)
+        self.sync_spans()
         if not self.last_index_spans:
             return None
         self.current_match_index -= 1
@@ -302,6 +959,9 @@ class SearchService:
         Returns:
             Number of replacements performed.
         '''
+        if self.mapped_view() is not None:
+            # the mapped large-file view is read-only
+            return 0
         self.selection_bounds = self.get_selection_bounds_or_none() if in_selection else None
         haystack_text = self.get_haystack_text()
         span_offsets = self.find_all_offsets(
@@ -345,8 +1005,9 @@ class SearchService:
         except Exception:
             return 0
 
+        self.match_index = None
+        self.indexed_revision = None
         if not replace_all:
-            self.haystack_snapshot = None
             self.find_text(
                 needle_text,
                 case_sensitive=case_sensitive,
@@ -359,7 +1020,6 @@ class SearchService:
             self.clear_all_tags()
             self.last_index_spans = []
             self.current_match_index = 0
-            self.haystack_snapshot = self.get_haystack_text()
 
         return replaced_count
 
@@ -383,7 +1043,17 @@ class SearchService:
     def count(self, needle_text: str, *, case_sensitive: bool = False, whole_word: bool = False, regex: bool = False) -> int:
         '''
         Return the number of matches of needle_text in the current scope.
+
+        In the mapped large-file view the count comes from the worker scan of find_text (started here
+        unless one for the same needle and flags exists) and is the number found so far; mapped_progress
+        reports it as the scan goes on.
         '''
+        mapped_view = self.mapped_view()
+        if mapped_view is not None:
+            flags_tuple = (case_sensitive, whole_word, regex)
+            if self.mapped_spans is None or (self.last_needle, self.last_flags) != (needle_text, flags_tuple):
+                self.find_mapped(mapped_view, needle_text, flags_tuple, reveal=False)
+            return self.mapped_progress()[0]
         self.selection_bounds = None
         haystack_text = self.get_haystack_text()
         return len(self.find_all_offsets(haystack_text, needle_text, case_sensitive=case_sensitive, whole_word=whole_word, regex=regex))
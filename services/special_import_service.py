@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    from dependencies.lazy_imports import lazy_import, lazy_from
+except Exception:
+    from lazy_imports import lazy_import, lazy_from  # type: ignore
+
+try:
+    from dependencies.universal_functions import get_time  # type: ignore
+except Exception:
+    from datetime import datetime as _dt
+
+    def get_time() -> str:
+        return _dt.now().strftime('%Y-%m-%d %H:%M:%S')
+
+pandas = lazy_import('pandas')
+PdfReader = lazy_from('PyPDF2', 'PdfReader')
+
+IMPORT_KINDS = ('xml', 'csv', 'json', 'xlsx', 'pdf')
+IMPORT_MARK = 'special_import'
+URL_SCHEMES = ('http', 'https', 'ftp', 'file', 's3')
+
+
+def extract_pdf_pages(path: str, first_page: int, last_page: int) -> str:
+    '''
+    Text of pages [first_page, last_page) – runs in a pool process, so it opens its own reader.
+    '''
+    from PyPDF2 import PdfReader as _PdfReader
+    reader = _PdfReader(path)
+    return ''.join((reader.pages[page_number].extract_text() or '') for page_number in range(first_page, last_page))
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+@dataclass
+class SpecialImportService:
+    '''
+    Import pipeline for 'import local/global file' (xml, csv, json, xlsx, pdf).
+
+    A producer thread turns the source into text chunks: PDF pages are extracted in a process pool
+    (pdf_pages_per_task pages per task, results kept in page order), CSV is read with chunksize and
+    local XLSX row by row in read-only mode, and tables are formatted table_chunk_rows rows at a time
+    (column widths are per chunk; only the first chunk has a header). The Tk thread inserts the chunks
+    at the cursor in short after() batches, with progress in the file bar; clicking it or Escape cancels
+    and keeps what was imported so far.
+    '''
+    app: Any  # expects .EgonTE, .file_bar, .record_list, .after
+
+    table_chunk_rows: int = 5000
+    pdf_pages_per_task: int = 8
+    pdf_workers: Optional[int] = None
+    queue_chunks: int = 8
+    batch_ms: int = 30
+
+    job: Optional[dict] = None
+
+    @staticmethod
+    def kind_of(source: str) -> str:
+        extension = os.path.splitext(source.split('?')[0])[1][1:].lower()
+        return extension if extension in IMPORT_KINDS else ''
+
+    @staticmethod
+    def is_url(source: str) -> bool:
+        return urlparse(source).scheme.lower() in URL_SCHEMES
+
+    # ---------- Tk side ----------
+    def start(self, source: str, via: str = 'file') -> bool:
+        '''
+        Start importing source at the cursor; False if its type is not supported.
+        '''
+        kind = self.kind_of(source)
+        if not kind:
+            return False
+        self.cancel()
+        editor = self.app.EgonTE
+        editor.mark_set(IMPORT_MARK, editor.index('insert'))
+        editor.mark_gravity(IMPORT_MARK, 'right')
+        editor.edit_separator()
+        job = {
+            'source': source,
+            'kind': kind,
+            'via': via,
+            'cancel': threading.Event(),
+            'chunks': queue.Queue(maxsize=self.queue_chunks),
+            'progress': '',
+            'bindings': [],
+        }
+        self.job = job
+        try:
+            job['bindings'].append((self.app.file_bar, '<Button-1>', self.app.file_bar.bind('<Button-1>', lambda event: self.cancel())))
+            job['bindings'].append((editor, '<Escape>', editor.bind('<Escape>', lambda event: self.cancel(), add='+')))
+        except Exception:
+            pass
+        self.show_progress(job)
+        threading.Thread(target=self.produce, args=(job,), daemon=True).start()
+        self.app.after(1, self.poll, job)
+        return True
+
+    def poll(self, job: dict) -> None:
+        if job is not self.job:
+            return
+        editor = self.app.EgonTE
+        deadline = time.perf_counter() + self.batch_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                message = job['chunks'].get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == 'chunk':
+                try:
+                    editor.insert(IMPORT_MARK, message[1])
+                except Exception:
+                    self.finish(job, 'failed')
+                    return
+                job['progress'] = message[2]
+            elif message[0] == 'error':
+                self.finish(job, 'failed')
+                self.show_error(message[1])
+                return
+            else:
+                self.finish(job, 'imported')
+                return
+        self.show_progress(job)
+        self.app.after(1, self.poll, job)
+
+    def show_progress(self, job: dict) -> None:
+        progress = f': {job["progress"]}' if job['progress'] else ''
+        self.set_file_bar(f'Importing {os.path.basename(job["source"])}{progress} (click or Esc to cancel)')
+
+    def set_file_bar(self, text_value: str) -> None:
+        try:
+            self.app.file_bar.config(text=text_value)
+        except Exception:
+            pass
+
+    def show_error(self, message_text: str) -> None:
+        try:
+            from tkinter import messagebox
+            messagebox.showerror(f'{getattr(self.app, "title_struct", "")}error', message_text)
+        except Exception:
+            pass
+
+    def cancel(self) -> None:
+        if self.job is not None:
+            self.finish(self.job, 'cancelled')
+
+    def finish(self, job: dict, outcome: str) -> None:
+        job['cancel'].set()
+        if self.job is job:
+            self.job = None
+        editor = self.app.EgonTE
+        for widget, sequence, function_id in job['bindings']:
+            try:
+                widget.unbind(sequence, function_id)
+            except Exception:
+                pass
+        try:
+            editor.mark_unset(IMPORT_MARK)
+            editor.edit_separator()
+        except Exception:
+            pass
+        starts, ends = os.path.splitext(job['source'])
+        self.set_file_bar(f'Import {outcome}: {os.path.basename(job["source"])}')
+        if outcome == 'imported':
+            self.app.record_list.append(f'> [{get_time()}] - Special file ({ends[1:]}) imported;\n  the files name is'
+                                        f' {starts}\n   and the file was imported via {job["via"]}')
+        else:
+            self.app.record_list.append(f'> [{get_time()}] - Special file import {outcome}: {job["source"]}'
+                                        f' ({job["progress"] or "nothing imported"})')
+
+    # ---------- producer thread ----------
+    def produce(self, job: dict) -> None:
+        def post(message: tuple) -> bool:
+            while not job['cancel'].is_set():
+                try:
+                    job['chunks'].put(message, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for text_chunk, progress in self.iter_chunks(job):
+                if not post(('chunk', text_chunk, progress)):
+                    return
+            post(('done',))
+        except ImportCancelled:
+            return
+        except Exception as import_error:
+            post(('error', f'Could not import the file:\n{import_error}'))
+
+    def iter_chunks(self, job: dict) -> Iterator[Tuple[str, str]]:
+        source, kind = job['source'], job['kind']
+        if kind == 'pdf':
+            yield from self.iter_pdf(source, job['cancel'])
+            return
+        if kind == 'csv':
+            frames = pandas.read_csv(source, chunksize=self.table_chunk_rows)
+        elif kind == 'xlsx' and not self.is_url(source):
+            frames = self.iter_xlsx_frames(source)
+        else:
+            # openpyxl only opens paths and file objects: a linked workbook is read whole by pandas
+            readers = {'xml': pandas.read_xml, 'json': pandas.read_json, 'xlsx': pandas.read_excel}
+            whole_frame = readers[kind](source)
+            frames = (whole_frame.iloc[row:row + self.table_chunk_rows]
+                      for row in range(0, max(len(whole_frame), 1), self.table_chunk_rows))
+        yield from self.format_frames(frames, job['cancel'])
+
+    def format_frames(self, frames: Iterator[Any], cancel_event: threading.Event) -> Iterator[Tuple[str, str]]:
+        rows_done = 0
+        for frame in frames:
+            if cancel_event.is_set():
+                raise ImportCancelled()
+            text_chunk = frame.to_string(header=rows_done == 0)
+            yield ('\n' if rows_done else '') + text_chunk, f'{rows_done + len(frame)} rows'
+            rows_done += max(len(frame), 1)
+
+    def iter_xlsx_frames(self, source: str) -> Iterator[Any]:
+        '''
+        First sheet as DataFrames of table_chunk_rows rows (read_excel has no chunksize).
+        '''
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            yield pandas.read_excel(source)
+            return
+        workbook = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [name if name is not None else f'Unnamed: {position}' for position, name in enumerate(header)]
+            batch, first_row = [], 0
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.table_chunk_rows:
+                    yield pandas.DataFrame(batch, columns=columns, index=range(first_row, first_row + len(batch)))
+                    first_row += len(batch)
+                    batch = []
+            if batch or not first_row:
+                yield pandas.DataFrame(batch, columns=columns, index=range(first_row, first_row + len(batch)))
+        finally:
+            workbook.close()
+
+    def iter_pdf(self, source: str, cancel_event: threading.Event) -> Iterator[Tuple[str, str]]:
+        page_count = len(PdfReader(source).pages)
+        page_ranges = [(first, min(first + self.pdf_pages_per_task, page_count))
+                       for first in range(0, page_count, self.pdf_pages_per_task)]
+        try:
+            pool = ProcessPoolExecutor(max_workers=self.pdf_workers)
+        except (OSError, NotImplementedError):
+            pool = None
+        if pool is None:
+            # no process pool on this platform: extract on this thread
+            for first, last in page_ranges:
+                if cancel_event.is_set():
+                    raise ImportCancelled()
+                yield extract_pdf_pages(source, first, last), f'page {last}/{page_count}'
+            return
+        try:
+            futures = [pool.submit(extract_pdf_pages, source, first, last) for first, last in page_ranges]
+            for (first, last), future in zip(page_ranges, futures):
+                while True:
+                    if cancel_event.is_set():
+                        raise ImportCancelled()
+                    try:
+                        text_chunk = future.result(timeout=0.2)
+                        break
+                    except FutureTimeoutError:
+                        continue
+                yield text_chunk, f'page {last}/{page_count}'
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from heapq import nlargest
+from string import ascii_lowercase, punctuation
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from services.edit_tracking_service import EditTrackingService, TextEdit
+except Exception:
+    from edit_tracking_service import EditTrackingService, TextEdit  # type: ignore
+
+try:
+    from services.token_index_service import TokenIndexService
+except Exception:
+    from token_index_service import TokenIndexService  # type: ignore
+
+# what the content stats count as symbols: punctuation and whitespace other than spaces and newlines
+SYMBOL_CHARACTERS = frozenset(punctuation + '\t\r\x0b\x0c')
+NUMBER_PATTERN = re.compile(r'\d+')
+
+
+@dataclass
+class StatsService:
+    '''
+    Incremental line/character/word counters for the status bar.
+
+    The counts are built once from the buffer, then kept up to date from the
+    EditTrackingService deltas: every edit only re-splits the lines it touched,
+    so a keystroke costs O(edit size) instead of O(document size).
+    The status bar itself is refreshed through a short debounce.
+    '''
+    app: Any  # expects .EgonTE, ._ensure_edit_tracking_service() and .update_status_bar(lines, characters, words)
+
+    lines: int = 1
+    characters: int = 0
+    words: int = 0
+    ready: bool = False
+    refresh_delay_ms: int = 120
+    pending_refresh: Optional[str] = None
+    tracker: Optional[EditTrackingService] = None
+
+    # ---------- lifecycle ----------
+    def attach(self) -> bool:
+        '''
+        Subscribe to the edit tracker and build the initial counts. Returns False if tracking is unavailable.
+        '''
+        if self.ready:
+            return True
+        try:
+            self.app._ensure_edit_tracking_service()
+            tracker = getattr(self.app, 'edit_tracking_service', None)
+        except Exception:
+            tracker = None
+        if tracker is None or not tracker.install():
+            return False
+        self.tracker = tracker
+        tracker.add_listener(self.on_edit)
+        self.rebuild()
+        return True
+
+    def rebuild(self) -> None:
+        '''
+        Full recount from the widget (used once on attach and after a tracker reset).
+        '''
+        try:
+            content = self.app.EgonTE.get('1.0', 'end-1c')
+        except Exception:
+            content = ''
+        self.lines = content.count('\n') + 1
+        self.characters = len(content)
+        self.words = len(content.split())
+        self.ready = True
+
+    # ---------- deltas ----------
+    def on_edit(self, edit: TextEdit) -> None:
+        if edit.kind == 'reset':
+            self.rebuild()
+        else:
+            self.lines += edit.line_delta
+            self.characters += edit.char_delta
+            # words never span a newline, so the touched lines are all that need re-splitting
+            self.words += len(edit.new_block.split()) - len(edit.old_block.split())
+        self.schedule_refresh()
+
+    # ---------- UI ----------
+    def schedule_refresh(self) -> None:
+        '''
+        Coalesce bursts of edits (typing, paste, replace all) into one status bar update.
+        '''
+        if self.pending_refresh is not None:
+            return
+        try:
+            self.pending_refresh = self.app.after(self.refresh_delay_ms, self.refresh)
+        except Exception:
+            self.refresh()
+
+    def refresh(self) -> None:
+        self.pending_refresh = None
+        try:
+            self.app.update_status_bar(self.lines, self.characters, self.words)
+        except Exception:
+            pass
+
+
+@dataclass
+class ContentStats:
+    '''
+    Figures for the content stats window, computed from one text snapshot without touching Tk,
+    so the work can run on a worker thread before the figures are drawn.
+
+    Character classes come from a single Counter pass over the text; word frequencies come from the
+    TokenIndexService (top_words/different_words are passed in when the index is current, otherwise
+    the snapshot is tokenized here and the counters are kept for the index to adopt).
+    '''
+    characters: int = 0
+    lines: int = 1
+    words: int = 0
+    alphabet: int = 0
+    numbers: int = 0
+    symbols: int = 0
+    different_characters: int = 0
+    different_words: int = 0
+    paragraphs: int = 0
+    letter_counts: Dict[str, int] = field(default_factory=dict)
+    top_words: List[Tuple[str, int]] = field(default_factory=list)
+    token_counters: Optional[Tuple[Counter, Counter]] = None
+
+    @classmethod
+    def from_text(cls, content: str, top_words: Optional[List[Tuple[str, int]]] = None,
+                  different_words: Optional[int] = None, top_amount: int = 8) -> 'ContentStats':
+        char_counts = Counter(content)
+        stats = cls(
+            characters=len(content),
+            lines=char_counts['\n'] + 1,
+            words=len(content.split()),
+            alphabet=sum(amount for character, amount in char_counts.items() if character.isalpha()),
+            numbers=len(NUMBER_PATTERN.findall(content)),
+            symbols=sum(char_counts[character] for character in SYMBOL_CHARACTERS),
+            different_characters=len(set(''.join(char_counts).lower())),
+            paragraphs=cls.count_paragraphs(content),
+            letter_counts={letter: char_counts[letter] + char_counts[letter.upper()] for letter in ascii_lowercase},
+        )
+        if top_words is None or different_words is None:
+            stats.token_counters = TokenIndexService.count_tokens(content)
+            counts, folded_counts = stats.token_counters
+            top_words = cls.top_words_of(counts, top_amount)
+            different_words = len(folded_counts)
+        stats.top_words = top_words
+        stats.different_words = different_words
+        return stats
+
+    @staticmethod
+    def top_words_of(token_counts: Counter, amount: int = 8) -> List[Tuple[str, int]]:
+        return nlargest(amount, ((word, count) for word, count in token_counts.items() if not word.isdigit()),
+                        key=lambda item: item[1])
+
+    @staticmethod
+    def count_paragraphs(content: str) -> int:
+        '''
+        A paragraph is a run of non-blank lines.
+        '''
+        paragraphs = 0
+        in_paragraph = False
+        for line_text in content.split('\n'):
+            if line_text.strip():
+                if not in_paragraph:
+                    paragraphs += 1
+                in_paragraph = True
+            else:
+                in_paragraph = False
+        return paragraphs
+
+    # ---------- ratios ----------
+    @property
+    def words_per_lines(self) -> float:
+        return round(self.words / self.lines, 2) if self.lines else 0
+
+    @property
+    def characters_per_words(self) -> float:
+        return round(self.alphabet / self.words, 2) if self.words else 0
+
+    @property
+    def lines_per_paragraphs(self) -> float:
+        return round(self.lines / self.paragraphs, 2) if self.paragraphs else 0
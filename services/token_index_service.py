@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+try:
+    from services.edit_tracking_service import EditTrackingService, TextEdit
+except Exception:
+    from edit_tracking_service import EditTrackingService, TextEdit  # type: ignore
+
+# a token is a run of word characters; it never crosses a newline, so edits only touch their own lines
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+@dataclass
+class TokenIndexService:
+    '''
+    Word-frequency index of the main document, shared by the find/replace popular terms and
+    content stats.
+
+    The index is keyed by the EditTrackingService revision: it is built once (or adopted from a
+    background count of a snapshot) and then kept current from the edit deltas by re-counting only
+    the lines each edit touched.
+    '''
+    app: Any  # expects .EgonTE and ._ensure_edit_tracking_service()
+
+    counts: Counter = field(default_factory=Counter)
+    folded_counts: Counter = field(default_factory=Counter)
+    indexed_revision: Optional[int] = None
+    ready: bool = False
+    tracker: Optional[EditTrackingService] = None
+
+    # ---------- counting ----------
+    @staticmethod
+    def count_tokens(text_value: str) -> Tuple[Counter, Counter]:
+        '''
+        Return (case-sensitive, lower-cased) token counters of text_value. Pure; safe on a worker thread.
+        '''
+        counts = Counter(TOKEN_PATTERN.findall(text_value or ''))
+        folded_counts: Counter = Counter()
+        for token, occurrences in counts.items():
+            folded_counts[token.lower()] += occurrences
+        return counts, folded_counts
+
+    # ---------- lifecycle ----------
+    def attach(self) -> bool:
+        '''
+        Subscribe to the edit tracker. Returns False if edits cannot be tracked.
+        '''
+        if self.tracker is not None:
+            return True
+        try:
+            self.app._ensure_edit_tracking_service()
+            tracker = getattr(self.app, 'edit_tracking_service', None)
+        except Exception:
+            tracker = None
+        if tracker is None or not tracker.install():
+            return False
+        self.tracker = tracker
+        tracker.add_listener(self.on_edit)
+        return True
+
+    def current_revision(self) -> Optional[int]:
+        return self.tracker.revision if self.attach() else None
+
+    def is_current(self) -> bool:
+        revision = self.current_revision()
+        return self.ready and revision is not None and self.indexed_revision == revision
+
+    def snapshot(self) -> Tuple[str, Optional[int]]:
+        '''
+        Document text and its revision, for counting on a worker and adopting the result later.
+        '''
+        revision = self.current_revision()
+        try:
+            return self.app.EgonTE.get('1.0', 'end-1c'), revision
+        except Exception:
+            return '', revision
+
+    def adopt(self, counts: Counter, folded_counts: Counter, revision: Optional[int]) -> bool:
+        '''
+        Install counters computed from snapshot(); refused if the buffer changed meanwhile.
+        '''
+        if revision is None or revision != self.current_revision():
+            return False
+        self.counts, self.folded_counts = counts, folded_counts
+        self.indexed_revision = revision
+        self.ready = True
+        return True
+
+    def ensure_current(self) -> bool:
+        '''
+        Build the index on the calling (Tk) thread if it is missing or outdated.
+        Returns False when edits are untracked and the counts only reflect this moment.
+        '''
+        if self.is_current():
+            return True
+        text_value, revision = self.snapshot()
+        self.counts, self.folded_counts = self.count_tokens(text_value)
+        self.indexed_revision = revision
+        self.ready = True
+        return revision is not None
+
+    # ---------- deltas ----------
+    def on_edit(self, edit: TextEdit) -> None:
+        if not self.ready:
+            return
+        if edit.kind == 'reset' or self.indexed_revision != edit.revision - 1:
+            # missed or undescribed change: rebuild on the next query
+            self.ready = False
+            return
+        self.apply_block(edit.old_block, -1)
+        self.apply_block(edit.new_block, 1)
+        self.indexed_revision = edit.revision
+
+    def apply_block(self, block_text: str, sign: int) -> None:
+        for token in TOKEN_PATTERN.findall(block_text):
+            for counter, key in ((self.counts, token), (self.folded_counts, token.lower())):
+                remaining = counter[key] + sign
+                if remaining > 0:
+                    counter[key] = remaining
+                else:
+                    del counter[key]
+
+    # ---------- queries ----------
+    def frequencies(self, case_sensitive: bool = False) -> Counter:
+        self.ensure_current()
+        return self.counts if case_sensitive else self.folded_counts
+
+    def most_common(self, amount: int, case_sensitive: bool = False) -> List[Tuple[str, int]]:
+        return self.frequencies(case_sensitive).most_common(amount)
+
+    def unique_count(self, case_sensitive: bool = False) -> int:
+        return len(self.frequencies(case_sensitive))